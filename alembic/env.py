@@ -14,7 +14,7 @@ from app.config import settings
 from app.database import Base
 
 # Import all models so they register with Base.metadata
-import app.models  # noqa: F401
+import app.models.all  # noqa: F401
 
 # Alembic Config object
 config = context.config
@@ -0,0 +1,90 @@
+"""convert the core timeseries tables to TimescaleDB hypertables
+
+price_data, ta_indicators, sentiment_data, political_news and
+political_signal are append-mostly and every primary key leads with or
+includes timestamp. When the timescaledb extension is installed they
+become hypertables with 7-day chunks, and price_data chunks older than
+30 days are compressed, segmented by symbol/exchange/timeframe. Without
+the extension this is a no-op.
+
+Revision ID: a3b4c5d6e7f8
+Revises: f2a3b4c5d6e7
+Create Date: 2026-10-16 14:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3b4c5d6e7f8'
+down_revision: Union[str, Sequence[str], None] = 'f2a3b4c5d6e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = [
+    "price_data",
+    "ta_indicators",
+    "sentiment_data",
+    "political_news",
+    "political_signal",
+]
+
+_HYPERTABLE = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') THEN
+        PERFORM create_hypertable(
+            '{table}', 'timestamp',
+            chunk_time_interval => INTERVAL '7 days',
+            migrate_data => true,
+            if_not_exists => true
+        );
+    END IF;
+END $$;"""
+
+# Compression settings can't be changed once chunks are compressed, so
+# only enable them the first time.
+_COMPRESS_PRICE_DATA = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') THEN
+        IF NOT EXISTS (
+            SELECT 1 FROM timescaledb_information.hypertables
+            WHERE hypertable_name = 'price_data' AND compression_enabled
+        ) THEN
+            ALTER TABLE price_data SET (
+                timescaledb.compress,
+                timescaledb.compress_segmentby = 'symbol, exchange, timeframe',
+                timescaledb.compress_orderby = 'timestamp DESC'
+            );
+        END IF;
+        PERFORM add_compression_policy('price_data', INTERVAL '30 days', if_not_exists => true);
+    END IF;
+END $$;"""
+
+_REMOVE_COMPRESSION_POLICY = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') THEN
+        PERFORM remove_compression_policy('price_data', if_exists => true);
+    END IF;
+END $$;"""
+
+
+def upgrade() -> None:
+    """Make the core timeseries tables hypertables and compress old candles."""
+    op.execute(sa.text("\n".join(_HYPERTABLE.format(table=t) for t in TABLES)))
+    op.execute(sa.text(_COMPRESS_PRICE_DATA))
+
+
+def downgrade() -> None:
+    """Stop compressing new price_data chunks.
+
+    The hypertables (and any already-compressed chunks, which stay
+    queryable) are kept: Timescale has no in-place hypertable -> plain
+    table conversion, and the earlier revisions work against them unchanged.
+    """
+    op.execute(sa.text(_REMOVE_COMPRESSION_POLICY))
@@ -0,0 +1,32 @@
+"""drop redundant timestamp indexes on xai timeseries tables
+
+xai_onchain_metrics and xai_composite are keyed on timestamp, so the
+primary key already provides a btree on that column.
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7b8c9d0e1f2'
+down_revision: Union[str, Sequence[str], None] = 'f6a7b8c9d0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop idx_xai_onchain_ts / idx_xai_composite_ts if present."""
+    op.execute("DROP INDEX IF EXISTS idx_xai_onchain_ts")
+    op.execute("DROP INDEX IF EXISTS idx_xai_composite_ts")
+
+
+def downgrade() -> None:
+    """Recreate the timestamp indexes."""
+    op.create_index('idx_xai_composite_ts', 'xai_composite', ['timestamp'], unique=False, if_not_exists=True)
+    op.create_index('idx_xai_onchain_ts', 'xai_onchain_metrics', ['timestamp'], unique=False, if_not_exists=True)
@@ -0,0 +1,39 @@
+"""add (status, created_at) and (symbol, status, created_at) indexes on alerts
+
+GET /api/alerts filters on status (and optionally symbol) and returns the
+newest N by created_at. alerts had no secondary indexes, so every call
+sorted the whole filtered set. With these the planner walks the matching
+index backwards and stops after LIMIT rows.
+
+Revision ID: a9b0c1d2e3f4
+Revises: f8a9b0c1d2e3
+Create Date: 2026-10-16 17:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9b0c1d2e3f4'
+down_revision: Union[str, Sequence[str], None] = 'f8a9b0c1d2e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ALERT_INDEXES = [
+    ("idx_alerts_status_created", ["status", "created_at"]),
+    ("idx_alerts_symbol_status_created", ["symbol", "status", "created_at"]),
+]
+
+
+def upgrade() -> None:
+    """Create the alert listing indexes."""
+    for name, columns in ALERT_INDEXES:
+        op.create_index(name, "alerts", columns, unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Drop the alert listing indexes."""
+    for name, _ in ALERT_INDEXES:
+        op.drop_index(name, table_name="alerts", if_exists=True)
@@ -0,0 +1,59 @@
+"""reorder closed price_data chunks by (symbol, timeframe, timestamp)
+
+Candles arrive interleaved across symbols and timeframes, so a replay of
+one symbol's range reads rows scattered over every page of a chunk. With
+timescaledb installed, a reorder policy rewrites each chunk once it stops
+receiving inserts, in idx_price_symbol_tf_time order, so those reads
+become sequential until the chunk is compressed at 30 days (compression
+already segments by symbol/exchange/timeframe). Without the extension
+this is a no-op.
+
+Revision ID: b0c1d2e3f4a5
+Revises: a9b0c1d2e3f4
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b0c1d2e3f4a5'
+down_revision: Union[str, Sequence[str], None] = 'a9b0c1d2e3f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_ADD_REORDER = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') THEN
+        IF EXISTS (
+            SELECT 1 FROM timescaledb_information.hypertables
+            WHERE hypertable_name = 'price_data'
+        ) THEN
+            PERFORM add_reorder_policy(
+                'price_data', 'idx_price_symbol_tf_time', if_not_exists => true
+            );
+        END IF;
+    END IF;
+END $$;"""
+
+_REMOVE_REORDER = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') THEN
+        PERFORM remove_reorder_policy('price_data', if_exists => true);
+    END IF;
+END $$;"""
+
+
+def upgrade() -> None:
+    """Add a reorder policy on the price_data hypertable."""
+    op.execute(sa.text(_ADD_REORDER))
+
+
+def downgrade() -> None:
+    """Remove the reorder policy (already-reordered chunks stay ordered)."""
+    op.execute(sa.text(_REMOVE_REORDER))
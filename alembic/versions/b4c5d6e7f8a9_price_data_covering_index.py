@@ -0,0 +1,50 @@
+"""replace idx_price_symbol_time with a (symbol, timeframe, timestamp) covering index
+
+Every price_data read filters on symbol and timeframe and orders by
+timestamp, but idx_price_symbol_time skips timeframe, so each lookup
+walks the 1h/4h/1d rows for the symbol and filters them in the heap.
+The replacement leads with (symbol, timeframe, timestamp) and INCLUDEs
+the OHLCV columns, so candle-range reads can be index-only scans.
+
+Revision ID: b4c5d6e7f8a9
+Revises: a3b4c5d6e7f8
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4c5d6e7f8a9'
+down_revision: Union[str, Sequence[str], None] = 'a3b4c5d6e7f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OHLCV = ["open", "high", "low", "close", "volume"]
+
+
+def upgrade() -> None:
+    """Create the covering index, then drop the symbol-only one it replaces."""
+    op.create_index(
+        "idx_price_symbol_tf_time",
+        "price_data",
+        ["symbol", "timeframe", "timestamp"],
+        unique=False,
+        postgresql_include=OHLCV,
+        if_not_exists=True,
+    )
+    op.drop_index("idx_price_symbol_time", table_name="price_data", if_exists=True)
+
+
+def downgrade() -> None:
+    """Restore idx_price_symbol_time; drop the covering index."""
+    op.create_index(
+        "idx_price_symbol_time",
+        "price_data",
+        ["symbol", "timestamp"],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.drop_index("idx_price_symbol_tf_time", table_name="price_data", if_exists=True)
@@ -0,0 +1,52 @@
+"""convert xai timeseries tables to TimescaleDB hypertables
+
+xai_onchain_metrics and xai_composite are append-only and keyed on
+timestamp. When the timescaledb extension is installed, turn them into
+hypertables with 7-day chunks so each chunk's index stays small and
+retention becomes a chunk drop. Without the extension this is a no-op.
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-16 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8c9d0e1f2a3'
+down_revision: Union[str, Sequence[str], None] = 'a7b8c9d0e1f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ["xai_onchain_metrics", "xai_composite"]
+
+_HYPERTABLE = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') THEN
+        PERFORM create_hypertable(
+            '{table}', 'timestamp',
+            chunk_time_interval => INTERVAL '7 days',
+            migrate_data => true,
+            if_not_exists => true
+        );
+    END IF;
+END $$;"""
+
+
+def upgrade() -> None:
+    """Make the XAI timeseries tables hypertables when Timescale is available."""
+    op.execute(sa.text("\n".join(_HYPERTABLE.format(table=t) for t in TABLES)))
+
+
+def downgrade() -> None:
+    """No-op: Timescale has no in-place hypertable -> plain table conversion.
+
+    The hypertables keep the same columns and primary key, so the earlier
+    revisions work against them unchanged.
+    """
+    pass
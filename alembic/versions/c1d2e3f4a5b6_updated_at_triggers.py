@@ -0,0 +1,55 @@
+"""maintain updated_at with a BEFORE UPDATE trigger
+
+signal_weights, political_calendar and xai_partnerships stamped
+updated_at through the ORM's onupdate, which only fires for ORM/Core
+UPDATEs that don't set the column themselves: ON CONFLICT DO UPDATE
+upserts and manual SQL left it stale, and every ORM UPDATE carried an
+extra SET clause. A shared set_updated_at() trigger covers every write
+path and the models now treat the column as server-generated.
+
+Revision ID: c1d2e3f4a5b6
+Revises: b0c1d2e3f4a5
+Create Date: 2026-10-16 18:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c1d2e3f4a5b6'
+down_revision: Union[str, Sequence[str], None] = 'b0c1d2e3f4a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UPDATED_AT_TABLES = ["signal_weights", "political_calendar", "xai_partnerships"]
+
+_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;"""
+
+_TRIGGER = """
+DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table};
+CREATE TRIGGER trg_{table}_updated_at
+    BEFORE UPDATE ON {table}
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();"""
+
+
+def upgrade() -> None:
+    """Install set_updated_at() and attach it to each updated_at table."""
+    op.execute(sa.text(
+        _FUNCTION + "\n" + "\n".join(_TRIGGER.format(table=t) for t in UPDATED_AT_TABLES)
+    ))
+
+
+def downgrade() -> None:
+    """Drop the updated_at triggers and their function."""
+    op.execute(sa.text("\n".join(
+        f"DROP TRIGGER IF EXISTS trg_{t}_updated_at ON {t};" for t in UPDATED_AT_TABLES
+    ) + "\nDROP FUNCTION IF EXISTS set_updated_at();"))
@@ -0,0 +1,150 @@
+"""store OHLCV and TA indicators as float8, bounded scores as float4
+
+price_data OHLCV and the ta_indicators price-level indicators move from
+numeric to DOUBLE PRECISION (~15 significant digits, ample for crypto
+prices and volumes). The bounded [-1, 1] scores on ta_indicators,
+sentiment_data, political_signal and xai_composite become REAL, like the
+confluence scores in f2a3b4c5d6e7. Reads come back as Python floats
+instead of Decimals, and the rows get narrower.
+
+Timescale can't change column types on a hypertable with compression
+enabled, so price_data is decompressed first and its compression
+settings and policy (from a3b4c5d6e7f8) are restored afterwards.
+
+Revision ID: c5d6e7f8a9b0
+Revises: b4c5d6e7f8a9
+Create Date: 2026-10-16 15:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d6e7f8a9b0'
+down_revision: Union[str, Sequence[str], None] = 'b4c5d6e7f8a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PRICE = "NUMERIC(20, 8)"
+INDICATOR = "NUMERIC(10, 4)"
+SCORE = "NUMERIC(5, 4)"
+
+# table -> [(column, new type, previous numeric type)]
+COLUMNS = {
+    "price_data": [
+        (c, "DOUBLE PRECISION", PRICE) for c in ("open", "high", "low", "close", "volume")
+    ],
+    "ta_indicators": [
+        ("rsi_14", "DOUBLE PRECISION", INDICATOR),
+        ("rsi_7", "DOUBLE PRECISION", INDICATOR),
+        ("stoch_k", "DOUBLE PRECISION", INDICATOR),
+        ("stoch_d", "DOUBLE PRECISION", INDICATOR),
+        *(
+            (c, "DOUBLE PRECISION", PRICE)
+            for c in (
+                "macd_line", "macd_signal", "macd_histogram",
+                "sma_20", "sma_50", "sma_200", "ema_12", "ema_26",
+                "bb_upper", "bb_middle", "bb_lower", "atr_14",
+                "fib_0", "fib_236", "fib_382", "fib_500", "fib_618", "fib_786", "fib_1000",
+            )
+        ),
+        ("ta_score", "REAL", SCORE),
+    ],
+    "sentiment_data": [
+        ("social_sentiment", "REAL", SCORE),
+        ("sentiment_score", "REAL", SCORE),
+    ],
+    "political_signal": [
+        (c, "REAL", SCORE)
+        for c in (
+            "avg_news_sentiment_1h", "avg_news_sentiment_24h", "max_urgency_1h",
+            "narrative_strength", "political_score",
+        )
+    ],
+    "xai_composite": [
+        (c, "REAL", SCORE)
+        for c in (
+            "policy_pipeline_score", "partnership_deployment_score",
+            "onchain_utility_score", "personnel_intelligence_score", "xai_score",
+        )
+    ],
+}
+
+# One ALTER TABLE per table (a single rewrite), skipped when the first
+# column already has the target type so re-runs are no-ops.
+_ALTER = """
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = '{table}' AND column_name = '{first}'
+          AND data_type = '{from_type}'
+    ) THEN
+        ALTER TABLE {table}
+{clauses};
+    END IF;"""
+
+_PRICE_DATA = """
+DO $$
+DECLARE
+    compressed boolean;
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') THEN
+        SELECT compression_enabled INTO compressed
+        FROM timescaledb_information.hypertables
+        WHERE hypertable_name = 'price_data';
+    END IF;
+    IF compressed THEN
+        PERFORM remove_compression_policy('price_data', if_exists => true);
+        PERFORM decompress_chunk(c, if_compressed => true) FROM show_chunks('price_data') c;
+        ALTER TABLE price_data SET (timescaledb.compress = false);
+    END IF;
+{alter}
+    IF compressed THEN
+        ALTER TABLE price_data SET (
+            timescaledb.compress,
+            timescaledb.compress_segmentby = 'symbol, exchange, timeframe',
+            timescaledb.compress_orderby = 'timestamp DESC'
+        );
+        PERFORM add_compression_policy('price_data', INTERVAL '30 days', if_not_exists => true);
+    END IF;
+END $$;"""
+
+
+def _alter(table: str, to_new: bool) -> str:
+    columns = COLUMNS[table]
+    first, new_type, old_type = columns[0]
+    if to_new:
+        from_type = "numeric"
+        clauses = [f"ALTER COLUMN {c} TYPE {new} USING {c}::{new.lower()}" for c, new, _ in columns]
+    else:
+        from_type = "double precision" if new_type == "DOUBLE PRECISION" else "real"
+        # The numeric(p, s) typmod coercion rounds to scale on the way back.
+        clauses = [f"ALTER COLUMN {c} TYPE {old} USING {c}::numeric" for c, _, old in columns]
+    return _ALTER.format(
+        table=table,
+        first=first,
+        from_type=from_type,
+        clauses=",\n".join(f"            {clause}" for clause in clauses),
+    )
+
+
+def _sql(to_new: bool) -> str:
+    blocks = [_PRICE_DATA.format(alter=_alter("price_data", to_new))]
+    blocks += [
+        f"DO $$\nBEGIN{_alter(table, to_new)}\nEND $$;"
+        for table in COLUMNS
+        if table != "price_data"
+    ]
+    return "\n".join(blocks)
+
+
+def upgrade() -> None:
+    """Convert OHLCV/indicator columns to float8 and scores to float4."""
+    op.execute(sa.text(_sql(to_new=True)))
+
+
+def downgrade() -> None:
+    """Convert the columns back to their previous numeric types."""
+    op.execute(sa.text(_sql(to_new=False)))
@@ -0,0 +1,87 @@
+"""widen xai reference-table ids to BIGINT identity
+
+xai_partnerships, xai_tracked_entities and xai_event_calendar were created
+with SERIAL (INTEGER) primary keys. Widen them to BIGINT while the tables
+are still small, so the ACCESS EXCLUSIVE rewrite never has to happen on a
+large table, and replace the SERIAL sequence with an identity.
+xai_personnel_intelligence.entity_id references xai_tracked_entities.id,
+so it is widened too.
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-16 10:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9d0e1f2a3b4'
+down_revision: Union[str, Sequence[str], None] = 'b8c9d0e1f2a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ["xai_partnerships", "xai_tracked_entities", "xai_event_calendar"]
+
+
+def upgrade() -> None:
+    """Widen the ids to BIGINT and move them onto identity defaults."""
+    for table in TABLES:
+        op.alter_column(table, 'id', type_=sa.BigInteger(), existing_nullable=False)
+    op.alter_column('xai_personnel_intelligence', 'entity_id',
+                    type_=sa.BigInteger(), existing_nullable=True)
+    for table in TABLES:
+        # The SERIAL sequence must go first: the identity's own sequence
+        # takes the same <table>_id_seq name.
+        op.execute(sa.text(f"""
+            DO $$
+            DECLARE
+                next_id bigint;
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM pg_attribute
+                    WHERE attrelid = '{table}'::regclass AND attname = 'id'
+                      AND attidentity = ''
+                ) THEN
+                    ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT;
+                    DROP SEQUENCE IF EXISTS {table}_id_seq;
+                    SELECT COALESCE(max(id), 0) + 1 INTO next_id FROM {table};
+                    EXECUTE format(
+                        'ALTER TABLE {table} ALTER COLUMN id '
+                        'ADD GENERATED BY DEFAULT AS IDENTITY (START WITH %s)',
+                        next_id
+                    );
+                END IF;
+            END $$;
+        """))
+
+
+def downgrade() -> None:
+    """Back to INTEGER ids on owned sequence defaults."""
+    for table in TABLES:
+        op.execute(sa.text(f"""
+            DO $$
+            DECLARE
+                next_id bigint;
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM pg_attribute
+                    WHERE attrelid = '{table}'::regclass AND attname = 'id'
+                      AND attidentity <> ''
+                ) THEN
+                    ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY;
+                    SELECT COALESCE(max(id), 0) + 1 INTO next_id FROM {table};
+                    CREATE SEQUENCE {table}_id_seq AS integer OWNED BY {table}.id;
+                    PERFORM setval('{table}_id_seq', next_id, false);
+                    ALTER TABLE {table} ALTER COLUMN id
+                        SET DEFAULT nextval('{table}_id_seq');
+                END IF;
+            END $$;
+        """))
+    op.alter_column('xai_personnel_intelligence', 'entity_id',
+                    type_=sa.Integer(), existing_nullable=True)
+    for table in TABLES:
+        op.alter_column(table, 'id', type_=sa.Integer(), existing_nullable=False)
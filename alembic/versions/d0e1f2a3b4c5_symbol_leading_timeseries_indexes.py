@@ -0,0 +1,57 @@
+"""add symbol-leading timeseries indexes, drop duplicate macro ts indexes
+
+The timeseries PKs lead with timestamp, but every read filters on symbol
+(and timeframe) first and orders by timestamp, so those queries scan the
+whole PK. Add (symbol[, timeframe], timestamp) btrees, matching the
+existing idx_price_symbol_time on price_data.
+
+The Layer 7 macro tables have PRIMARY KEY (timestamp), so their separate
+idx_*_ts btrees duplicate the PK index; drop them.
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd0e1f2a3b4c5'
+down_revision: Union[str, Sequence[str], None] = 'c9d0e1f2a3b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SYMBOL_INDEXES = [
+    ("idx_ta_symbol_tf_time", "ta_indicators", ["symbol", "timeframe", "timestamp"]),
+    ("idx_sentiment_symbol_time", "sentiment_data", ["symbol", "timestamp"]),
+    ("idx_onchain_symbol_time", "onchain_metrics", ["symbol", "timestamp"]),
+    ("idx_confluence_symbol_tf_time", "confluence_scores", ["symbol", "timeframe", "timestamp"]),
+]
+
+DUPLICATE_TS_INDEXES = [
+    ("idx_liquidity_ts", "liquidity_data"),
+    ("idx_rate_ts", "rate_data"),
+    ("idx_macroprices_ts", "macro_prices"),
+    ("idx_carry_ts", "carry_trade_data"),
+    ("idx_oil_ts", "oil_data"),
+    ("idx_macro_signal_ts", "macro_liquidity_signal"),
+]
+
+
+def upgrade() -> None:
+    """Create symbol-leading indexes; drop PK-duplicate timestamp indexes."""
+    for name, table, columns in SYMBOL_INDEXES:
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
+    for name, table in DUPLICATE_TS_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    """Restore the timestamp indexes; drop the symbol-leading ones."""
+    for name, table in DUPLICATE_TS_INDEXES:
+        op.create_index(name, table, ["timestamp"], unique=False, if_not_exists=True)
+    for name, table, _ in SYMBOL_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,90 @@
+"""compress old chunks of the remaining append-mostly hypertables
+
+price_data chunks are already compressed after 30 days (a3b4c5d6e7f8).
+Extend the same policy to ta_indicators, sentiment_data, political_news
+and xai_onchain_metrics. segmentby follows each table's per-series key
+(the columns every reader filters on) and every primary-key column is in
+segmentby or orderby, as Timescale requires for compressed chunks that
+still enforce the key on upsert. Readers look back hours or days, so
+only backtests and backfills touch compressed chunks. Without the
+extension this is a no-op.
+
+Revision ID: d2e3f4a5b6c7
+Revises: c1d2e3f4a5b6
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2e3f4a5b6c7'
+down_revision: Union[str, Sequence[str], None] = 'c1d2e3f4a5b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> (compress_segmentby, compress_orderby); xai_onchain_metrics is
+# one global series keyed on timestamp alone, so it has no segmentby.
+COMPRESSION = {
+    "ta_indicators": ("symbol, timeframe", "timestamp DESC"),
+    "sentiment_data": ("symbol", "timestamp DESC"),
+    "political_news": ("source_name", "timestamp DESC, headline"),
+    "xai_onchain_metrics": ("", "timestamp DESC"),
+}
+
+# Compression settings can't be changed once chunks are compressed, so
+# only enable them the first time.
+_COMPRESS = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') THEN
+        IF EXISTS (
+            SELECT 1 FROM timescaledb_information.hypertables
+            WHERE hypertable_name = '{table}' AND NOT compression_enabled
+        ) THEN
+            ALTER TABLE {table} SET (
+{options}
+            );
+        END IF;
+        IF EXISTS (
+            SELECT 1 FROM timescaledb_information.hypertables
+            WHERE hypertable_name = '{table}'
+        ) THEN
+            PERFORM add_compression_policy('{table}', INTERVAL '30 days', if_not_exists => true);
+        END IF;
+    END IF;
+END $$;"""
+
+_REMOVE_COMPRESSION_POLICY = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') THEN
+        PERFORM remove_compression_policy('{table}', if_exists => true);
+    END IF;
+END $$;"""
+
+
+def _options(segmentby: str, orderby: str) -> str:
+    options = ["timescaledb.compress"]
+    if segmentby:
+        options.append(f"timescaledb.compress_segmentby = '{segmentby}'")
+    options.append(f"timescaledb.compress_orderby = '{orderby}'")
+    return ",\n".join(f"                {o}" for o in options)
+
+
+def upgrade() -> None:
+    """Enable compression and a 30-day compression policy per hypertable."""
+    op.execute(sa.text("\n".join(
+        _COMPRESS.format(table=table, options=_options(segmentby, orderby))
+        for table, (segmentby, orderby) in COMPRESSION.items()
+    )))
+
+
+def downgrade() -> None:
+    """Stop compressing new chunks (already-compressed chunks stay queryable)."""
+    op.execute(sa.text("\n".join(
+        _REMOVE_COMPRESSION_POLICY.format(table=table) for table in COMPRESSION
+    )))
@@ -0,0 +1,58 @@
+"""drop political_news chunks older than 12 months
+
+political_news is a hypertable (a3b4c5d6e7f8) when timescaledb is
+installed, so it is already range-partitioned by timestamp into 7-day
+chunks. Add a 12-month retention policy: old headlines go by dropping
+whole chunks instead of a DELETE + VACUUM over the table. Every reader
+looks back hours or days, never a year. Without the extension this is a
+no-op.
+
+Revision ID: d6e7f8a9b0c1
+Revises: c5d6e7f8a9b0
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6e7f8a9b0c1'
+down_revision: Union[str, Sequence[str], None] = 'c5d6e7f8a9b0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_ADD_RETENTION = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') THEN
+        IF EXISTS (
+            SELECT 1 FROM timescaledb_information.hypertables
+            WHERE hypertable_name = 'political_news'
+        ) THEN
+            PERFORM add_retention_policy(
+                'political_news', INTERVAL '12 months', if_not_exists => true
+            );
+        END IF;
+    END IF;
+END $$;"""
+
+_REMOVE_RETENTION = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') THEN
+        PERFORM remove_retention_policy('political_news', if_exists => true);
+    END IF;
+END $$;"""
+
+
+def upgrade() -> None:
+    """Add a 12-month retention policy on the political_news hypertable."""
+    op.execute(sa.text(_ADD_RETENTION))
+
+
+def downgrade() -> None:
+    """Remove the retention policy (already-dropped chunks stay dropped)."""
+    op.execute(sa.text(_REMOVE_RETENTION))
@@ -0,0 +1,95 @@
+"""timestamptz for celestial/event/alert times, SQL-side created_at defaults
+
+celestial_state.timestamp, historical_events.timestamp and the alerts
+timestamps become TIMESTAMP WITH TIME ZONE. Existing values were written
+as UTC, so they are reinterpreted with AT TIME ZONE 'UTC'. celestial_state
+then becomes a 7-day-chunk hypertable when timescaledb is installed.
+
+The XAI created_at/updated_at columns get a now() server default so
+inserts no longer need a Python-side datetime.utcnow() bind.
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1f2a3b4c5d6'
+down_revision: Union[str, Sequence[str], None] = 'd0e1f2a3b4c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMPTZ_COLUMNS = [
+    ("celestial_state", "timestamp"),
+    ("historical_events", "timestamp"),
+    ("alerts", "created_at"),
+    ("alerts", "triggered_at"),
+    ("alerts", "acknowledged_at"),
+]
+
+NOW_DEFAULT_COLUMNS = [
+    ("xai_partnerships", "created_at"),
+    ("xai_partnerships", "updated_at"),
+    ("xai_tracked_entities", "created_at"),
+    ("xai_event_calendar", "created_at"),
+    ("xai_policy_events", "created_at"),
+    ("xai_personnel_intelligence", "created_at"),
+]
+
+# Checks information_schema first so a re-run skips the table rewrite.
+_ALTER_TYPE = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = '{table}' AND column_name = '{column}'
+          AND data_type = '{from_type}'
+    ) THEN
+        ALTER TABLE {table} ALTER COLUMN "{column}" TYPE {to_type}
+            USING "{column}" AT TIME ZONE 'UTC';
+    END IF;
+END $$;"""
+
+_HYPERTABLE = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') THEN
+        PERFORM create_hypertable(
+            'celestial_state', 'timestamp',
+            chunk_time_interval => INTERVAL '7 days',
+            migrate_data => true,
+            if_not_exists => true
+        );
+    END IF;
+END $$;"""
+
+
+def _alter_types(from_type: str, to_type: str) -> str:
+    return "\n".join(
+        _ALTER_TYPE.format(table=t, column=c, from_type=from_type, to_type=to_type)
+        for t, c in TIMESTAMPTZ_COLUMNS
+    )
+
+
+def upgrade() -> None:
+    """Switch the listed columns to timestamptz and add now() defaults."""
+    op.execute(sa.text(_alter_types("timestamp without time zone", "TIMESTAMP WITH TIME ZONE")))
+    op.execute(sa.text(_HYPERTABLE))
+    for table, column in NOW_DEFAULT_COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    """Drop the now() defaults and go back to naive UTC timestamps.
+
+    celestial_state stays a hypertable if it became one (see b8c9d0e1f2a3).
+    """
+    for table, column in NOW_DEFAULT_COLUMNS:
+        op.alter_column(table, column, server_default=None)
+    op.execute(sa.text(_alter_types("timestamp with time zone", "TIMESTAMP WITHOUT TIME ZONE")))
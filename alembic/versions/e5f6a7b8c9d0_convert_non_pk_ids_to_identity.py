@@ -0,0 +1,94 @@
+"""convert sequence-default non-pk ids to identity columns
+
+The BIGSERIAL-default revisions (2bf5d352090a, 3a7e4c91b8d1, c1a2b3d4e5f6,
+e3c4d5f6a7b8) gave each non-PK id a nextval('<table>_id_seq') default.
+Move those columns onto identities that continue past max(id). Columns that
+are already identities are left untouched, so re-runs are no-ops.
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f6a7b8c9d0'
+down_revision: Union[str, Sequence[str], None] = 'd4e5f6a7b8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every table covered by 2bf5d352090a, 3a7e4c91b8d1, c1a2b3d4e5f6, e3c4d5f6a7b8.
+TABLES = [
+    "price_data",
+    "ta_indicators",
+    "celestial_state",
+    "numerology_daily",
+    "sentiment_data",
+    "onchain_metrics",
+    "confluence_scores",
+    "political_signal",
+    "liquidity_data",
+    "rate_data",
+    "macro_prices",
+    "carry_trade_data",
+    "oil_data",
+    "macro_liquidity_signal",
+    "political_news",
+]
+
+
+def upgrade() -> None:
+    """Convert sequence-default id columns to identity."""
+    for table in TABLES:
+        # The old sequence must go first: the identity's own sequence takes
+        # the same <table>_id_seq name.
+        op.execute(sa.text(f"""
+            DO $$
+            DECLARE
+                next_id bigint;
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM pg_attribute
+                    WHERE attrelid = '{table}'::regclass AND attname = 'id'
+                      AND attidentity = ''
+                ) THEN
+                    ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT;
+                    DROP SEQUENCE IF EXISTS {table}_id_seq;
+                    SELECT COALESCE(max(id), 0) + 1 INTO next_id FROM {table};
+                    EXECUTE format(
+                        'ALTER TABLE {table} ALTER COLUMN id '
+                        'ADD GENERATED BY DEFAULT AS IDENTITY (START WITH %s)',
+                        next_id
+                    );
+                END IF;
+            END $$;
+        """))
+
+
+def downgrade() -> None:
+    """Restore owned sequence defaults on the id columns."""
+    for table in TABLES:
+        op.execute(sa.text(f"""
+            DO $$
+            DECLARE
+                next_id bigint;
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM pg_attribute
+                    WHERE attrelid = '{table}'::regclass AND attname = 'id'
+                      AND attidentity <> ''
+                ) THEN
+                    ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY;
+                    SELECT COALESCE(max(id), 0) + 1 INTO next_id FROM {table};
+                    CREATE SEQUENCE {table}_id_seq OWNED BY {table}.id;
+                    PERFORM setval('{table}_id_seq', next_id, false);
+                    ALTER TABLE {table} ALTER COLUMN id
+                        SET DEFAULT nextval('{table}_id_seq');
+                END IF;
+            END $$;
+        """))
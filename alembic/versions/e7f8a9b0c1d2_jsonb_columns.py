@@ -0,0 +1,79 @@
+"""store JSON columns as JSONB
+
+Plain ``json`` keeps the raw text, so any server-side ``->``/``->>``
+access reparses the whole document; ``jsonb`` is stored decomposed, which
+makes key access cheap and the columns indexable. No GIN index is added:
+nothing filters on these columns by containment yet, and a GIN index would
+slow every insert on the ingest tables (political_news, celestial_state)
+with no reader to pay for it.
+
+Revision ID: e7f8a9b0c1d2
+Revises: d6e7f8a9b0c1
+Create Date: 2026-10-16 16:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7f8a9b0c1d2'
+down_revision: Union[str, Sequence[str], None] = 'd6e7f8a9b0c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = {
+    "alerts": ["trigger_data", "aligned_layers"],
+    "celestial_state": ["active_aspects", "ingresses"],
+    "confluence_scores": ["weights", "aligned_layers"],
+    "historical_events": ["active_aspects_snapshot", "active_cycle_alignments"],
+    "macro_liquidity_signal": ["sub_signals"],
+    "numerology_daily": ["active_cycles", "price_47_appearances"],
+    "political_calendar": ["key_figure_gematria", "event_title_gematria"],
+    "political_news": ["entities", "headline_gematria"],
+    "watched_symbols": ["timeframes"],
+    "xai_composite": ["weights"],
+    "xai_tracked_entities": ["watch_urls", "social_handles"],
+}
+
+# One ALTER TABLE per table so each is rewritten once, skipped entirely
+# when the first column already has the target type (re-runs).
+_ALTER = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = '{table}' AND column_name = '{first}'
+          AND data_type = '{from_type}'
+    ) THEN
+        ALTER TABLE {table}
+{clauses};
+    END IF;
+END $$;"""
+
+
+def _alter(from_type: str, to_type: str) -> str:
+    return "\n".join(
+        _ALTER.format(
+            table=table,
+            first=columns[0],
+            from_type=from_type,
+            clauses=",\n".join(
+                f"            ALTER COLUMN {c} TYPE {to_type} USING {c}::{to_type}"
+                for c in columns
+            ),
+        )
+        for table, columns in JSON_COLUMNS.items()
+    )
+
+
+def upgrade() -> None:
+    """Convert the JSON columns from json to jsonb."""
+    op.execute(sa.text(_alter("json", "jsonb")))
+
+
+def downgrade() -> None:
+    """Convert the JSON columns back to json (key order/whitespace are not restored)."""
+    op.execute(sa.text(_alter("jsonb", "json")))
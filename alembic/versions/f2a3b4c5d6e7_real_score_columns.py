@@ -0,0 +1,87 @@
+"""store bounded signal scores as REAL instead of DECIMAL(5,4)
+
+The confluence, celestial and macro signal scores are bounded to [-1, 1]
+at 4-decimal precision, well inside float4's ~7 significant digits.
+REAL halves the column width and reads back as a Python float, so the
+confluence/backtest loops no longer allocate a Decimal per value.
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-10-16 13:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a3b4c5d6e7'
+down_revision: Union[str, Sequence[str], None] = 'e1f2a3b4c5d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCORE_COLUMNS = {
+    "confluence_scores": [
+        "ta_score",
+        "onchain_score",
+        "celestial_score",
+        "numerology_score",
+        "sentiment_score",
+        "political_score",
+        "macro_score",
+        "xai_score",
+        "composite_score",
+    ],
+    "celestial_state": ["celestial_score"],
+    "macro_liquidity_signal": [
+        "liquidity_score",
+        "treasury_score",
+        "dollar_score",
+        "oil_score",
+        "carry_trade_score",
+        "macro_score",
+        "regime_confidence",
+    ],
+}
+
+# One ALTER TABLE per table so each is rewritten once, skipped entirely
+# when the first column already has the target type (re-runs).
+_ALTER = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = '{table}' AND column_name = '{first}'
+          AND data_type = '{from_type}'
+    ) THEN
+        ALTER TABLE {table}
+{clauses};
+    END IF;
+END $$;"""
+
+
+def _alter(from_type: str, to_type: str, using: str) -> str:
+    return "\n".join(
+        _ALTER.format(
+            table=table,
+            first=columns[0],
+            from_type=from_type,
+            clauses=",\n".join(
+                f"            ALTER COLUMN {c} TYPE {to_type} USING {using.format(c=c)}"
+                for c in columns
+            ),
+        )
+        for table, columns in SCORE_COLUMNS.items()
+    )
+
+
+def upgrade() -> None:
+    """Convert the score columns from numeric(5,4) to real."""
+    op.execute(sa.text(_alter("numeric", "REAL", "{c}::real")))
+
+
+def downgrade() -> None:
+    """Convert the score columns back to numeric(5,4), rounding to 4 places."""
+    op.execute(sa.text(_alter("real", "NUMERIC(5, 4)", "round({c}::numeric, 4)")))
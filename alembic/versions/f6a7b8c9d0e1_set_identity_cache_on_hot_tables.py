@@ -0,0 +1,44 @@
+"""set identity sequence cache on high-write tables
+
+e5f6a7b8c9d0 creates the identities with the default CACHE 1, so every
+insert on the hot ingest tables calls nextval() on a shared sequence.
+Pre-allocate ids per backend instead. These are non-PK ids, so the gaps a
+cache leaves on restart or rollback are harmless.
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-16 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a7b8c9d0e1'
+down_revision: Union[str, Sequence[str], None] = 'e5f6a7b8c9d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Identity sequence CACHE per table; tables not listed keep CACHE 1.
+CACHE = {
+    "price_data": 100,
+    "ta_indicators": 100,
+    "sentiment_data": 100,
+    "political_news": 100,
+    "onchain_metrics": 50,
+    "confluence_scores": 50,
+}
+
+
+def upgrade() -> None:
+    """Raise identity CACHE on high-write tables."""
+    for table, cache in CACHE.items():
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET CACHE {cache}")
+
+
+def downgrade() -> None:
+    """Return identity CACHE to 1."""
+    for table in CACHE:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET CACHE 1")
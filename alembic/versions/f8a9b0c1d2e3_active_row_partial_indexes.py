@@ -0,0 +1,48 @@
+"""add partial indexes on the active signal_weights / watched_symbols rows
+
+Every confluence computation loads the active weight profile, and every
+scheduler tick lists the active watched symbols, both via
+``WHERE is_active = true``. Index just that subset so the lookup stays a
+tiny, cache-resident index scan as deactivated profiles accumulate (each
+weight update deactivates the old profile and inserts a new one).
+
+Revision ID: f8a9b0c1d2e3
+Revises: e7f8a9b0c1d2
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8a9b0c1d2e3'
+down_revision: Union[str, Sequence[str], None] = 'e7f8a9b0c1d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE_INDEXES = [
+    ("idx_signal_weights_active", "signal_weights", ["profile_name"]),
+    ("idx_watched_symbols_active", "watched_symbols", ["symbol"]),
+]
+
+
+def upgrade() -> None:
+    """Create the is_active partial indexes."""
+    for name, table, columns in ACTIVE_INDEXES:
+        op.create_index(
+            name,
+            table,
+            columns,
+            unique=False,
+            postgresql_where=sa.text("is_active = true"),
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the is_active partial indexes."""
+    for name, table, _ in ACTIVE_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
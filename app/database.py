@@ -1,8 +1,8 @@
 """SQLAlchemy 2.0 database engine, session factory, and declarative base."""
 
-from typing import Generator
+from typing import Callable, Generator, TypeVar
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from app.config import settings
@@ -11,6 +11,20 @@ engine = create_engine(
     settings.database_url,
     echo=False,
     pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle,
+    # LIFO reuses the most recently returned connection, so idle extras
+    # age out via pool_recycle instead of being cycled round-robin.
+    pool_use_lifo=True,
+    # SQLAlchemy 2.0 already caches compiled statements per engine; the
+    # default 500 entries churns with ~30 models x insert/select/upsert shapes.
+    query_cache_size=1200,
+    # timezone=UTC: naive datetimes compared against timestamptz columns and
+    # now() server defaults are always read as UTC, whatever the server default.
+    connect_args={
+        "options": f"-c statement_timeout={settings.db_statement_timeout_ms} -c timezone=UTC"
+    },
 )
 
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
@@ -29,3 +43,35 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def _bulk_settings(session: Session, transaction, connection) -> None:
+    connection.exec_driver_sql("SET LOCAL synchronous_commit = off")
+    connection.exec_driver_sql("SET LOCAL statement_timeout = 0")
+
+
+# Sessions for re-runnable bulk jobs (bootstrap backfills, all upserts):
+# no transaction waits for the WAL flush. A crash can lose the last few
+# hundred ms of commits, but never corrupts data, and re-running the job
+# restores them. The engine-wide statement_timeout guards request handlers;
+# a large backfill upsert can legitimately run past it, so bulk sessions
+# lift it. SET LOCAL keeps both settings off pooled connections once the
+# transaction ends.
+BulkSessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+event.listen(BulkSessionLocal, "after_begin", _bulk_settings)
+
+T = TypeVar("T")
+
+
+def run_in_session(
+    session_factory: sessionmaker, fn: Callable[..., T], *args, **kwargs
+) -> T:
+    """Run ``fn(db, *args, **kwargs)`` in a short-lived session, then commit.
+
+    Long jobs call this once per unit of work (per step, per symbol) so no
+    connection or identity map is held across the whole run.
+    """
+    with session_factory() as db:
+        result = fn(db, *args, **kwargs)
+        db.commit()
+        return result
@@ -1,19 +1,27 @@
 """FastAPI application entry point."""
 
+import hashlib
+import importlib
 import logging
+import threading
 import traceback
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Callable, Literal
 
-from fastapi import BackgroundTasks, Depends, FastAPI
+import anyio.to_thread
+from fastapi import BackgroundTasks, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from sqlalchemy.orm import Session
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import FileResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import cookie_parser
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.config import settings
-from app.database import SessionLocal, get_db
+from app.database import BulkSessionLocal
 from app.routers import health
 from app.routers import price
 from app.routers import signals
@@ -29,8 +37,9 @@ from app.routers import macro
 from app.routers import auth
 from app.routers import interpretation
 from app.routers import xai
-from app.services.auth_service import decode_access_token, ensure_admin_user
+from app.services.auth_service import decode_access_token_cached
 from app.services.scheduler import start_scheduler, stop_scheduler
+from app.spa import ImmutableStaticFiles, SPAFiles
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +47,7 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 # Paths that do not require authentication
 # ---------------------------------------------------------------------------
-PUBLIC_PATHS = {
+PUBLIC_PATHS = frozenset({
     "/health",
     "/api/auth/login",
     "/api/auth/logout",
@@ -46,78 +55,259 @@ PUBLIC_PATHS = {
     "/docs",
     "/openapi.json",
     "/redoc",
-}
+})
+
+# Public paths whose handlers read request.state.user. Every other public
+# path skips cookie parsing and token decoding entirely.
+USER_AWARE_PUBLIC_PATHS = frozenset({"/api/auth/me"})
+
+# Request classes for AuthMiddleware, decided by _classify_path.
+PATH_PUBLIC, PATH_STATIC, PATH_PROTECTED = range(3)
+
+
+def _classify_path(path: str) -> int:
+    """Classify a request path for the auth middleware in one pass.
+
+    PATH_STATIC covers everything handed through untouched: assets, SPA
+    routes, and public paths outside ``USER_AWARE_PUBLIC_PATHS``.
+    """
+    if path in PUBLIC_PATHS:
+        return PATH_PUBLIC if path in USER_AWARE_PUBLIC_PATHS else PATH_STATIC
+    if path.startswith("/api/"):
+        return PATH_PROTECTED
+    return PATH_STATIC
+
+
+# Pre-rendered 401 bodies, byte-identical to JSONResponse's compact output.
+_NOT_AUTHENTICATED = b'{"detail":"Not authenticated"}'
+_INVALID_TOKEN = b'{"detail":"Invalid or expired token"}'
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
+def _access_token(scope: Scope) -> str | None:
+    """Read the access_token cookie straight from the raw ASGI headers."""
+    for name, value in scope["headers"]:
+        if name == b"cookie":
+            return cookie_parser(value.decode("latin-1")).get("access_token")
+    return None
+
+
+async def _send_401(send: Send, body: bytes) -> None:
+    await send({
+        "type": "http.response.start",
+        "status": 401,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class AuthMiddleware:
     """Global JWT authentication middleware.
 
     Reads the ``access_token`` httpOnly cookie.  Protected paths return 401
     if the cookie is missing or the token is invalid/expired.  Public paths
     are always allowed through, but the token is still decoded when present
     so ``request.state.user`` is available on public endpoints like ``/api/auth/me``.
+
+    Plain ASGI rather than BaseHTTPMiddleware: static assets and SPA routes
+    are handed straight to the app without the call_next task/stream
+    wrapping, which an SPA load pays on dozens of asset requests. It works
+    on the raw scope throughout (no Request/Response objects); the user is
+    written to ``scope["state"]``, which backs ``request.state``.
     """
 
-    async def dispatch(self, request, call_next):
-        # Always allow CORS preflight
-        if request.method == "OPTIONS":
-            return await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Always allow non-HTTP traffic and CORS preflight
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
 
-        path = request.url.path
-        token = request.cookies.get("access_token")
+        # Static files, SPA routes and user-agnostic public endpoints — allow
+        # through without parsing the Cookie header or decoding the token.
+        kind = _classify_path(scope["path"])
+        if kind == PATH_STATIC:
+            await self.app(scope, receive, send)
+            return
+
+        token = _access_token(scope)
 
         # Attempt to decode the token (used for both public and protected paths)
         username = None
         if token:
-            username = decode_access_token(token)
+            username = decode_access_token_cached(token)
 
         if username:
-            request.state.user = username
+            scope.setdefault("state", {})["user"] = username
+
+        # Protected API paths — require valid token; public paths fall through
+        if kind == PATH_PROTECTED:
+            if not token:
+                await _send_401(send, _NOT_AUTHENTICATED)
+                return
 
-        # Public paths — allow through regardless of auth state
-        if path in PUBLIC_PATHS:
-            return await call_next(request)
+            if not username:
+                await _send_401(send, _INVALID_TOKEN)
+                return
 
-        # Static files and SPA routes — allow through (auth handled client-side)
-        if not path.startswith("/api/"):
-            return await call_next(request)
+        await self.app(scope, receive, send)
 
-        # Protected API paths — require valid token
-        if not token:
-            return JSONResponse(
-                status_code=401,
-                content={"detail": "Not authenticated"},
-            )
 
-        if not username:
-            return JSONResponse(
-                status_code=401,
-                content={"detail": "Invalid or expired token"},
-            )
+# Larger JSON bodies are streamed through untagged instead of buffered.
+ETAG_MAX_BODY = 1 << 20
 
-        return await call_next(request)
+
+def _etag_matches(scope: Scope, etag: bytes) -> bool:
+    """Weak If-None-Match comparison: any listed tag (or ``*``) matches."""
+    opaque = etag.removeprefix(b"W/")
+    for name, value in scope["headers"]:
+        if name != b"if-none-match":
+            continue
+        for tag in value.split(b","):
+            tag = tag.strip()
+            if tag == b"*" or tag.removeprefix(b"W/") == opaque:
+                return True
+    return False
+
+
+class ETagMiddleware:
+    """Conditional GETs for the JSON API.
+
+    Every 200 JSON response to a ``GET /api/...`` request gets a weak ETag
+    (an md5 of the body, as the SPA index uses) and
+    ``Cache-Control: private, no-cache``. Browsers then revalidate each
+    dashboard poll, and an unchanged payload comes back as a bodiless 304.
+
+    This saves transfer only: the route and its DB queries still run in
+    full, because the ETag is computed from the rendered body. The body is
+    buffered to hash it, so responses over ETAG_MAX_BODY bytes pass through
+    untagged. Weak because GZipMiddleware may re-encode the body, and
+    ``private`` because every API response is per-user (cookie-authenticated).
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith("/api/")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        start: dict | None = None
+        chunks: list[bytes] = []
+        size = 0
+        passthrough = False
+
+        async def send_with_etag(message: dict) -> None:
+            nonlocal start, size, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                headers = dict(message["headers"])
+                if (
+                    message["status"] != 200
+                    or b"etag" in headers
+                    or not headers.get(b"content-type", b"").startswith(b"application/json")
+                    or int(headers.get(b"content-length", 0)) > ETAG_MAX_BODY
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message
+                return
+
+            body = message.get("body", b"")
+            chunks.append(body)
+            size += len(body)
+            if message.get("more_body", False):
+                if size > ETAG_MAX_BODY:
+                    # Too large to buffer: flush what we have and stream the rest.
+                    passthrough = True
+                    await send(start)
+                    await send({
+                        "type": "http.response.body",
+                        "body": b"".join(chunks),
+                        "more_body": True,
+                    })
+                return
+
+            body = b"".join(chunks)
+            etag = b'W/"' + hashlib.md5(body).hexdigest().encode() + b'"'
+            headers = [
+                (k, v) for k, v in start["headers"] if k != b"cache-control"
+            ]
+            headers += [(b"etag", etag), (b"cache-control", b"private, no-cache")]
+            if _etag_matches(scope, etag):
+                headers = [
+                    (k, v) for k, v in headers
+                    if k not in (b"content-length", b"content-type")
+                ]
+                await send({**start, "status": 304, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await send({**start, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_with_etag)
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application startup and shutdown events."""
+async def _logging_ctx(app: FastAPI):
+    """Configure logging and bracket the app's lifetime in the log."""
     logging.basicConfig(
         level=getattr(logging, settings.log_level.upper(), logging.INFO),
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
     logger.info("CryptoOracle starting up (env=%s)", settings.app_env)
+    try:
+        yield
+    finally:
+        logger.info("CryptoOracle shutting down")
+
 
-    # Seed admin user from env vars if no users exist
-    db = SessionLocal()
+@asynccontextmanager
+async def _threadpool_ctx(app: FastAPI):
+    """Size the worker-thread pool that sync endpoints and dependencies run on."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    default = limiter.total_tokens
+    limiter.total_tokens = settings.threadpool_size
     try:
-        ensure_admin_user(db)
+        yield
     finally:
-        db.close()
+        limiter.total_tokens = default
+
 
+@asynccontextmanager
+async def _scheduler_ctx(app: FastAPI):
+    """Run the APScheduler background jobs (incl. the admin seed) for the app's lifetime."""
     start_scheduler()
-    yield
-    stop_scheduler()
-    logger.info("CryptoOracle shutting down")
+    try:
+        yield
+    finally:
+        stop_scheduler()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown events.
+
+    Each component is its own context manager; the exit stack unwinds
+    whatever started, in reverse order, even if a later step fails.
+    """
+    async with AsyncExitStack() as stack:
+        await stack.enter_async_context(_logging_ctx(app))
+        await stack.enter_async_context(_threadpool_ctx(app))
+        await stack.enter_async_context(_scheduler_ctx(app))
+        yield
 
 
 BUILD_TIMESTAMP = "2026-02-22T20:00:00Z"
@@ -127,11 +317,16 @@ app = FastAPI(
     description="Esoteric Crypto Trading Intelligence Platform",
     version="0.1.0",
     lifespan=lifespan,
+    # orjson serialises the (already jsonable_encoder'd) payloads several
+    # times faster than stdlib json; large history endpoints benefit most.
+    default_response_class=ORJSONResponse,
 )
 
 # ---------------------------------------------------------------------------
 # Middleware (Starlette applies in reverse order — CORS must wrap auth)
 # ---------------------------------------------------------------------------
+# Innermost, so it hashes the route's own body and never sees a 401.
+app.add_middleware(ETagMiddleware)
 app.add_middleware(AuthMiddleware)
 app.add_middleware(
     CORSMiddleware,
@@ -140,6 +335,10 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# GZip is added last so it sits outermost and sees every response body.
+# The 1000-row history payloads are repetitive JSON and shrink several-fold;
+# level 6 gets most of level 9's ratio for a fraction of the CPU.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
 
 # ---------------------------------------------------------------------------
 # Routers
@@ -161,41 +360,52 @@ app.include_router(interpretation.router)
 app.include_router(xai.router)
 
 
-@app.post("/api/bootstrap", tags=["admin"])
-def bootstrap(
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
-):
-    """Trigger the initial data backfill and TA computation.
+# Last known state of each background bootstrap run, keyed by phase. Kept in
+# process memory (per worker); poll it via GET /api/bootstrap/status.
+_bootstrap_jobs: dict[str, dict] = {}
+_bootstrap_lock = threading.Lock()
 
-    Runs synchronously — can take 10-20 minutes for large backfills.
-    Monitor progress via server logs.
+
+def _run_bootstrap_job(job: dict, phase: str, run: Callable[[sessionmaker], dict]) -> None:
+    """Run a queued bootstrap and record the outcome on its job entry.
+
+    The runner opens a short-lived BulkSessionLocal session per unit of
+    work, so no connection is pinned for the whole (multi-minute) run.
     """
+    job.update(status="running", started_at=datetime.now(timezone.utc).isoformat())
     try:
-        from app.services.seed import run_bootstrap
-
-        result = run_bootstrap(db)
-        return {"status": "complete", **result}
+        result = run(BulkSessionLocal)
+        job.update(result)
+        job["status"] = "complete"
     except Exception as e:
-        logger.exception("Phase 1 bootstrap failed")
-        return {"status": "error", "error": str(e), "traceback": traceback.format_exc()}
+        logger.exception("%s bootstrap failed", phase)
+        job.update(status="error", error=str(e), traceback=traceback.format_exc())
+    finally:
+        job["finished_at"] = datetime.now(timezone.utc).isoformat()
 
 
-@app.post("/api/bootstrap/phase2", tags=["admin"])
-def bootstrap_phase2(db: Session = Depends(get_db)):
-    """Trigger Phase 2 bootstrap: seed gematria, 47-day cycle, backfill celestial + numerology.
+def _start_bootstrap_job(
+    background_tasks: BackgroundTasks, phase: str, run: Callable[[sessionmaker], dict],
+) -> dict | JSONResponse:
+    """Queue a bootstrap to run after the response, unless one is in flight.
 
-    This can take several minutes for the full date range backfill.
-    Monitor progress via server logs.
+    The job is recorded as queued before the task is scheduled, so a second
+    trigger that arrives before the first task starts is rejected too.
     """
-    try:
-        from app.services.phase2_seed import run_phase2_bootstrap
+    with _bootstrap_lock:
+        status = _bootstrap_jobs.get(phase, {}).get("status")
+        if status in ("queued", "running"):
+            return JSONResponse(status_code=409, content={"status": status, "job": phase})
+        job = {"status": "queued", "queued_at": datetime.now(timezone.utc).isoformat()}
+        _bootstrap_jobs[phase] = job
+    background_tasks.add_task(_run_bootstrap_job, job, phase, run)
+    return {"status": "accepted", "job": phase}
 
-        result = run_phase2_bootstrap(db)
-        return {"status": "complete", **result}
-    except Exception as e:
-        logger.exception("Phase 2 bootstrap failed")
-        return {"status": "error", "error": str(e), "traceback": traceback.format_exc()}
+
+@app.get("/api/bootstrap/status", tags=["admin"])
+def bootstrap_status():
+    """Report the state of background bootstrap jobs started by this worker."""
+    return _bootstrap_jobs
 
 
 @app.post("/api/migrate", tags=["admin"])
@@ -213,74 +423,53 @@ def run_migrations():
         return {"status": "error", "error": str(e), "traceback": traceback.format_exc()}
 
 
-@app.post("/api/bootstrap/phase3", tags=["admin"])
-def bootstrap_phase3(db: Session = Depends(get_db)):
-    """Trigger Phase 3 bootstrap: seed weights, backfill sentiment, compute confluence, run backtest.
-
-    This can take several minutes depending on data volume.
-    Monitor progress via server logs.
-    """
-    try:
-        from app.services.phase3_seed import run_phase3_bootstrap
-
-        result = run_phase3_bootstrap(db)
-        return {"status": "complete", **result}
-    except Exception as e:
-        logger.exception("Phase 3 bootstrap failed")
-        return {"status": "error", "error": str(e), "traceback": traceback.format_exc()}
-
-
-@app.post("/api/bootstrap/phase4", tags=["admin"])
-def bootstrap_phase4(db: Session = Depends(get_db)):
-    """Trigger Phase 4 bootstrap: seed political calendar, fetch initial news, compute signal.
+# Bootstrap runner per phase, as "module:function". Resolved on demand, so
+# a phase's service module (and its fetch clients) is only imported once
+# that phase is triggered.
+BOOTSTRAP_RUNNERS = {
+    "phase1": "app.services.seed:run_bootstrap",
+    "phase2": "app.services.phase2_seed:run_phase2_bootstrap",
+    "phase3": "app.services.phase3_seed:run_phase3_bootstrap",
+    "phase4": "app.services.phase4_seed:run_phase4_bootstrap",
+    "phase5": "app.services.phase5_seed:run_phase5_bootstrap",
+    "phase6": "app.services.phase6_seed:run_phase6_bootstrap",
+}
+BootstrapPhase = Literal["phase1", "phase2", "phase3", "phase4", "phase5", "phase6"]
 
-    Requires no API keys for basic operation (RSS feeds).
-    NewsAPI/GNews/Claude classification require respective API keys.
-    Monitor progress via server logs.
-    """
-    try:
-        from app.services.phase4_seed import run_phase4_bootstrap
 
-        result = run_phase4_bootstrap(db)
-        return {"status": "complete", **result}
-    except Exception as e:
-        logger.exception("Phase 4 bootstrap failed")
-        return {"status": "error", "error": str(e), "traceback": traceback.format_exc()}
+def _load_runner(phase: str) -> Callable[[sessionmaker], dict]:
+    module, _, name = BOOTSTRAP_RUNNERS[phase].partition(":")
+    return getattr(importlib.import_module(module), name)
 
 
-@app.post("/api/bootstrap/phase5", tags=["admin"])
-def bootstrap_phase5(db: Session = Depends(get_db)):
-    """Trigger Phase 5 bootstrap: Macro Liquidity (Layer 7).
+@app.post("/api/bootstrap", tags=["admin"], status_code=202)
+def bootstrap(background_tasks: BackgroundTasks):
+    """Trigger the initial data backfill and TA computation (phase 1).
 
-    Backfills FRED (1yr), forex (90d), CFTC COT (52wk), EIA (2yr),
-    seeds weight profile, adds macro calendar events, computes initial signal.
-    Requires FRED_API_KEY at minimum. Optional: TWELVE_DATA_API_KEY, EIA_API_KEY.
+    Runs in the background — can take 10-20 minutes for large backfills.
+    Poll GET /api/bootstrap/status or monitor server logs.
     """
-    try:
-        from app.services.phase5_seed import run_phase5_bootstrap
+    return _start_bootstrap_job(background_tasks, "phase1", _load_runner("phase1"))
 
-        result = run_phase5_bootstrap(db)
-        return {"status": "complete", **result}
-    except Exception as e:
-        logger.exception("Phase 5 bootstrap failed")
-        return {"status": "error", "error": str(e), "traceback": traceback.format_exc()}
 
+@app.post("/api/bootstrap/{phase}", tags=["admin"], status_code=202)
+def bootstrap_phase(phase: BootstrapPhase, background_tasks: BackgroundTasks):
+    """Trigger one bootstrap phase in the background.
 
-@app.post("/api/bootstrap/phase6", tags=["admin"])
-def bootstrap_phase6(db: Session = Depends(get_db)):
-    """Trigger Phase 6 bootstrap: XRP Adoption Intelligence (XAI).
+    - phase1: seed symbols, backfill candles, compute TA, detect events.
+    - phase2: seed gematria, 47-day cycle, backfill celestial + numerology.
+    - phase3: seed weights, backfill sentiment, compute confluence, run backtest.
+    - phase4: seed political calendar, fetch initial news, compute signal.
+      RSS works without keys; NewsAPI/GNews/Claude need their API keys.
+    - phase5: Macro Liquidity (Layer 7) — FRED (1yr), forex (90d), CFTC COT
+      (52wk), EIA (2yr), weight profile, macro calendar, initial signal.
+      Requires FRED_API_KEY; TWELVE_DATA_API_KEY and EIA_API_KEY optional.
+    - phase6: XRP Adoption Intelligence — seed partnerships, entities and
+      event calendar, fetch XRPL data, compute the XAI composite.
 
-    Seeds known partnerships, tracked entities, institutional event calendar,
-    then fetches initial XRPL data and computes XAI composite score.
+    Each phase takes minutes; poll GET /api/bootstrap/status.
     """
-    try:
-        from app.services.phase6_seed import run_phase6_bootstrap
-
-        result = run_phase6_bootstrap(db)
-        return {"status": "complete", **result}
-    except Exception as e:
-        logger.exception("Phase 6 bootstrap failed")
-        return {"status": "error", "error": str(e), "traceback": traceback.format_exc()}
+    return _start_bootstrap_job(background_tasks, phase, _load_runner(phase))
 
 
 # ---------------------------------------------------------------------------
@@ -293,16 +482,9 @@ if FRONTEND_DIST.is_dir():
     # Mount static assets (JS, CSS, images) under /assets
     app.mount(
         "/assets",
-        StaticFiles(directory=str(FRONTEND_DIST / "assets")),
+        ImmutableStaticFiles(directory=str(FRONTEND_DIST / "assets")),
         name="frontend-assets",
     )
 
-    @app.get("/{full_path:path}")
-    async def serve_spa(full_path: str):
-        """Serve the SPA index.html for all non-API, non-asset routes."""
-        # Try to serve a static file first (e.g. favicon.ico)
-        file_path = FRONTEND_DIST / full_path
-        if full_path and file_path.is_file():
-            return FileResponse(str(file_path))
-        # Fall back to index.html for client-side routing
-        return FileResponse(str(FRONTEND_DIST / "index.html"))
+    # SPA fallback for every path no route above matched
+    app.mount("/", SPAFiles(FRONTEND_DIST), name="frontend")
@@ -1,69 +1,52 @@
-"""SQLAlchemy models package. Import all models here for Alembic discovery."""
+"""SQLAlchemy models package.
 
-from app.models.alerts import Alerts
-from app.models.celestial_state import CelestialState
-from app.models.macro_liquidity import (
-    CarryTradeData,
-    LiquidityData,
-    MacroLiquiditySignal,
-    MacroPrices,
-    OilData,
-    RateData,
-)
-from app.models.confluence_scores import ConfluenceScores
-from app.models.custom_cycles import CustomCycles
-from app.models.gematria_values import GematriaValues
-from app.models.historical_events import HistoricalEvents
-from app.models.numerology_daily import NumerologyDaily
-from app.models.onchain_metrics import OnchainMetrics
-from app.models.political_calendar import PoliticalCalendar
-from app.models.political_news import PoliticalNews
-from app.models.political_signal import PoliticalSignal
-from app.models.price_data import PriceData
-from app.models.sentiment_data import SentimentData
-from app.models.signal_weights import SignalWeights
-from app.models.ta_indicators import TAIndicators
-from app.models.user import User
-from app.models.watched_symbols import WatchedSymbols
-from app.models.xai import (
-    XaiComposite,
-    XaiEventCalendar,
-    XaiOnchainMetrics,
-    XaiPartnership,
-    XaiPersonnelIntelligence,
-    XaiPolicyEvent,
-    XaiTrackedEntity,
-)
+Models are imported lazily on first attribute access (PEP 562), so importing
+one model module does not construct every mapped class. Alembic imports
+``app.models.all`` to register the full metadata.
+"""
 
-__all__ = [
-    "Alerts",
-    "CarryTradeData",
-    "CelestialState",
-    "ConfluenceScores",
-    "CustomCycles",
-    "GematriaValues",
-    "HistoricalEvents",
-    "LiquidityData",
-    "MacroLiquiditySignal",
-    "MacroPrices",
-    "NumerologyDaily",
-    "OilData",
-    "OnchainMetrics",
-    "PoliticalCalendar",
-    "PoliticalNews",
-    "PoliticalSignal",
-    "PriceData",
-    "RateData",
-    "SentimentData",
-    "SignalWeights",
-    "TAIndicators",
-    "User",
-    "WatchedSymbols",
-    "XaiComposite",
-    "XaiEventCalendar",
-    "XaiOnchainMetrics",
-    "XaiPartnership",
-    "XaiPersonnelIntelligence",
-    "XaiPolicyEvent",
-    "XaiTrackedEntity",
-]
+import importlib
+from typing import Any
+
+# Public model name -> submodule that defines it.
+_MODEL_MODULES = {
+    "Alerts": "alerts",
+    "CarryTradeData": "macro_liquidity",
+    "CelestialState": "celestial_state",
+    "ConfluenceScores": "confluence_scores",
+    "CustomCycles": "custom_cycles",
+    "GematriaValues": "gematria_values",
+    "HistoricalEvents": "historical_events",
+    "LiquidityData": "macro_liquidity",
+    "MacroLiquiditySignal": "macro_liquidity",
+    "MacroPrices": "macro_liquidity",
+    "NumerologyDaily": "numerology_daily",
+    "OilData": "macro_liquidity",
+    "OnchainMetrics": "onchain_metrics",
+    "PoliticalCalendar": "political_calendar",
+    "PoliticalNews": "political_news",
+    "PoliticalSignal": "political_signal",
+    "PriceData": "price_data",
+    "RateData": "macro_liquidity",
+    "SentimentData": "sentiment_data",
+    "SignalWeights": "signal_weights",
+    "TAIndicators": "ta_indicators",
+    "User": "user",
+    "WatchedSymbols": "watched_symbols",
+    "XaiComposite": "xai",
+    "XaiEventCalendar": "xai",
+    "XaiOnchainMetrics": "xai",
+    "XaiPartnership": "xai",
+    "XaiPersonnelIntelligence": "xai",
+    "XaiPolicyEvent": "xai",
+    "XaiTrackedEntity": "xai",
+}
+
+__all__ = sorted(_MODEL_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODEL_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{module}"), name)
@@ -3,7 +3,8 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import DECIMAL, Integer, JSON, String, Text, func
+from sqlalchemy import DateTime, DECIMAL, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -13,17 +14,24 @@ class Alerts(Base):
     __tablename__ = "alerts"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
-    triggered_at: Mapped[datetime | None]
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    triggered_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     symbol: Mapped[str] = mapped_column(String(20), nullable=False)
     alert_type: Mapped[str] = mapped_column(String(30), nullable=False)
     severity: Mapped[str] = mapped_column(String(10), nullable=False)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
 
-    trigger_data: Mapped[dict | None] = mapped_column(JSON)
+    trigger_data: Mapped[dict | None] = mapped_column(JSONB)
     composite_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
-    aligned_layers: Mapped[dict | None] = mapped_column(JSON)
+    aligned_layers: Mapped[dict | None] = mapped_column(JSONB)
 
     status: Mapped[str] = mapped_column(String(20), default="active")
-    acknowledged_at: Mapped[datetime | None]
+    acknowledged_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index("idx_alerts_status_created", "status", "created_at"),
+        Index("idx_alerts_symbol_status_created", "symbol", "status", "created_at"),
+    )
@@ -0,0 +1,70 @@
+"""Import every model so Base.metadata is complete (Alembic autogenerate)."""
+
+
+from app.models.alerts import Alerts
+from app.models.celestial_state import CelestialState
+from app.models.macro_liquidity import (
+    CarryTradeData,
+    LiquidityData,
+    MacroLiquiditySignal,
+    MacroPrices,
+    OilData,
+    RateData,
+)
+from app.models.confluence_scores import ConfluenceScores
+from app.models.custom_cycles import CustomCycles
+from app.models.gematria_values import GematriaValues
+from app.models.historical_events import HistoricalEvents
+from app.models.numerology_daily import NumerologyDaily
+from app.models.onchain_metrics import OnchainMetrics
+from app.models.political_calendar import PoliticalCalendar
+from app.models.political_news import PoliticalNews
+from app.models.political_signal import PoliticalSignal
+from app.models.price_data import PriceData
+from app.models.sentiment_data import SentimentData
+from app.models.signal_weights import SignalWeights
+from app.models.ta_indicators import TAIndicators
+from app.models.user import User
+from app.models.watched_symbols import WatchedSymbols
+from app.models.xai import (
+    XaiComposite,
+    XaiEventCalendar,
+    XaiOnchainMetrics,
+    XaiPartnership,
+    XaiPersonnelIntelligence,
+    XaiPolicyEvent,
+    XaiTrackedEntity,
+)
+
+__all__ = [
+    "Alerts",
+    "CarryTradeData",
+    "CelestialState",
+    "ConfluenceScores",
+    "CustomCycles",
+    "GematriaValues",
+    "HistoricalEvents",
+    "LiquidityData",
+    "MacroLiquiditySignal",
+    "MacroPrices",
+    "NumerologyDaily",
+    "OilData",
+    "OnchainMetrics",
+    "PoliticalCalendar",
+    "PoliticalNews",
+    "PoliticalSignal",
+    "PriceData",
+    "RateData",
+    "SentimentData",
+    "SignalWeights",
+    "TAIndicators",
+    "User",
+    "WatchedSymbols",
+    "XaiComposite",
+    "XaiEventCalendar",
+    "XaiOnchainMetrics",
+    "XaiPartnership",
+    "XaiPersonnelIntelligence",
+    "XaiPolicyEvent",
+    "XaiTrackedEntity",
+]
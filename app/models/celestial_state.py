@@ -3,7 +3,8 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import BigInteger, Boolean, DECIMAL, Integer, JSON, String
+from sqlalchemy import BigInteger, Boolean, DateTime, DECIMAL, Integer, REAL, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -13,7 +14,7 @@ class CelestialState(Base):
     __tablename__ = "celestial_state"
 
     id: Mapped[int] = mapped_column(BigInteger, autoincrement=True)
-    timestamp: Mapped[datetime] = mapped_column(primary_key=True)
+    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
 
     # Lunar
     lunar_phase_angle: Mapped[Decimal | None] = mapped_column(DECIMAL(8, 4))
@@ -42,8 +43,8 @@ class CelestialState(Base):
     saturn_longitude: Mapped[Decimal | None] = mapped_column(DECIMAL(8, 4))
 
     # Aspects and ingresses
-    active_aspects: Mapped[dict | None] = mapped_column(JSON, default=list)
-    ingresses: Mapped[dict | None] = mapped_column(JSON, default=list)
+    active_aspects: Mapped[dict | None] = mapped_column(JSONB, default=list)
+    ingresses: Mapped[dict | None] = mapped_column(JSONB, default=list)
 
     # Composite
-    celestial_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
+    celestial_score: Mapped[float | None] = mapped_column(REAL)
@@ -1,9 +1,9 @@
 """Confluence scores model."""
 
 from datetime import datetime
-from decimal import Decimal
 
-from sqlalchemy import BigInteger, DECIMAL, Integer, JSON, String
+from sqlalchemy import BigInteger, Index, Integer, REAL, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -17,19 +17,23 @@ class ConfluenceScores(Base):
     symbol: Mapped[str] = mapped_column(String(20), primary_key=True)
     timeframe: Mapped[str] = mapped_column(String(5), primary_key=True)
 
-    ta_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
-    onchain_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
-    celestial_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
-    numerology_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
-    sentiment_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
-    political_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
-    macro_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
-    xai_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
+    ta_score: Mapped[float | None] = mapped_column(REAL)
+    onchain_score: Mapped[float | None] = mapped_column(REAL)
+    celestial_score: Mapped[float | None] = mapped_column(REAL)
+    numerology_score: Mapped[float | None] = mapped_column(REAL)
+    sentiment_score: Mapped[float | None] = mapped_column(REAL)
+    political_score: Mapped[float | None] = mapped_column(REAL)
+    macro_score: Mapped[float | None] = mapped_column(REAL)
+    xai_score: Mapped[float | None] = mapped_column(REAL)
 
-    weights: Mapped[dict] = mapped_column(JSON, nullable=False)
+    weights: Mapped[dict] = mapped_column(JSONB, nullable=False)
 
-    composite_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
+    composite_score: Mapped[float | None] = mapped_column(REAL)
     signal_strength: Mapped[str | None] = mapped_column(String(10))
 
-    aligned_layers: Mapped[dict | None] = mapped_column(JSON)
+    aligned_layers: Mapped[dict | None] = mapped_column(JSONB)
     alignment_count: Mapped[int | None] = mapped_column(Integer)
+
+    __table_args__ = (
+        Index("idx_confluence_symbol_tf_time", "symbol", "timeframe", "timestamp"),
+    )
@@ -4,8 +4,9 @@ from datetime import datetime
 from decimal import Decimal
 
 from sqlalchemy import (
-    Boolean, DECIMAL, Index, Integer, JSON, String, Text, func,
+    Boolean, DateTime, DECIMAL, Index, Integer, String, Text, func,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -15,7 +16,7 @@ class HistoricalEvents(Base):
     __tablename__ = "historical_events"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    timestamp: Mapped[datetime] = mapped_column(nullable=False)
+    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     symbol: Mapped[str] = mapped_column(String(20), nullable=False)
     event_type: Mapped[str] = mapped_column(String(30), nullable=False)
     magnitude_pct: Mapped[Decimal | None] = mapped_column(DECIMAL(10, 4))
@@ -28,10 +29,10 @@ class HistoricalEvents(Base):
 
     lunar_phase_name: Mapped[str | None] = mapped_column(String(20))
     mercury_retrograde: Mapped[bool | None] = mapped_column(Boolean)
-    active_aspects_snapshot: Mapped[dict | None] = mapped_column(JSON)
+    active_aspects_snapshot: Mapped[dict | None] = mapped_column(JSONB)
 
     date_universal_number: Mapped[int | None] = mapped_column(Integer)
-    active_cycle_alignments: Mapped[dict | None] = mapped_column(JSON)
+    active_cycle_alignments: Mapped[dict | None] = mapped_column(JSONB)
 
     notes: Mapped[str | None] = mapped_column(Text)
     created_at: Mapped[datetime] = mapped_column(server_default=func.now())
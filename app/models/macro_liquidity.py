@@ -9,7 +9,8 @@ Schema matches CryptoOracle_MVP_PRD Layer 7 brief Section 6.
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import BigInteger, DECIMAL, Index, Integer, JSON, String
+from sqlalchemy import BigInteger, DECIMAL, Integer, REAL, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -32,10 +33,6 @@ class LiquidityData(Base):
     reverse_repo: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 4))
     net_liquidity: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 4))
 
-    __table_args__ = (
-        Index("idx_liquidity_ts", "timestamp"),
-    )
-
 
 # ---------- Treasury yields / rates (FRED) ----------
 
@@ -54,10 +51,6 @@ class RateData(Base):
     t5yie: Mapped[Decimal | None] = mapped_column(DECIMAL(8, 4))
     cpi_yoy: Mapped[Decimal | None] = mapped_column(DECIMAL(8, 4))
 
-    __table_args__ = (
-        Index("idx_rate_ts", "timestamp"),
-    )
-
 
 # ---------- Dollar index + VIX (FRED) ----------
 
@@ -72,10 +65,6 @@ class MacroPrices(Base):
     dxy_index: Mapped[Decimal | None] = mapped_column(DECIMAL(10, 4))
     vix: Mapped[Decimal | None] = mapped_column(DECIMAL(10, 4))
 
-    __table_args__ = (
-        Index("idx_macroprices_ts", "timestamp"),
-    )
-
 
 # ---------- Carry trade / forex (Twelve Data + CFTC) ----------
 
@@ -98,10 +87,6 @@ class CarryTradeData(Base):
 
     carry_stress_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
 
-    __table_args__ = (
-        Index("idx_carry_ts", "timestamp"),
-    )
-
 
 # ---------- Oil prices + inventory (FRED + EIA) ----------
 
@@ -119,10 +104,6 @@ class OilData(Base):
     crude_inventory: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 4))
     inventory_change: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 4))
 
-    __table_args__ = (
-        Index("idx_oil_ts", "timestamp"),
-    )
-
 
 # ---------- Computed composite signal ----------
 
@@ -135,18 +116,18 @@ class MacroLiquiditySignal(Base):
     timestamp: Mapped[datetime] = mapped_column(primary_key=True)
 
     # Sub-signal scores (each -1.0 to +1.0)
-    liquidity_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
-    treasury_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
-    dollar_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
-    oil_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
-    carry_trade_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
+    liquidity_score: Mapped[float | None] = mapped_column(REAL)
+    treasury_score: Mapped[float | None] = mapped_column(REAL)
+    dollar_score: Mapped[float | None] = mapped_column(REAL)
+    oil_score: Mapped[float | None] = mapped_column(REAL)
+    carry_trade_score: Mapped[float | None] = mapped_column(REAL)
 
     # Composite
-    macro_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
+    macro_score: Mapped[float | None] = mapped_column(REAL)
 
     # Regime classification
     regime: Mapped[str | None] = mapped_column(String(30))
-    regime_confidence: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
+    regime_confidence: Mapped[float | None] = mapped_column(REAL)
 
     # Key data points snapshot (for display without extra queries)
     net_liquidity: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 4))
@@ -159,8 +140,4 @@ class MacroLiquiditySignal(Base):
     carry_stress: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
 
     # Sub-signal detail JSON for frontend
-    sub_signals: Mapped[dict | None] = mapped_column(JSON)
-
-    __table_args__ = (
-        Index("idx_macro_signal_ts", "timestamp"),
-    )
+    sub_signals: Mapped[dict | None] = mapped_column(JSONB)
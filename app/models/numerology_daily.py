@@ -3,7 +3,8 @@
 import datetime as dt
 from decimal import Decimal
 
-from sqlalchemy import BigInteger, Boolean, DECIMAL, Date, Integer, JSON
+from sqlalchemy import BigInteger, Boolean, DECIMAL, Date, Integer
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -20,9 +21,9 @@ class NumerologyDaily(Base):
     master_number_value: Mapped[int | None] = mapped_column(Integer)
     universal_day_number: Mapped[int | None] = mapped_column(Integer)
 
-    active_cycles: Mapped[dict | None] = mapped_column(JSON, default=dict)
+    active_cycles: Mapped[dict | None] = mapped_column(JSONB, default=dict)
     cycle_confluence_count: Mapped[int] = mapped_column(Integer, default=0)
 
-    price_47_appearances: Mapped[dict | None] = mapped_column(JSON, default=list)
+    price_47_appearances: Mapped[dict | None] = mapped_column(JSONB, default=list)
 
     numerology_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
@@ -3,7 +3,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import BigInteger, DECIMAL, Integer, String
+from sqlalchemy import BigInteger, DECIMAL, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -31,3 +31,7 @@ class OnchainMetrics(Base):
     sopr: Mapped[Decimal | None] = mapped_column(DECIMAL(10, 6))
 
     onchain_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
+
+    __table_args__ = (
+        Index("idx_onchain_symbol_time", "symbol", "timestamp"),
+    )
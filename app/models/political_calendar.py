@@ -4,8 +4,10 @@ import datetime as dt
 from decimal import Decimal
 
 from sqlalchemy import (
-    Boolean, DECIMAL, Date, Index, Integer, JSON, String, Text, UniqueConstraint, func,
+    Boolean, DECIMAL, Date, FetchedValue, Index, Integer, String, Text, UniqueConstraint,
+    func,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -31,8 +33,8 @@ class PoliticalCalendar(Base):
     actual_price_impact_pct: Mapped[Decimal | None] = mapped_column(DECIMAL(10, 4))
 
     date_gematria_value: Mapped[int | None] = mapped_column(Integer)
-    key_figure_gematria: Mapped[dict | None] = mapped_column(JSON)
-    event_title_gematria: Mapped[dict | None] = mapped_column(JSON)
+    key_figure_gematria: Mapped[dict | None] = mapped_column(JSONB)
+    event_title_gematria: Mapped[dict | None] = mapped_column(JSONB)
 
     source_url: Mapped[str | None] = mapped_column(Text)
     source_name: Mapped[str | None] = mapped_column(String(100))
@@ -41,7 +43,7 @@ class PoliticalCalendar(Base):
 
     created_at: Mapped[dt.datetime] = mapped_column(server_default=func.now())
     updated_at: Mapped[dt.datetime] = mapped_column(
-        server_default=func.now(), onupdate=func.now()
+        server_default=func.now(), server_onupdate=FetchedValue()
     )
 
     __table_args__ = (
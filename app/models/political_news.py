@@ -3,7 +3,8 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import BigInteger, DECIMAL, Index, Integer, JSON, String, Text
+from sqlalchemy import BigInteger, DECIMAL, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -30,8 +31,8 @@ class PoliticalNews(Base):
     sentiment_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
     urgency_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
 
-    entities: Mapped[dict | None] = mapped_column(JSON)
-    headline_gematria: Mapped[dict | None] = mapped_column(JSON)
+    entities: Mapped[dict | None] = mapped_column(JSONB)
+    headline_gematria: Mapped[dict | None] = mapped_column(JSONB)
 
     mention_velocity: Mapped[int | None] = mapped_column(Integer)
     mention_velocity_1h: Mapped[int | None] = mapped_column(Integer)
@@ -1,9 +1,8 @@
 """Aggregated political signal model."""
 
 from datetime import datetime
-from decimal import Decimal
 
-from sqlalchemy import BigInteger, DECIMAL, Integer, String
+from sqlalchemy import BigInteger, Integer, REAL, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -23,12 +22,12 @@ class PoliticalSignal(Base):
 
     news_volume_1h: Mapped[int | None] = mapped_column(Integer)
     news_volume_24h: Mapped[int | None] = mapped_column(Integer)
-    avg_news_sentiment_1h: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
-    avg_news_sentiment_24h: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
-    max_urgency_1h: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
+    avg_news_sentiment_1h: Mapped[float | None] = mapped_column(REAL)
+    avg_news_sentiment_24h: Mapped[float | None] = mapped_column(REAL)
+    max_urgency_1h: Mapped[float | None] = mapped_column(REAL)
 
     dominant_narrative: Mapped[str | None] = mapped_column(String(100))
-    narrative_strength: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
+    narrative_strength: Mapped[float | None] = mapped_column(REAL)
     narrative_direction: Mapped[str | None] = mapped_column(String(10))
 
-    political_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
+    political_score: Mapped[float | None] = mapped_column(REAL)
@@ -1,9 +1,8 @@
 """OHLCV price data model."""
 
 from datetime import datetime
-from decimal import Decimal
 
-from sqlalchemy import BigInteger, DECIMAL, Index, String
+from sqlalchemy import BigInteger, DOUBLE_PRECISION, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -17,12 +16,19 @@ class PriceData(Base):
     symbol: Mapped[str] = mapped_column(String(20), primary_key=True)
     exchange: Mapped[str] = mapped_column(String(30), primary_key=True)
     timeframe: Mapped[str] = mapped_column(String(5), primary_key=True)
-    open: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    high: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    low: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    close: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    volume: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
+    open: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    high: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    low: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    close: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    volume: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
 
     __table_args__ = (
-        Index("idx_price_symbol_time", "symbol", "timestamp"),
+        # Covering: candle-range reads by symbol/timeframe are index-only.
+        Index(
+            "idx_price_symbol_tf_time",
+            "symbol",
+            "timeframe",
+            "timestamp",
+            postgresql_include=["open", "high", "low", "close", "volume"],
+        ),
     )
@@ -1,9 +1,8 @@
 """Sentiment data model."""
 
 from datetime import datetime
-from decimal import Decimal
 
-from sqlalchemy import BigInteger, DECIMAL, Integer, String
+from sqlalchemy import BigInteger, Index, Integer, REAL, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -20,9 +19,13 @@ class SentimentData(Base):
     fear_greed_label: Mapped[str | None] = mapped_column(String(20))
 
     social_volume: Mapped[int | None] = mapped_column(Integer)
-    social_sentiment: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
+    social_sentiment: Mapped[float | None] = mapped_column(REAL)
     social_source: Mapped[str | None] = mapped_column(String(20))
 
     google_trends_score: Mapped[int | None] = mapped_column(Integer)
 
-    sentiment_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
+    sentiment_score: Mapped[float | None] = mapped_column(REAL)
+
+    __table_args__ = (
+        Index("idx_sentiment_symbol_time", "symbol", "timestamp"),
+    )
@@ -3,7 +3,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import Boolean, DECIMAL, Integer, String, func
+from sqlalchemy import Boolean, DECIMAL, FetchedValue, Index, Integer, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -27,5 +27,12 @@ class SignalWeights(Base):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        server_default=func.now(), onupdate=func.now()
+        server_default=func.now(), server_onupdate=FetchedValue()
+    )
+
+    __table_args__ = (
+        Index(
+            "idx_signal_weights_active", "profile_name",
+            postgresql_where=text("is_active = true"),
+        ),
     )
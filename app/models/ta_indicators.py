@@ -1,9 +1,8 @@
 """Technical analysis indicators model."""
 
 from datetime import datetime
-from decimal import Decimal
 
-from sqlalchemy import BigInteger, DECIMAL, String
+from sqlalchemy import BigInteger, DOUBLE_PRECISION, Index, REAL, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -18,35 +17,39 @@ class TAIndicators(Base):
     timeframe: Mapped[str] = mapped_column(String(5), primary_key=True)
 
     # Momentum
-    rsi_14: Mapped[Decimal | None] = mapped_column(DECIMAL(10, 4))
-    rsi_7: Mapped[Decimal | None] = mapped_column(DECIMAL(10, 4))
-    macd_line: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    macd_signal: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    macd_histogram: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    stoch_k: Mapped[Decimal | None] = mapped_column(DECIMAL(10, 4))
-    stoch_d: Mapped[Decimal | None] = mapped_column(DECIMAL(10, 4))
+    rsi_14: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    rsi_7: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    macd_line: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    macd_signal: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    macd_histogram: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    stoch_k: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    stoch_d: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
 
     # Trend
-    sma_20: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    sma_50: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    sma_200: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    ema_12: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    ema_26: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
+    sma_20: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    sma_50: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    sma_200: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    ema_12: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    ema_26: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
 
     # Volatility
-    bb_upper: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    bb_middle: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    bb_lower: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    atr_14: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
+    bb_upper: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    bb_middle: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    bb_lower: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    atr_14: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
 
     # Fibonacci
-    fib_0: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    fib_236: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    fib_382: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    fib_500: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    fib_618: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    fib_786: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
-    fib_1000: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 8))
+    fib_0: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    fib_236: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    fib_382: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    fib_500: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    fib_618: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    fib_786: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
+    fib_1000: Mapped[float | None] = mapped_column(DOUBLE_PRECISION)
 
     # Composite
-    ta_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
+    ta_score: Mapped[float | None] = mapped_column(REAL)
+
+    __table_args__ = (
+        Index("idx_ta_symbol_tf_time", "symbol", "timeframe", "timestamp"),
+    )
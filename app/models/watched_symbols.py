@@ -2,7 +2,8 @@
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, Integer, JSON, String, func
+from sqlalchemy import Boolean, Index, Integer, String, func, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -16,6 +17,13 @@ class WatchedSymbols(Base):
     exchange: Mapped[str] = mapped_column(String(30), default="binance")
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     timeframes: Mapped[dict] = mapped_column(
-        JSON, default=["1h", "4h", "1d"]
+        JSONB, default=["1h", "4h", "1d"]
     )
     created_at: Mapped[datetime] = mapped_column(server_default=func.now())
+
+    __table_args__ = (
+        Index(
+            "idx_watched_symbols_active", "symbol",
+            postgresql_where=text("is_active = true"),
+        ),
+    )
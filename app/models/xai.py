@@ -14,14 +14,17 @@ from sqlalchemy import (
     Date,
     DateTime,
     DECIMAL,
+    FetchedValue,
     ForeignKey,
     Index,
     Integer,
-    JSON,
+    REAL,
     String,
     Text,
     UniqueConstraint,
+    func,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -58,10 +61,6 @@ class XaiOnchainMetrics(Base):
     # Exchange reserve
     xrp_exchange_reserve: Mapped[Decimal | None] = mapped_column(DECIMAL(20, 2))
 
-    __table_args__ = (
-        Index("idx_xai_onchain_ts", "timestamp"),
-    )
-
 
 # ---------- Composite XAI scores ----------
 
@@ -73,13 +72,13 @@ class XaiComposite(Base):
     timestamp: Mapped[datetime] = mapped_column(primary_key=True)
 
     # Sub-signals (each -1.0 to +1.0)
-    policy_pipeline_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
-    partnership_deployment_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
-    onchain_utility_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
-    personnel_intelligence_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
+    policy_pipeline_score: Mapped[float | None] = mapped_column(REAL)
+    partnership_deployment_score: Mapped[float | None] = mapped_column(REAL)
+    onchain_utility_score: Mapped[float | None] = mapped_column(REAL)
+    personnel_intelligence_score: Mapped[float | None] = mapped_column(REAL)
 
     # Composite
-    xai_score: Mapped[Decimal | None] = mapped_column(DECIMAL(5, 4))
+    xai_score: Mapped[float | None] = mapped_column(REAL)
 
     # Key derived metrics
     utility_to_speculation_ratio: Mapped[Decimal | None] = mapped_column(DECIMAL(10, 6))
@@ -91,11 +90,7 @@ class XaiComposite(Base):
     adoption_phase: Mapped[str | None] = mapped_column(String(30))
 
     # Weights used
-    weights: Mapped[dict | None] = mapped_column(JSON)
-
-    __table_args__ = (
-        Index("idx_xai_composite_ts", "timestamp"),
-    )
+    weights: Mapped[dict | None] = mapped_column(JSONB)
 
 
 # ---------- Partnership pipeline ----------
@@ -105,7 +100,7 @@ class XaiPartnership(Base):
 
     __tablename__ = "xai_partnerships"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     partner_name: Mapped[str] = mapped_column(String(200), nullable=False)
     partner_type: Mapped[str] = mapped_column(String(50), nullable=False)
     country: Mapped[str | None] = mapped_column(String(50))
@@ -121,9 +116,9 @@ class XaiPartnership(Base):
     source_url: Mapped[str | None] = mapped_column(Text)
     notes: Mapped[str | None] = mapped_column(Text)
 
-    created_at: Mapped[datetime | None] = mapped_column(default=datetime.utcnow)
+    created_at: Mapped[datetime | None] = mapped_column(server_default=func.now())
     updated_at: Mapped[datetime | None] = mapped_column(
-        default=datetime.utcnow, onupdate=datetime.utcnow
+        server_default=func.now(), server_onupdate=FetchedValue()
     )
 
     __table_args__ = (
@@ -138,7 +133,7 @@ class XaiTrackedEntity(Base):
 
     __tablename__ = "xai_tracked_entities"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     entity_type: Mapped[str] = mapped_column(String(20), nullable=False)
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     role: Mapped[str | None] = mapped_column(String(300))
@@ -149,11 +144,11 @@ class XaiTrackedEntity(Base):
     cpmi_member: Mapped[bool] = mapped_column(Boolean, default=False)
     fsb_member: Mapped[bool] = mapped_column(Boolean, default=False)
 
-    watch_urls: Mapped[dict | None] = mapped_column(JSON)
-    social_handles: Mapped[dict | None] = mapped_column(JSON)
+    watch_urls: Mapped[dict | None] = mapped_column(JSONB)
+    social_handles: Mapped[dict | None] = mapped_column(JSONB)
     notes: Mapped[str | None] = mapped_column(Text)
 
-    created_at: Mapped[datetime | None] = mapped_column(default=datetime.utcnow)
+    created_at: Mapped[datetime | None] = mapped_column(server_default=func.now())
 
     __table_args__ = (
         UniqueConstraint("name", "institution", name="uq_xai_entity_name_inst"),
@@ -167,7 +162,7 @@ class XaiEventCalendar(Base):
 
     __tablename__ = "xai_event_calendar"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     event_date: Mapped[date] = mapped_column(Date, nullable=False)
     event_name: Mapped[str] = mapped_column(String(300), nullable=False)
     event_type: Mapped[str | None] = mapped_column(String(50))
@@ -178,9 +173,7 @@ class XaiEventCalendar(Base):
     recurrence_pattern: Mapped[str | None] = mapped_column(String(50))
     source_url: Mapped[str | None] = mapped_column(Text)
 
-    created_at: Mapped[datetime | None] = mapped_column(
-        default=datetime.utcnow
-    )
+    created_at: Mapped[datetime | None] = mapped_column(server_default=func.now())
 
     __table_args__ = (
         UniqueConstraint("event_date", "event_name", name="uq_xai_event_date_name"),
@@ -211,7 +204,7 @@ class XaiPolicyEvent(Base):
     xrp_mentioned: Mapped[bool] = mapped_column(Boolean, default=False)
     policy_impact_score: Mapped[Decimal | None] = mapped_column(DECIMAL(4, 2))
 
-    created_at: Mapped[datetime | None] = mapped_column(default=datetime.utcnow)
+    created_at: Mapped[datetime | None] = mapped_column(server_default=func.now())
 
     __table_args__ = (
         UniqueConstraint("source", "title", name="uq_xai_policy_source_title"),
@@ -229,7 +222,7 @@ class XaiPersonnelIntelligence(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     entity_id: Mapped[int | None] = mapped_column(
-        Integer, ForeignKey("xai_tracked_entities.id"), nullable=True
+        BigInteger, ForeignKey("xai_tracked_entities.id"), nullable=True
     )
     person_name: Mapped[str] = mapped_column(String(200), nullable=False)
     role: Mapped[str | None] = mapped_column(String(300))
@@ -248,7 +241,7 @@ class XaiPersonnelIntelligence(Base):
     sentiment_score: Mapped[Decimal | None] = mapped_column(DECIMAL(4, 2))
     influence_weight: Mapped[Decimal | None] = mapped_column(DECIMAL(3, 1))
 
-    created_at: Mapped[datetime | None] = mapped_column(default=datetime.utcnow)
+    created_at: Mapped[datetime | None] = mapped_column(server_default=func.now())
 
     __table_args__ = (
         UniqueConstraint("person_name", "source_title", name="uq_xai_personnel_person_source"),
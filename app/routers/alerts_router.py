@@ -3,7 +3,8 @@
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import String, cast, select, update
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -12,6 +13,14 @@ from app.utils import normalize_symbol
 
 router = APIRouter(tags=["alerts"])
 
+# Alert columns in the API's output shape, read as plain row mappings and
+# handed straight to orjson: composite_score is rendered as text by Postgres
+# (NULL stays NULL), datetimes as ISO 8601 by orjson.
+_ALERT_COLUMNS = [
+    cast(c, String).label(c.name) if c.name == "composite_score" else c
+    for c in Alerts.__table__.c
+]
+
 
 @router.get("/api/alerts")
 def list_alerts(
@@ -20,8 +29,12 @@ def list_alerts(
     limit: int = Query(50, ge=1, le=500),
     db: Session = Depends(get_db),
 ):
-    """List alerts filtered by status and optional symbol."""
-    query = select(Alerts)
+    """List alerts filtered by status and optional symbol.
+
+    No ORM objects and no jsonable_encoder pass over up to 500 rows: see
+    _ALERT_COLUMNS.
+    """
+    query = select(*_ALERT_COLUMNS)
 
     if status != "all":
         query = query.where(Alerts.status == status)
@@ -30,73 +43,52 @@ def list_alerts(
         query = query.where(Alerts.symbol == symbol)
 
     query = query.order_by(Alerts.created_at.desc()).limit(limit)
-    rows = db.execute(query).scalars().all()
+    rows = [dict(r) for r in db.execute(query).mappings().all()]
 
-    return {
-        "count": len(rows),
-        "alerts": [_alert_to_dict(r) for r in rows],
-    }
+    return ORJSONResponse({"count": len(rows), "alerts": rows})
 
 
 @router.get("/api/alerts/{alert_id}")
 def get_alert(alert_id: int, db: Session = Depends(get_db)):
     """Get a single alert by ID."""
     row = db.execute(
-        select(Alerts).where(Alerts.id == alert_id)
-    ).scalar_one_or_none()
+        select(*_ALERT_COLUMNS).where(Alerts.id == alert_id)
+    ).mappings().one_or_none()
 
     if row is None:
         return {"error": "Alert not found"}
 
-    return _alert_to_dict(row)
+    return ORJSONResponse(dict(row))
 
 
 @router.post("/api/alerts/{alert_id}/acknowledge")
 def acknowledge_alert(alert_id: int, db: Session = Depends(get_db)):
     """Acknowledge an active alert."""
-    row = db.execute(
-        select(Alerts).where(Alerts.id == alert_id)
-    ).scalar_one_or_none()
-
-    if row is None:
+    if not _set_status(
+        db, alert_id, status="acknowledged", acknowledged_at=datetime.now(timezone.utc)
+    ):
         return {"error": "Alert not found"}
 
-    row.status = "acknowledged"
-    row.acknowledged_at = datetime.now(timezone.utc)
-    db.commit()
-
     return {"status": "acknowledged", "alert_id": alert_id}
 
 
 @router.post("/api/alerts/{alert_id}/dismiss")
 def dismiss_alert(alert_id: int, db: Session = Depends(get_db)):
     """Dismiss an alert."""
-    row = db.execute(
-        select(Alerts).where(Alerts.id == alert_id)
-    ).scalar_one_or_none()
-
-    if row is None:
+    if not _set_status(db, alert_id, status="dismissed"):
         return {"error": "Alert not found"}
 
-    row.status = "dismissed"
-    db.commit()
-
     return {"status": "dismissed", "alert_id": alert_id}
 
 
-def _alert_to_dict(row: Alerts) -> dict:
-    return {
-        "id": row.id,
-        "created_at": row.created_at.isoformat() if row.created_at else None,
-        "triggered_at": row.triggered_at.isoformat() if row.triggered_at else None,
-        "symbol": row.symbol,
-        "alert_type": row.alert_type,
-        "severity": row.severity,
-        "title": row.title,
-        "description": row.description,
-        "composite_score": str(row.composite_score) if row.composite_score else None,
-        "aligned_layers": row.aligned_layers,
-        "trigger_data": row.trigger_data,
-        "status": row.status,
-        "acknowledged_at": row.acknowledged_at.isoformat() if row.acknowledged_at else None,
-    }
+def _set_status(db: Session, alert_id: int, **values) -> bool:
+    """UPDATE one alert in a single statement; False if no such alert."""
+    result = db.execute(
+        update(Alerts)
+        .where(Alerts.id == alert_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount > 0
+
@@ -1,14 +1,12 @@
 """Authentication API endpoints."""
 
-from datetime import datetime, timezone
-
-from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.database import get_db
-from app.services.auth_service import authenticate_user, create_access_token
+from app.services.auth_service import authenticate_user, create_access_token, record_login
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
@@ -19,16 +17,24 @@ class LoginRequest(BaseModel):
 
 
 @router.post("/login")
-def login(body: LoginRequest, response: Response, db: Session = Depends(get_db)):
-    """Authenticate and set JWT cookie."""
+def login(
+    body: LoginRequest,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
+    """Authenticate and set JWT cookie.
+
+    last_login is written after the response is sent, so the client doesn't
+    wait on that commit.
+    """
     user = authenticate_user(db, body.username, body.password)
     if user is None:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     token = create_access_token(user.username)
 
-    user.last_login = datetime.now(timezone.utc)
-    db.commit()
+    background_tasks.add_task(record_login, user.id)
 
     is_production = settings.app_env == "production"
 
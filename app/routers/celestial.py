@@ -1,57 +1,101 @@
 """Celestial state API endpoints."""
 
-from datetime import date, datetime
+from datetime import date, datetime, time
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.celestial_state import CelestialState
 from app.signals.celestial import CelestialEngine
+from app.utils import str_or_none
 
 router = APIRouter(prefix="/api/celestial", tags=["celestial"])
 
 
-def _state_to_dict(row: CelestialState) -> dict:
-    """Convert a CelestialState row to a JSON-serializable dict."""
-    return {
-        "timestamp": row.timestamp.isoformat(),
-        "lunar_phase_angle": str(row.lunar_phase_angle) if row.lunar_phase_angle else None,
-        "lunar_phase_name": row.lunar_phase_name,
-        "lunar_illumination": str(row.lunar_illumination) if row.lunar_illumination else None,
-        "days_to_next_new_moon": str(row.days_to_next_new_moon) if row.days_to_next_new_moon else None,
-        "days_to_next_full_moon": str(row.days_to_next_full_moon) if row.days_to_next_full_moon else None,
-        "is_lunar_eclipse": row.is_lunar_eclipse,
-        "is_solar_eclipse": row.is_solar_eclipse,
-        "mercury_retrograde": row.mercury_retrograde,
-        "venus_retrograde": row.venus_retrograde,
-        "mars_retrograde": row.mars_retrograde,
-        "jupiter_retrograde": row.jupiter_retrograde,
-        "saturn_retrograde": row.saturn_retrograde,
-        "retrograde_count": row.retrograde_count,
-        "sun_longitude": str(row.sun_longitude) if row.sun_longitude else None,
-        "moon_longitude": str(row.moon_longitude) if row.moon_longitude else None,
-        "mercury_longitude": str(row.mercury_longitude) if row.mercury_longitude else None,
-        "venus_longitude": str(row.venus_longitude) if row.venus_longitude else None,
-        "mars_longitude": str(row.mars_longitude) if row.mars_longitude else None,
-        "jupiter_longitude": str(row.jupiter_longitude) if row.jupiter_longitude else None,
-        "saturn_longitude": str(row.saturn_longitude) if row.saturn_longitude else None,
-        "active_aspects": row.active_aspects,
-        "ingresses": row.ingresses,
-        "celestial_score": str(row.celestial_score) if row.celestial_score else None,
-    }
+# Serialised fields in response order; the numeric ones (DECIMAL positions
+# and the REAL celestial_score) go out as strings.
+_STATE_FIELDS = (
+    "timestamp",
+    "lunar_phase_angle",
+    "lunar_phase_name",
+    "lunar_illumination",
+    "days_to_next_new_moon",
+    "days_to_next_full_moon",
+    "is_lunar_eclipse",
+    "is_solar_eclipse",
+    "mercury_retrograde",
+    "venus_retrograde",
+    "mars_retrograde",
+    "jupiter_retrograde",
+    "saturn_retrograde",
+    "retrograde_count",
+    "sun_longitude",
+    "moon_longitude",
+    "mercury_longitude",
+    "venus_longitude",
+    "mars_longitude",
+    "jupiter_longitude",
+    "saturn_longitude",
+    "active_aspects",
+    "ingresses",
+    "celestial_score",
+)
+_STR_FIELDS = frozenset({
+    "lunar_phase_angle",
+    "lunar_illumination",
+    "days_to_next_new_moon",
+    "days_to_next_full_moon",
+    "sun_longitude",
+    "moon_longitude",
+    "mercury_longitude",
+    "venus_longitude",
+    "mars_longitude",
+    "jupiter_longitude",
+    "saturn_longitude",
+    "celestial_score",
+})
+
+
+def _state_to_dict(row, fields: tuple[str, ...] = _STATE_FIELDS) -> dict:
+    """Convert a CelestialState entity or column Row to a dict.
+
+    Only ``fields`` are read, so a Row selected with a subset of columns
+    works too. The timestamp stays a datetime for orjson /
+    jsonable_encoder to render.
+    """
+    out = {}
+    for field in fields:
+        value = getattr(row, field)
+        if field in _STR_FIELDS:
+            value = str_or_none(value)
+        out[field] = value
+    return out
+
+
+def _parse_fields(fields: str | None) -> tuple[str, ...]:
+    """Resolve a ``?fields=a,b`` projection; timestamp is always included."""
+    if not fields:
+        return _STATE_FIELDS
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested.difference(_STATE_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    requested.add("timestamp")
+    return tuple(f for f in _STATE_FIELDS if f in requested)
 
 
 @router.get("/current")
 def get_current_celestial(db: Session = Depends(get_db)):
     """Get today's celestial state (compute if not cached)."""
     today = date.today()
-    today_dt = datetime(today.year, today.month, today.day)
+    today_dt = datetime.combine(today, time.min)
 
-    row = db.execute(
-        select(CelestialState).where(CelestialState.timestamp == today_dt)
-    ).scalar_one_or_none()
+    row = db.get(CelestialState, today_dt)
 
     if row is None:
         # Compute on-the-fly
@@ -67,21 +111,32 @@ def get_celestial_history(
     start: date | None = Query(None, description="Start date (YYYY-MM-DD)"),
     end: date | None = Query(None, description="End date (YYYY-MM-DD)"),
     limit: int = Query(30, ge=1, le=365),
+    fields: str | None = Query(
+        None, description="Comma-separated fields to return (default: all)",
+    ),
     db: Session = Depends(get_db),
 ):
-    """Get historical celestial state within a date range."""
-    stmt = select(CelestialState)
+    """Get historical celestial state within a date range.
+
+    Reads plain Rows (no ORM instances) and returns an ORJSONResponse,
+    skipping FastAPI's jsonable_encoder pass. ``fields`` narrows the
+    SELECT itself, so dashboards that only chart scores or retrogrades
+    never fetch the active_aspects / ingresses JSONB.
+    """
+    selected = _parse_fields(fields)
+    table = CelestialState.__table__
+    stmt = select(*(table.c[f] for f in selected))
     if start:
-        stmt = stmt.where(CelestialState.timestamp >= datetime(start.year, start.month, start.day))
+        stmt = stmt.where(CelestialState.timestamp >= datetime.combine(start, time.min))
     if end:
-        stmt = stmt.where(CelestialState.timestamp <= datetime(end.year, end.month, end.day))
+        stmt = stmt.where(CelestialState.timestamp <= datetime.combine(end, time.min))
     stmt = stmt.order_by(CelestialState.timestamp.desc()).limit(limit)
 
-    rows = db.execute(stmt).scalars().all()
-    return {
+    rows = db.execute(stmt).all()
+    return ORJSONResponse({
         "count": len(rows),
-        "data": [_state_to_dict(r) for r in reversed(rows)],
-    }
+        "data": [_state_to_dict(r, selected) for r in reversed(rows)],
+    })
 
 
 @router.get("/{target_date}")
@@ -90,11 +145,9 @@ def get_celestial_by_date(
     db: Session = Depends(get_db),
 ):
     """Get celestial state for a specific date (compute if not cached)."""
-    dt = datetime(target_date.year, target_date.month, target_date.day)
+    dt = datetime.combine(target_date, time.min)
 
-    row = db.execute(
-        select(CelestialState).where(CelestialState.timestamp == dt)
-    ).scalar_one_or_none()
+    row = db.get(CelestialState, dt)
 
     if row is None:
         engine = CelestialEngine()
@@ -4,18 +4,33 @@ from datetime import datetime
 from decimal import Decimal
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.confluence_scores import ConfluenceScores
 from app.models.signal_weights import SignalWeights
-from app.services.confluence_engine import ConfluenceEngine
-from app.utils import normalize_symbol
+from app.services.confluence_engine import ConfluenceEngine, invalidate_weights_cache
+from app.utils import normalize_symbol, str_or_none
 
 router = APIRouter(tags=["confluence"])
 
+_HISTORY_COLUMNS = [
+    ConfluenceScores.timestamp,
+    ConfluenceScores.composite_score,
+    ConfluenceScores.signal_strength,
+    ConfluenceScores.alignment_count,
+    ConfluenceScores.ta_score,
+    ConfluenceScores.celestial_score,
+    ConfluenceScores.numerology_score,
+    ConfluenceScores.sentiment_score,
+    ConfluenceScores.onchain_score,
+    ConfluenceScores.political_score,
+    ConfluenceScores.macro_score,
+]
+
 
 class WeightUpdate(BaseModel):
     ta: float = 0.20
@@ -45,12 +60,13 @@ def update_weights(body: WeightUpdate, db: Session = Depends(get_db)):
     if abs(total - 1.0) > 0.01:
         return {"error": f"Weights must sum to 1.0 (got {total:.4f})"}
 
-    # Deactivate all current profiles
-    current = db.execute(
-        select(SignalWeights).where(SignalWeights.is_active.is_(True))
-    ).scalars().all()
-    for row in current:
-        row.is_active = False
+    # Deactivate all current profiles in one statement
+    db.execute(
+        update(SignalWeights)
+        .where(SignalWeights.is_active.is_(True))
+        .values(is_active=False)
+        .execution_options(synchronize_session=False)
+    )
 
     # Create new profile
     profile = SignalWeights(
@@ -66,6 +82,7 @@ def update_weights(body: WeightUpdate, db: Session = Depends(get_db)):
     )
     db.add(profile)
     db.commit()
+    invalidate_weights_cache()
 
     return {
         "status": "updated",
@@ -126,9 +143,14 @@ def get_confluence_history(
     limit: int = Query(100, ge=1, le=1000),
     db: Session = Depends(get_db),
 ):
-    """Get historical confluence scores."""
+    """Get historical confluence scores.
+
+    Selects only the columns it returns (plain Rows, no ORM instances or
+    identity map) and returns an ORJSONResponse so the up-to-1000-row
+    payload skips FastAPI's jsonable_encoder pass.
+    """
     symbol = normalize_symbol(symbol)
-    query = select(ConfluenceScores).where(
+    query = select(*_HISTORY_COLUMNS).where(
         ConfluenceScores.symbol == symbol,
         ConfluenceScores.timeframe == timeframe,
     )
@@ -139,26 +161,26 @@ def get_confluence_history(
         query = query.where(ConfluenceScores.timestamp <= end)
 
     query = query.order_by(ConfluenceScores.timestamp.desc()).limit(limit)
-    rows = db.execute(query).scalars().all()
+    rows = db.execute(query).all()
 
-    return {
+    return ORJSONResponse({
         "symbol": symbol,
         "timeframe": timeframe,
         "count": len(rows),
         "data": [
             {
-                "timestamp": r.timestamp.isoformat(),
-                "composite_score": str(r.composite_score) if r.composite_score else None,
+                "timestamp": r.timestamp,
+                "composite_score": str_or_none(r.composite_score),
                 "signal_strength": r.signal_strength,
                 "alignment_count": r.alignment_count,
-                "ta_score": str(r.ta_score) if r.ta_score else None,
-                "celestial_score": str(r.celestial_score) if r.celestial_score else None,
-                "numerology_score": str(r.numerology_score) if r.numerology_score else None,
-                "sentiment_score": str(r.sentiment_score) if r.sentiment_score else None,
-                "onchain_score": str(r.onchain_score) if r.onchain_score else None,
-                "political_score": str(r.political_score) if r.political_score else None,
-                "macro_score": str(r.macro_score) if r.macro_score else None,
+                "ta_score": str_or_none(r.ta_score),
+                "celestial_score": str_or_none(r.celestial_score),
+                "numerology_score": str_or_none(r.numerology_score),
+                "sentiment_score": str_or_none(r.sentiment_score),
+                "onchain_score": str_or_none(r.onchain_score),
+                "political_score": str_or_none(r.political_score),
+                "macro_score": str_or_none(r.macro_score),
             }
             for r in rows
         ],
-    }
+    })
@@ -1,8 +1,10 @@
 """AI interpretation router — Claude-powered signal analysis."""
 
+import json
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -72,3 +74,37 @@ def chat_with_signals(
         "response": response_text,
         "generated_at": datetime.now(timezone.utc).isoformat(),
     }
+
+
+@router.post("/api/interpretation/{symbol}/chat/stream")
+def stream_chat_with_signals(
+    symbol: str,
+    body: ChatRequest,
+    db: Session = Depends(get_db),
+):
+    """Streaming variant of the chat endpoint, as Server-Sent Events.
+
+    Each text delta is sent as ``data: {"text": ...}`` as soon as Claude
+    produces it, followed by an ``event: done`` carrying ``generated_at``.
+    Signal context is gathered before the response starts, because the
+    request's DB session is closed before the body is sent.
+    """
+    symbol = normalize_symbol(symbol)
+    engine = InterpretationEngine()
+
+    messages = [{"role": m.role, "content": m.content} for m in body.messages]
+
+    chunks = engine.stream_chat(db, symbol, body.timeframe, messages)
+
+    def events():
+        for chunk in chunks:
+            yield f"data: {json.dumps({'text': chunk})}\n\n"
+        done = json.dumps({"generated_at": datetime.now(timezone.utc).isoformat()})
+        yield f"event: done\ndata: {done}\n\n"
+
+    # X-Accel-Buffering stops an nginx proxy from holding the stream back.
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -13,6 +13,7 @@ Per brief Section 10:
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -26,46 +27,90 @@ from app.models.macro_liquidity import (
     OilData,
     RateData,
 )
+from app.utils import TTLCache, str_or_none
 
 router = APIRouter(tags=["macro"])
 
+# Latest-signal payload. "No data yet" isn't cached, so the first computed
+# signal shows up on the next request.
+MACRO_SIGNAL_CACHE_TTL = 60.0
+_macro_signal_cache = TTLCache(MACRO_SIGNAL_CACHE_TTL)
+
+
+def invalidate_signal_cache() -> None:
+    """Drop the cached latest-signal payload."""
+    _macro_signal_cache.clear()
+
+# Columns the signal payload reads, selected as a plain Row.
+_SIGNAL_COLUMNS = [
+    MacroLiquiditySignal.timestamp,
+    MacroLiquiditySignal.macro_score,
+    MacroLiquiditySignal.regime,
+    MacroLiquiditySignal.regime_confidence,
+    MacroLiquiditySignal.liquidity_score,
+    MacroLiquiditySignal.treasury_score,
+    MacroLiquiditySignal.dollar_score,
+    MacroLiquiditySignal.oil_score,
+    MacroLiquiditySignal.carry_trade_score,
+    MacroLiquiditySignal.net_liquidity,
+    MacroLiquiditySignal.m2_yoy_pct,
+    MacroLiquiditySignal.yield_curve_2s10s,
+    MacroLiquiditySignal.dxy_value,
+    MacroLiquiditySignal.vix_value,
+    MacroLiquiditySignal.wti_price,
+    MacroLiquiditySignal.usdjpy_value,
+    MacroLiquiditySignal.carry_stress,
+    MacroLiquiditySignal.sub_signals,
+]
+
 
 @router.get("/api/macro/signal")
 def get_macro_signal(db: Session = Depends(get_db)):
-    """Get latest macro liquidity composite signal."""
+    """Get latest macro liquidity composite signal.
+
+    The signal is recomputed once a day, so the rendered payload is cached
+    for MACRO_SIGNAL_CACHE_TTL seconds. On a miss only the columns the
+    payload uses are selected, as a plain Row rather than an ORM instance.
+    """
+    payload = _macro_signal_cache.get("signal")
+    if payload is not None:
+        return payload
+
     row = db.execute(
-        select(MacroLiquiditySignal)
+        select(*_SIGNAL_COLUMNS)
         .order_by(MacroLiquiditySignal.timestamp.desc())
         .limit(1)
-    ).scalar_one_or_none()
+    ).first()
 
     if not row:
         return {"status": "no_data", "message": "No macro signal computed yet."}
 
-    return {
+    payload = {
         "timestamp": row.timestamp.isoformat(),
-        "macro_score": str(row.macro_score) if row.macro_score else None,
+        "macro_score": str_or_none(row.macro_score),
         "regime": row.regime,
-        "regime_confidence": str(row.regime_confidence) if row.regime_confidence else None,
+        "regime_confidence": str_or_none(row.regime_confidence),
         "sub_signals": {
-            "liquidity_score": str(row.liquidity_score) if row.liquidity_score else None,
-            "treasury_score": str(row.treasury_score) if row.treasury_score else None,
-            "dollar_score": str(row.dollar_score) if row.dollar_score else None,
-            "oil_score": str(row.oil_score) if row.oil_score else None,
-            "carry_trade_score": str(row.carry_trade_score) if row.carry_trade_score else None,
+            "liquidity_score": str_or_none(row.liquidity_score),
+            "treasury_score": str_or_none(row.treasury_score),
+            "dollar_score": str_or_none(row.dollar_score),
+            "oil_score": str_or_none(row.oil_score),
+            "carry_trade_score": str_or_none(row.carry_trade_score),
         },
         "data_points": {
-            "net_liquidity": str(row.net_liquidity) if row.net_liquidity else None,
-            "m2_yoy_pct": str(row.m2_yoy_pct) if row.m2_yoy_pct else None,
-            "yield_curve_2s10s": str(row.yield_curve_2s10s) if row.yield_curve_2s10s else None,
-            "dxy_value": str(row.dxy_value) if row.dxy_value else None,
-            "vix_value": str(row.vix_value) if row.vix_value else None,
-            "wti_price": str(row.wti_price) if row.wti_price else None,
-            "usdjpy_value": str(row.usdjpy_value) if row.usdjpy_value else None,
-            "carry_stress": str(row.carry_stress) if row.carry_stress else None,
+            "net_liquidity": str_or_none(row.net_liquidity),
+            "m2_yoy_pct": str_or_none(row.m2_yoy_pct),
+            "yield_curve_2s10s": str_or_none(row.yield_curve_2s10s),
+            "dxy_value": str_or_none(row.dxy_value),
+            "vix_value": str_or_none(row.vix_value),
+            "wti_price": str_or_none(row.wti_price),
+            "usdjpy_value": str_or_none(row.usdjpy_value),
+            "carry_stress": str_or_none(row.carry_stress),
         },
         "sub_signal_detail": row.sub_signals,
     }
+    _macro_signal_cache.set("signal", payload)
+    return payload
 
 
 @router.get("/api/macro/status")
@@ -79,16 +124,25 @@ def get_macro_status():
     }
 
 
-def _serialize_rows(rows, columns: list[str]) -> list[dict]:
-    """Serialize a list of model rows to dicts."""
-    result = []
-    for r in rows:
-        d = {"timestamp": r.timestamp.isoformat()}
-        for col in columns:
-            val = getattr(r, col, None)
-            d[col] = str(val) if val is not None else None
-        result.append(d)
-    return result
+def _raw_rows(db: Session, model, columns: list[str], limit: int) -> list[dict]:
+    """Latest ``limit`` rows of ``model``, newest first, values as strings.
+
+    Selects just timestamp + ``columns`` as plain Rows (no ORM instances or
+    identity map). Timestamps stay datetimes: the raw-data routes return
+    ORJSONResponse directly and orjson renders them as ISO 8601.
+    """
+    rows = db.execute(
+        select(model.timestamp, *(getattr(model, c) for c in columns))
+        .order_by(model.timestamp.desc())
+        .limit(limit)
+    ).all()
+    return [
+        {
+            "timestamp": r[0],
+            **{c: None if v is None else str(v) for c, v in zip(columns, r[1:])},
+        }
+        for r in rows
+    ]
 
 
 @router.get("/api/macro/oil")
@@ -97,16 +151,13 @@ def get_oil_data(
     db: Session = Depends(get_db),
 ):
     """Get raw oil price + inventory data."""
-    rows = db.execute(
-        select(OilData).order_by(OilData.timestamp.desc()).limit(limit)
-    ).scalars().all()
-    return {
-        "count": len(rows),
-        "data": _serialize_rows(
-            rows, ["wti_price", "brent_price", "wti_brent_spread",
-                   "crude_inventory", "inventory_change"]
-        ),
-    }
+    rows = _raw_rows(
+        db, OilData,
+        ["wti_price", "brent_price", "wti_brent_spread", "crude_inventory",
+         "inventory_change"],
+        limit,
+    )
+    return ORJSONResponse({"count": len(rows), "data": rows})
 
 
 @router.get("/api/macro/dollar")
@@ -115,13 +166,8 @@ def get_dollar_data(
     db: Session = Depends(get_db),
 ):
     """Get raw DXY + VIX data."""
-    rows = db.execute(
-        select(MacroPrices).order_by(MacroPrices.timestamp.desc()).limit(limit)
-    ).scalars().all()
-    return {
-        "count": len(rows),
-        "data": _serialize_rows(rows, ["dxy_index", "vix"]),
-    }
+    rows = _raw_rows(db, MacroPrices, ["dxy_index", "vix"], limit)
+    return ORJSONResponse({"count": len(rows), "data": rows})
 
 
 @router.get("/api/macro/rates")
@@ -130,15 +176,12 @@ def get_rate_data(
     db: Session = Depends(get_db),
 ):
     """Get raw treasury yield + rate data."""
-    rows = db.execute(
-        select(RateData).order_by(RateData.timestamp.desc()).limit(limit)
-    ).scalars().all()
-    return {
-        "count": len(rows),
-        "data": _serialize_rows(
-            rows, ["dgs2", "dgs10", "yield_curve_2s10s", "dfii10", "t5yie", "cpi_yoy"]
-        ),
-    }
+    rows = _raw_rows(
+        db, RateData,
+        ["dgs2", "dgs10", "yield_curve_2s10s", "dfii10", "t5yie", "cpi_yoy"],
+        limit,
+    )
+    return ORJSONResponse({"count": len(rows), "data": rows})
 
 
 @router.get("/api/macro/liquidity")
@@ -147,16 +190,13 @@ def get_liquidity_data(
     db: Session = Depends(get_db),
 ):
     """Get raw M2/Fed balance sheet/liquidity data."""
-    rows = db.execute(
-        select(LiquidityData).order_by(LiquidityData.timestamp.desc()).limit(limit)
-    ).scalars().all()
-    return {
-        "count": len(rows),
-        "data": _serialize_rows(
-            rows, ["m2_supply", "fed_balance_sheet", "fed_funds_rate",
-                   "treasury_general_acct", "reverse_repo", "net_liquidity"]
-        ),
-    }
+    rows = _raw_rows(
+        db, LiquidityData,
+        ["m2_supply", "fed_balance_sheet", "fed_funds_rate",
+         "treasury_general_acct", "reverse_repo", "net_liquidity"],
+        limit,
+    )
+    return ORJSONResponse({"count": len(rows), "data": rows})
 
 
 @router.get("/api/macro/carry")
@@ -165,14 +205,11 @@ def get_carry_data(
     db: Session = Depends(get_db),
 ):
     """Get raw carry trade data."""
-    rows = db.execute(
-        select(CarryTradeData).order_by(CarryTradeData.timestamp.desc()).limit(limit)
-    ).scalars().all()
-    return {
-        "count": len(rows),
-        "data": _serialize_rows(
-            rows, ["usdjpy", "eurusd", "usdjpy_sma_20", "usdjpy_atr_14",
-                   "usdjpy_rsi_14", "jpy_net_positioning",
-                   "jpy_positioning_zscore", "carry_stress_score"]
-        ),
-    }
+    rows = _raw_rows(
+        db, CarryTradeData,
+        ["usdjpy", "eurusd", "usdjpy_sma_20", "usdjpy_atr_14",
+         "usdjpy_rsi_14", "jpy_net_positioning", "jpy_positioning_zscore",
+         "carry_stress_score"],
+        limit,
+    )
+    return ORJSONResponse({"count": len(rows), "data": rows})
@@ -12,6 +12,7 @@ from app.models.numerology_daily import NumerologyDaily
 from app.services import cycle_tracker
 from app.services.numerology_compute import GematriaCalculator
 from app.signals.numerology import compute_daily_numerology
+from app.utils import str_or_none
 
 router = APIRouter(tags=["numerology"])
 
@@ -27,7 +28,7 @@ def _numerology_to_dict(row: NumerologyDaily) -> dict:
         "active_cycles": row.active_cycles,
         "cycle_confluence_count": row.cycle_confluence_count,
         "price_47_appearances": row.price_47_appearances,
-        "numerology_score": str(row.numerology_score) if row.numerology_score is not None else None,
+        "numerology_score": str_or_none(row.numerology_score),
     }
 
 
@@ -38,9 +39,7 @@ def get_current_numerology(db: Session = Depends(get_db)):
     """Get today's numerology (compute if not cached)."""
     today = date.today()
 
-    row = db.execute(
-        select(NumerologyDaily).where(NumerologyDaily.date == today)
-    ).scalar_one_or_none()
+    row = db.get(NumerologyDaily, today)
 
     if row is None:
         result = compute_daily_numerology(today, db)
@@ -54,9 +53,7 @@ def get_current_numerology(db: Session = Depends(get_db)):
 @router.get("/api/numerology/{target_date}")
 def get_numerology_by_date(target_date: date, db: Session = Depends(get_db)):
     """Get numerology for a specific date (compute if not cached)."""
-    row = db.execute(
-        select(NumerologyDaily).where(NumerologyDaily.date == target_date)
-    ).scalar_one_or_none()
+    row = db.get(NumerologyDaily, target_date)
 
     if row is None:
         result = compute_daily_numerology(target_date, db)
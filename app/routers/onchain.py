@@ -3,16 +3,27 @@
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.database import get_db
 from app.models.onchain_metrics import OnchainMetrics
-from app.utils import normalize_symbol
+from app.utils import normalize_symbol, str_or_none
 
 router = APIRouter(tags=["onchain"])
 
+_HISTORY_COLUMNS = [
+    OnchainMetrics.timestamp,
+    OnchainMetrics.exchange_netflow,
+    OnchainMetrics.whale_transactions_count,
+    OnchainMetrics.nupl,
+    OnchainMetrics.mvrv_zscore,
+    OnchainMetrics.sopr,
+    OnchainMetrics.onchain_score,
+]
+
 
 @router.get("/api/onchain/status")
 def get_onchain_status():
@@ -54,16 +65,16 @@ def get_latest_onchain(symbol: str, db: Session = Depends(get_db)):
         "symbol": symbol,
         "metrics": {
             "timestamp": row.timestamp.isoformat(),
-            "exchange_inflow": str(row.exchange_inflow) if row.exchange_inflow else None,
-            "exchange_outflow": str(row.exchange_outflow) if row.exchange_outflow else None,
-            "exchange_netflow": str(row.exchange_netflow) if row.exchange_netflow else None,
+            "exchange_inflow": str_or_none(row.exchange_inflow),
+            "exchange_outflow": str_or_none(row.exchange_outflow),
+            "exchange_netflow": str_or_none(row.exchange_netflow),
             "whale_transactions_count": row.whale_transactions_count,
-            "whale_volume_usd": str(row.whale_volume_usd) if row.whale_volume_usd else None,
+            "whale_volume_usd": str_or_none(row.whale_volume_usd),
             "active_addresses": row.active_addresses,
-            "nupl": str(row.nupl) if row.nupl else None,
-            "mvrv_zscore": str(row.mvrv_zscore) if row.mvrv_zscore else None,
-            "sopr": str(row.sopr) if row.sopr else None,
-            "onchain_score": str(row.onchain_score) if row.onchain_score else None,
+            "nupl": str_or_none(row.nupl),
+            "mvrv_zscore": str_or_none(row.mvrv_zscore),
+            "sopr": str_or_none(row.sopr),
+            "onchain_score": str_or_none(row.onchain_score),
         },
     }
 
@@ -76,9 +87,14 @@ def get_onchain_history(
     limit: int = Query(100, ge=1, le=1000),
     db: Session = Depends(get_db),
 ):
-    """Get historical on-chain metrics for a symbol."""
+    """Get historical on-chain metrics for a symbol.
+
+    Selects only the columns it returns (plain Rows, no ORM instances or
+    identity map) and returns an ORJSONResponse so the up-to-1000-row
+    payload skips FastAPI's jsonable_encoder pass.
+    """
     symbol = normalize_symbol(symbol)
-    query = select(OnchainMetrics).where(OnchainMetrics.symbol == symbol)
+    query = select(*_HISTORY_COLUMNS).where(OnchainMetrics.symbol == symbol)
 
     if start:
         query = query.where(OnchainMetrics.timestamp >= start)
@@ -86,21 +102,21 @@ def get_onchain_history(
         query = query.where(OnchainMetrics.timestamp <= end)
 
     query = query.order_by(OnchainMetrics.timestamp.desc()).limit(limit)
-    rows = db.execute(query).scalars().all()
+    rows = db.execute(query).all()
 
-    return {
+    return ORJSONResponse({
         "symbol": symbol,
         "count": len(rows),
         "data": [
             {
-                "timestamp": r.timestamp.isoformat(),
-                "exchange_netflow": str(r.exchange_netflow) if r.exchange_netflow else None,
+                "timestamp": r.timestamp,
+                "exchange_netflow": str_or_none(r.exchange_netflow),
                 "whale_transactions_count": r.whale_transactions_count,
-                "nupl": str(r.nupl) if r.nupl else None,
-                "mvrv_zscore": str(r.mvrv_zscore) if r.mvrv_zscore else None,
-                "sopr": str(r.sopr) if r.sopr else None,
-                "onchain_score": str(r.onchain_score) if r.onchain_score else None,
+                "nupl": str_or_none(r.nupl),
+                "mvrv_zscore": str_or_none(r.mvrv_zscore),
+                "sopr": str_or_none(r.sopr),
+                "onchain_score": str_or_none(r.onchain_score),
             }
             for r in rows
         ],
-    }
+    })
@@ -3,6 +3,7 @@
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -11,9 +12,49 @@ from app.database import get_db
 from app.models.political_calendar import PoliticalCalendar
 from app.models.political_news import PoliticalNews
 from app.models.political_signal import PoliticalSignal
+from app.utils import TTLCache, str_or_none
 
 router = APIRouter(tags=["political"])
 
+# Latest-signal payload. "No signal yet" isn't cached, so the first
+# computed signal shows up on the next request.
+POLITICAL_SIGNAL_CACHE_TTL = 60.0
+_political_signal_cache = TTLCache(POLITICAL_SIGNAL_CACHE_TTL)
+
+
+def invalidate_signal_cache() -> None:
+    """Drop the cached latest-signal payload."""
+    _political_signal_cache.clear()
+
+# Columns each list route returns, read as plain Rows (no ORM instances).
+_NEWS_COLUMNS = [
+    PoliticalNews.timestamp,
+    PoliticalNews.source_name,
+    PoliticalNews.headline,
+    PoliticalNews.source_url,
+    PoliticalNews.category,
+    PoliticalNews.subcategory,
+    PoliticalNews.crypto_relevance_score,
+    PoliticalNews.sentiment_score,
+    PoliticalNews.urgency_score,
+    PoliticalNews.headline_gematria,
+]
+_NEWS_HISTORY_COLUMNS = [
+    PoliticalNews.timestamp,
+    PoliticalNews.source_name,
+    PoliticalNews.headline,
+    PoliticalNews.category,
+    PoliticalNews.sentiment_score,
+    PoliticalNews.crypto_relevance_score,
+]
+_SIGNAL_HISTORY_COLUMNS = [
+    PoliticalSignal.timestamp,
+    PoliticalSignal.political_score,
+    PoliticalSignal.news_volume_24h,
+    PoliticalSignal.dominant_narrative,
+    PoliticalSignal.narrative_direction,
+]
+
 
 @router.get("/api/political/status")
 def get_political_status():
@@ -78,7 +119,7 @@ def get_calendar_event(event_id: int, db: Session = Depends(get_db)):
             "expected_direction": row.expected_direction,
             "crypto_relevance": row.crypto_relevance,
             "actual_outcome": row.actual_outcome,
-            "actual_price_impact_pct": str(row.actual_price_impact_pct) if row.actual_price_impact_pct else None,
+            "actual_price_impact_pct": str_or_none(row.actual_price_impact_pct),
             "date_gematria_value": row.date_gematria_value,
             "key_figure_gematria": row.key_figure_gematria,
             "event_title_gematria": row.event_title_gematria,
@@ -97,31 +138,31 @@ def get_political_news(
 
     cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
     rows = db.execute(
-        select(PoliticalNews)
+        select(*_NEWS_COLUMNS)
         .where(PoliticalNews.timestamp >= cutoff)
         .order_by(PoliticalNews.timestamp.desc())
         .limit(limit)
-    ).scalars().all()
+    ).all()
 
-    return {
+    return ORJSONResponse({
         "hours": hours,
         "count": len(rows),
         "data": [
             {
-                "timestamp": r.timestamp.isoformat(),
+                "timestamp": r.timestamp,
                 "source_name": r.source_name,
                 "headline": r.headline,
                 "source_url": r.source_url,
                 "category": r.category,
                 "subcategory": r.subcategory,
-                "crypto_relevance_score": str(r.crypto_relevance_score) if r.crypto_relevance_score else None,
-                "sentiment_score": str(r.sentiment_score) if r.sentiment_score else None,
-                "urgency_score": str(r.urgency_score) if r.urgency_score else None,
+                "crypto_relevance_score": str_or_none(r.crypto_relevance_score),
+                "sentiment_score": str_or_none(r.sentiment_score),
+                "urgency_score": str_or_none(r.urgency_score),
                 "headline_gematria": r.headline_gematria,
             }
             for r in rows
         ],
-    }
+    })
 
 
 @router.get("/api/political/news/history")
@@ -131,30 +172,38 @@ def get_news_history(
 ):
     """Get political news history."""
     rows = db.execute(
-        select(PoliticalNews)
+        select(*_NEWS_HISTORY_COLUMNS)
         .order_by(PoliticalNews.timestamp.desc())
         .limit(limit)
-    ).scalars().all()
+    ).all()
 
-    return {
+    return ORJSONResponse({
         "count": len(rows),
         "data": [
             {
-                "timestamp": r.timestamp.isoformat(),
+                "timestamp": r.timestamp,
                 "source_name": r.source_name,
                 "headline": r.headline,
                 "category": r.category,
-                "sentiment_score": str(r.sentiment_score) if r.sentiment_score else None,
-                "crypto_relevance_score": str(r.crypto_relevance_score) if r.crypto_relevance_score else None,
+                "sentiment_score": str_or_none(r.sentiment_score),
+                "crypto_relevance_score": str_or_none(r.crypto_relevance_score),
             }
             for r in rows
         ],
-    }
+    })
 
 
 @router.get("/api/political/signal")
 def get_political_signal(db: Session = Depends(get_db)):
-    """Get the current (latest) political signal."""
+    """Get the current (latest) political signal.
+
+    The signal is recomputed by the hourly update, so the rendered
+    payload is cached for POLITICAL_SIGNAL_CACHE_TTL seconds.
+    """
+    payload = _political_signal_cache.get("signal")
+    if payload is not None:
+        return payload
+
     row = db.execute(
         select(PoliticalSignal)
         .order_by(PoliticalSignal.timestamp.desc())
@@ -164,24 +213,26 @@ def get_political_signal(db: Session = Depends(get_db)):
     if row is None:
         return {"signal": None, "message": "No political signal computed yet"}
 
-    return {
+    payload = {
         "signal": {
             "timestamp": row.timestamp.isoformat(),
-            "political_score": str(row.political_score) if row.political_score else None,
+            "political_score": str_or_none(row.political_score),
             "hours_to_next_major_event": row.hours_to_next_major_event,
             "next_event_type": row.next_event_type,
             "upcoming_events_7d": row.upcoming_events_7d,
             "upcoming_high_impact_7d": row.upcoming_high_impact_7d,
             "news_volume_1h": row.news_volume_1h,
             "news_volume_24h": row.news_volume_24h,
-            "avg_news_sentiment_1h": str(row.avg_news_sentiment_1h) if row.avg_news_sentiment_1h else None,
-            "avg_news_sentiment_24h": str(row.avg_news_sentiment_24h) if row.avg_news_sentiment_24h else None,
-            "max_urgency_1h": str(row.max_urgency_1h) if row.max_urgency_1h else None,
+            "avg_news_sentiment_1h": str_or_none(row.avg_news_sentiment_1h),
+            "avg_news_sentiment_24h": str_or_none(row.avg_news_sentiment_24h),
+            "max_urgency_1h": str_or_none(row.max_urgency_1h),
             "dominant_narrative": row.dominant_narrative,
-            "narrative_strength": str(row.narrative_strength) if row.narrative_strength else None,
+            "narrative_strength": str_or_none(row.narrative_strength),
             "narrative_direction": row.narrative_direction,
         },
     }
+    _political_signal_cache.set("signal", payload)
+    return payload
 
 
 @router.get("/api/political/signal/history")
@@ -191,24 +242,24 @@ def get_signal_history(
 ):
     """Get political signal history."""
     rows = db.execute(
-        select(PoliticalSignal)
+        select(*_SIGNAL_HISTORY_COLUMNS)
         .order_by(PoliticalSignal.timestamp.desc())
         .limit(limit)
-    ).scalars().all()
+    ).all()
 
-    return {
+    return ORJSONResponse({
         "count": len(rows),
         "data": [
             {
-                "timestamp": r.timestamp.isoformat(),
-                "political_score": str(r.political_score) if r.political_score else None,
+                "timestamp": r.timestamp,
+                "political_score": str_or_none(r.political_score),
                 "news_volume_24h": r.news_volume_24h,
                 "dominant_narrative": r.dominant_narrative,
                 "narrative_direction": r.narrative_direction,
             }
             for r in rows
         ],
-    }
+    })
 
 
 @router.get("/api/political/narratives")
@@ -3,6 +3,7 @@
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import select, func
 from sqlalchemy.orm import Session
 
@@ -12,6 +13,16 @@ from app.utils import normalize_symbol
 
 router = APIRouter(prefix="/api/prices", tags=["prices"])
 
+# Candle columns the routes return, read as plain Rows (no ORM instances).
+_CANDLE_COLUMNS = [
+    PriceData.timestamp,
+    PriceData.open,
+    PriceData.high,
+    PriceData.low,
+    PriceData.close,
+    PriceData.volume,
+]
+
 
 @router.get("/{symbol}")
 def get_prices(
@@ -24,20 +35,20 @@ def get_prices(
     symbol = normalize_symbol(symbol)
 
     stmt = (
-        select(PriceData)
+        select(*_CANDLE_COLUMNS)
         .where(PriceData.symbol == symbol, PriceData.timeframe == timeframe)
         .order_by(PriceData.timestamp.desc())
         .limit(limit)
     )
-    rows = db.execute(stmt).scalars().all()
+    rows = db.execute(stmt).all()
 
-    return {
+    return ORJSONResponse({
         "symbol": symbol,
         "timeframe": timeframe,
         "count": len(rows),
         "data": [
             {
-                "timestamp": r.timestamp.isoformat(),
+                "timestamp": r.timestamp,
                 "open": str(r.open),
                 "high": str(r.high),
                 "low": str(r.low),
@@ -46,7 +57,7 @@ def get_prices(
             }
             for r in reversed(rows)  # oldest first
         ],
-    }
+    })
 
 
 @router.get("/{symbol}/history")
@@ -57,10 +68,14 @@ def get_price_history(
     end: datetime | None = Query(None, description="End datetime (ISO 8601)"),
     db: Session = Depends(get_db),
 ):
-    """Get price history for a symbol within a date range."""
+    """Get price history for a symbol within a date range.
+
+    The range is unbounded, so the payload goes straight to an
+    ORJSONResponse rather than through FastAPI's jsonable_encoder.
+    """
     symbol = normalize_symbol(symbol)
 
-    stmt = select(PriceData).where(
+    stmt = select(*_CANDLE_COLUMNS).where(
         PriceData.symbol == symbol,
         PriceData.timeframe == timeframe,
     )
@@ -70,15 +85,15 @@ def get_price_history(
         stmt = stmt.where(PriceData.timestamp <= end)
     stmt = stmt.order_by(PriceData.timestamp.asc())
 
-    rows = db.execute(stmt).scalars().all()
+    rows = db.execute(stmt).all()
 
-    return {
+    return ORJSONResponse({
         "symbol": symbol,
         "timeframe": timeframe,
         "count": len(rows),
         "data": [
             {
-                "timestamp": r.timestamp.isoformat(),
+                "timestamp": r.timestamp,
                 "open": str(r.open),
                 "high": str(r.high),
                 "low": str(r.low),
@@ -87,4 +102,4 @@ def get_price_history(
             }
             for r in rows
         ],
-    }
+    })
@@ -3,15 +3,24 @@
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.sentiment_data import SentimentData
-from app.utils import normalize_symbol
+from app.utils import normalize_symbol, str_or_none
 
 router = APIRouter(tags=["sentiment"])
 
+# History columns, read as plain Rows (no ORM instances).
+_HISTORY_COLUMNS = [
+    SentimentData.timestamp,
+    SentimentData.fear_greed_index,
+    SentimentData.fear_greed_label,
+    SentimentData.sentiment_score,
+]
+
 
 @router.get("/api/sentiment/{symbol}")
 def get_latest_sentiment(symbol: str, db: Session = Depends(get_db)):
@@ -33,7 +42,7 @@ def get_latest_sentiment(symbol: str, db: Session = Depends(get_db)):
             "timestamp": row.timestamp.isoformat(),
             "fear_greed_index": row.fear_greed_index,
             "fear_greed_label": row.fear_greed_label,
-            "sentiment_score": str(row.sentiment_score) if row.sentiment_score else None,
+            "sentiment_score": str_or_none(row.sentiment_score),
         },
     }
 
@@ -48,7 +57,7 @@ def get_sentiment_history(
 ):
     """Get historical sentiment data for a symbol."""
     symbol = normalize_symbol(symbol)
-    query = select(SentimentData).where(SentimentData.symbol == symbol)
+    query = select(*_HISTORY_COLUMNS).where(SentimentData.symbol == symbol)
 
     if start:
         query = query.where(SentimentData.timestamp >= start)
@@ -56,18 +65,18 @@ def get_sentiment_history(
         query = query.where(SentimentData.timestamp <= end)
 
     query = query.order_by(SentimentData.timestamp.desc()).limit(limit)
-    rows = db.execute(query).scalars().all()
+    rows = db.execute(query).all()
 
-    return {
+    return ORJSONResponse({
         "symbol": symbol,
         "count": len(rows),
         "data": [
             {
-                "timestamp": r.timestamp.isoformat(),
+                "timestamp": r.timestamp,
                 "fear_greed_index": r.fear_greed_index,
                 "fear_greed_label": r.fear_greed_label,
-                "sentiment_score": str(r.sentiment_score) if r.sentiment_score else None,
+                "sentiment_score": str_or_none(r.sentiment_score),
             }
             for r in rows
         ],
-    }
+    })
@@ -3,6 +3,7 @@
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -13,37 +14,51 @@ from app.utils import normalize_symbol
 router = APIRouter(prefix="/api/signals", tags=["signals"])
 
 
-def _indicator_to_dict(row: TAIndicators) -> dict:
-    """Convert a TAIndicators row to a JSON-serializable dict."""
-    return {
-        "timestamp": row.timestamp.isoformat(),
-        "symbol": row.symbol,
-        "timeframe": row.timeframe,
-        "rsi_14": str(row.rsi_14) if row.rsi_14 is not None else None,
-        "rsi_7": str(row.rsi_7) if row.rsi_7 is not None else None,
-        "macd_line": str(row.macd_line) if row.macd_line is not None else None,
-        "macd_signal": str(row.macd_signal) if row.macd_signal is not None else None,
-        "macd_histogram": str(row.macd_histogram) if row.macd_histogram is not None else None,
-        "stoch_k": str(row.stoch_k) if row.stoch_k is not None else None,
-        "stoch_d": str(row.stoch_d) if row.stoch_d is not None else None,
-        "sma_20": str(row.sma_20) if row.sma_20 is not None else None,
-        "sma_50": str(row.sma_50) if row.sma_50 is not None else None,
-        "sma_200": str(row.sma_200) if row.sma_200 is not None else None,
-        "ema_12": str(row.ema_12) if row.ema_12 is not None else None,
-        "ema_26": str(row.ema_26) if row.ema_26 is not None else None,
-        "bb_upper": str(row.bb_upper) if row.bb_upper is not None else None,
-        "bb_middle": str(row.bb_middle) if row.bb_middle is not None else None,
-        "bb_lower": str(row.bb_lower) if row.bb_lower is not None else None,
-        "atr_14": str(row.atr_14) if row.atr_14 is not None else None,
-        "fib_0": str(row.fib_0) if row.fib_0 is not None else None,
-        "fib_236": str(row.fib_236) if row.fib_236 is not None else None,
-        "fib_382": str(row.fib_382) if row.fib_382 is not None else None,
-        "fib_500": str(row.fib_500) if row.fib_500 is not None else None,
-        "fib_618": str(row.fib_618) if row.fib_618 is not None else None,
-        "fib_786": str(row.fib_786) if row.fib_786 is not None else None,
-        "fib_1000": str(row.fib_1000) if row.fib_1000 is not None else None,
-        "ta_score": str(row.ta_score) if row.ta_score is not None else None,
-    }
+# Serialised fields in response order: the plain ones pass through, the
+# DOUBLE PRECISION indicator values go out as strings.
+_PLAIN_FIELDS = ("timestamp", "symbol", "timeframe")
+_STR_FIELDS = (
+    "rsi_14",
+    "rsi_7",
+    "macd_line",
+    "macd_signal",
+    "macd_histogram",
+    "stoch_k",
+    "stoch_d",
+    "sma_20",
+    "sma_50",
+    "sma_200",
+    "ema_12",
+    "ema_26",
+    "bb_upper",
+    "bb_middle",
+    "bb_lower",
+    "atr_14",
+    "fib_0",
+    "fib_236",
+    "fib_382",
+    "fib_500",
+    "fib_618",
+    "fib_786",
+    "fib_1000",
+    "ta_score",
+)
+# Exactly the serialised columns, for the history query.
+_INDICATOR_COLUMNS = [
+    TAIndicators.__table__.c[f] for f in _PLAIN_FIELDS + _STR_FIELDS
+]
+
+
+def _indicator_to_dict(row) -> dict:
+    """Convert a TAIndicators entity or column Row to a JSON-serializable dict.
+
+    The timestamp stays a datetime for orjson / jsonable_encoder to render.
+    """
+    out = {f: getattr(row, f) for f in _PLAIN_FIELDS}
+    for f in _STR_FIELDS:
+        value = getattr(row, f)
+        out[f] = None if value is None else str(value)
+    return out
 
 
 @router.get("/ta/{symbol}")
@@ -85,7 +100,7 @@ def get_ta_history(
     """Get historical TA indicators for a symbol."""
     symbol = normalize_symbol(symbol)
 
-    stmt = select(TAIndicators).where(
+    stmt = select(*_INDICATOR_COLUMNS).where(
         TAIndicators.symbol == symbol,
         TAIndicators.timeframe == timeframe,
     )
@@ -95,11 +110,11 @@ def get_ta_history(
         stmt = stmt.where(TAIndicators.timestamp <= end)
     stmt = stmt.order_by(TAIndicators.timestamp.desc()).limit(limit)
 
-    rows = db.execute(stmt).scalars().all()
+    rows = db.execute(stmt).all()
 
-    return {
+    return ORJSONResponse({
         "symbol": symbol,
         "timeframe": timeframe,
         "count": len(rows),
         "data": [_indicator_to_dict(r) for r in reversed(rows)],
-    }
+    })
@@ -1,8 +1,10 @@
 """XAI (XRP Adoption Intelligence) router — on-chain metrics, partnerships, events, policies."""
 
+from collections.abc import Callable
 from datetime import date, datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -15,13 +17,59 @@ from app.models.xai import (
     XaiPersonnelIntelligence,
     XaiPolicyEvent,
 )
+from app.utils import TTLCache, str_or_none
 
 router = APIRouter(tags=["xai"])
 
+# Latest-row payloads (score, onchain). The rows change every few hours, so
+# a short TTL serves dashboard polling from memory; "no data yet" isn't
+# cached, and a manual recompute clears it.
+XAI_LATEST_CACHE_TTL = 60.0
+_latest_cache = TTLCache(XAI_LATEST_CACHE_TTL)
+
+
+def _cached_latest(key: str, build: Callable[[], dict]) -> dict:
+    """Return the cached payload for ``key``, rebuilding it once expired."""
+    payload = _latest_cache.get(key)
+    if payload is not None:
+        return payload
+
+    payload = build()
+    if payload.get("status") != "no_data":
+        _latest_cache.set(key, payload)
+    return payload
+
+
+def invalidate_latest_cache() -> None:
+    """Drop cached latest-row payloads (after a recompute)."""
+    _latest_cache.clear()
+
+# Partnership columns the list route reads, as plain Rows (no ORM instances).
+_PARTNERSHIP_COLUMNS = [
+    XaiPartnership.id,
+    XaiPartnership.partner_name,
+    XaiPartnership.partner_type,
+    XaiPartnership.country,
+    XaiPartnership.is_cpmi_member_country,
+    XaiPartnership.partnership_type,
+    XaiPartnership.pipeline_stage,
+    XaiPartnership.stage_score,
+    XaiPartnership.partner_weight,
+    XaiPartnership.announced_date,
+    XaiPartnership.notes,
+]
+
 
 @router.get("/api/xai/score")
 def get_xai_score(db: Session = Depends(get_db)):
-    """Get latest XAI composite score with sub-signals and adoption phase."""
+    """Get latest XAI composite score with sub-signals and adoption phase.
+
+    Cached for XAI_LATEST_CACHE_TTL seconds.
+    """
+    return _cached_latest("score", lambda: _xai_score_payload(db))
+
+
+def _xai_score_payload(db: Session) -> dict:
     row = db.execute(
         select(XaiComposite)
         .order_by(XaiComposite.timestamp.desc())
@@ -33,13 +81,13 @@ def get_xai_score(db: Session = Depends(get_db)):
 
     return {
         "timestamp": row.timestamp.isoformat(),
-        "xai_score": str(row.xai_score) if row.xai_score is not None else None,
-        "policy_pipeline_score": str(row.policy_pipeline_score) if row.policy_pipeline_score is not None else None,
-        "partnership_deployment_score": str(row.partnership_deployment_score) if row.partnership_deployment_score is not None else None,
-        "onchain_utility_score": str(row.onchain_utility_score) if row.onchain_utility_score is not None else None,
-        "personnel_intelligence_score": str(row.personnel_intelligence_score) if row.personnel_intelligence_score is not None else None,
-        "utility_to_speculation_ratio": str(row.utility_to_speculation_ratio) if row.utility_to_speculation_ratio is not None else None,
-        "rlusd_market_cap": str(row.rlusd_market_cap) if row.rlusd_market_cap is not None else None,
+        "xai_score": str_or_none(row.xai_score),
+        "policy_pipeline_score": str_or_none(row.policy_pipeline_score),
+        "partnership_deployment_score": str_or_none(row.partnership_deployment_score),
+        "onchain_utility_score": str_or_none(row.onchain_utility_score),
+        "personnel_intelligence_score": str_or_none(row.personnel_intelligence_score),
+        "utility_to_speculation_ratio": str_or_none(row.utility_to_speculation_ratio),
+        "rlusd_market_cap": str_or_none(row.rlusd_market_cap),
         "active_partnership_count": row.active_partnership_count,
         "partnerships_in_production": row.partnerships_in_production,
         "adoption_phase": row.adoption_phase,
@@ -49,7 +97,14 @@ def get_xai_score(db: Session = Depends(get_db)):
 
 @router.get("/api/xai/onchain")
 def get_xai_onchain(db: Session = Depends(get_db)):
-    """Get latest XRPL on-chain metrics."""
+    """Get latest XRPL on-chain metrics.
+
+    Cached for XAI_LATEST_CACHE_TTL seconds.
+    """
+    return _cached_latest("onchain", lambda: _xai_onchain_payload(db))
+
+
+def _xai_onchain_payload(db: Session) -> dict:
     row = db.execute(
         select(XaiOnchainMetrics)
         .order_by(XaiOnchainMetrics.timestamp.desc())
@@ -62,17 +117,17 @@ def get_xai_onchain(db: Session = Depends(get_db)):
     return {
         "timestamp": row.timestamp.isoformat(),
         "xrpl_tx_count": row.xrpl_tx_count,
-        "xrpl_payment_volume_usd": str(row.xrpl_payment_volume_usd) if row.xrpl_payment_volume_usd is not None else None,
-        "xrpl_dex_volume_usd": str(row.xrpl_dex_volume_usd) if row.xrpl_dex_volume_usd is not None else None,
-        "rlusd_total_supply": str(row.rlusd_total_supply) if row.rlusd_total_supply is not None else None,
+        "xrpl_payment_volume_usd": str_or_none(row.xrpl_payment_volume_usd),
+        "xrpl_dex_volume_usd": str_or_none(row.xrpl_dex_volume_usd),
+        "rlusd_total_supply": str_or_none(row.rlusd_total_supply),
         "rlusd_unique_holders": row.rlusd_unique_holders,
         "rlusd_trust_line_count": row.rlusd_trust_line_count,
-        "utility_volume_usd": str(row.utility_volume_usd) if row.utility_volume_usd is not None else None,
-        "speculation_volume_usd": str(row.speculation_volume_usd) if row.speculation_volume_usd is not None else None,
-        "utility_to_speculation_ratio": str(row.utility_to_speculation_ratio) if row.utility_to_speculation_ratio is not None else None,
+        "utility_volume_usd": str_or_none(row.utility_volume_usd),
+        "speculation_volume_usd": str_or_none(row.speculation_volume_usd),
+        "utility_to_speculation_ratio": str_or_none(row.utility_to_speculation_ratio),
         "xrpl_active_addresses": row.xrpl_active_addresses,
         "xrpl_new_accounts": row.xrpl_new_accounts,
-        "xrp_exchange_reserve": str(row.xrp_exchange_reserve) if row.xrp_exchange_reserve is not None else None,
+        "xrp_exchange_reserve": str_or_none(row.xrp_exchange_reserve),
     }
 
 
@@ -80,8 +135,8 @@ def get_xai_onchain(db: Session = Depends(get_db)):
 def get_xai_partnerships(db: Session = Depends(get_db)):
     """Get all tracked Ripple partnerships with pipeline stages."""
     rows = db.execute(
-        select(XaiPartnership).order_by(XaiPartnership.partner_weight.desc())
-    ).scalars().all()
+        select(*_PARTNERSHIP_COLUMNS).order_by(XaiPartnership.partner_weight.desc())
+    ).all()
 
     partnerships = []
     for p in rows:
@@ -93,9 +148,9 @@ def get_xai_partnerships(db: Session = Depends(get_db)):
             "is_cpmi_member_country": p.is_cpmi_member_country,
             "partnership_type": p.partnership_type,
             "pipeline_stage": p.pipeline_stage,
-            "stage_score": str(p.stage_score) if p.stage_score is not None else None,
-            "partner_weight": str(p.partner_weight) if p.partner_weight is not None else None,
-            "announced_date": p.announced_date.isoformat() if p.announced_date else None,
+            "stage_score": str_or_none(p.stage_score),
+            "partner_weight": str_or_none(p.partner_weight),
+            "announced_date": p.announced_date,
             "notes": p.notes,
         })
 
@@ -105,11 +160,11 @@ def get_xai_partnerships(db: Session = Depends(get_db)):
         if p.pipeline_stage in stages:
             stages[p.pipeline_stage] += 1
 
-    return {
+    return ORJSONResponse({
         "count": len(partnerships),
         "pipeline_summary": stages,
         "partnerships": partnerships,
-    }
+    })
 
 
 @router.get("/api/xai/calendar")
@@ -127,16 +182,16 @@ def get_xai_calendar(db: Session = Depends(get_db)):
     for e in rows:
         events.append({
             "id": e.id,
-            "event_date": e.event_date.isoformat(),
+            "event_date": e.event_date,
             "event_name": e.event_name,
             "event_type": e.event_type,
             "description": e.description,
-            "xrp_relevance": str(e.xrp_relevance) if e.xrp_relevance is not None else None,
+            "xrp_relevance": str_or_none(e.xrp_relevance),
             "potential_impact": e.potential_impact,
             "recurring": e.recurring,
         })
 
-    return {"count": len(events), "events": events}
+    return ORJSONResponse({"count": len(events), "events": events})
 
 
 @router.get("/api/xai/ratio")
@@ -151,17 +206,17 @@ def get_xai_ratio(db: Session = Depends(get_db)):
 
     history = [
         {
-            "timestamp": r.timestamp.isoformat(),
+            "timestamp": r.timestamp,
             "ratio": str(r.utility_to_speculation_ratio),
-            "utility_volume": str(r.utility_volume_usd) if r.utility_volume_usd is not None else None,
-            "speculation_volume": str(r.speculation_volume_usd) if r.speculation_volume_usd is not None else None,
+            "utility_volume": str_or_none(r.utility_volume_usd),
+            "speculation_volume": str_or_none(r.speculation_volume_usd),
         }
         for r in rows
     ]
 
     latest = history[0] if history else None
 
-    return {"latest": latest, "history": history}
+    return ORJSONResponse({"latest": latest, "history": history})
 
 
 @router.get("/api/xai/policies")
@@ -179,21 +234,21 @@ def get_xai_policies(days: int = 90, db: Session = Depends(get_db)):
     for e in rows:
         events.append({
             "id": e.id,
-            "timestamp": e.timestamp.isoformat(),
+            "timestamp": e.timestamp,
             "source": e.source,
             "event_type": e.event_type,
             "title": e.title,
             "url": e.url,
-            "cross_border_relevance": str(e.cross_border_relevance) if e.cross_border_relevance is not None else None,
-            "dlt_favorability": str(e.dlt_favorability) if e.dlt_favorability is not None else None,
-            "stablecoin_stance": str(e.stablecoin_stance) if e.stablecoin_stance is not None else None,
-            "regulatory_direction": str(e.regulatory_direction) if e.regulatory_direction is not None else None,
-            "timeline_urgency": str(e.timeline_urgency) if e.timeline_urgency is not None else None,
+            "cross_border_relevance": str_or_none(e.cross_border_relevance),
+            "dlt_favorability": str_or_none(e.dlt_favorability),
+            "stablecoin_stance": str_or_none(e.stablecoin_stance),
+            "regulatory_direction": str_or_none(e.regulatory_direction),
+            "timeline_urgency": str_or_none(e.timeline_urgency),
             "xrp_mentioned": e.xrp_mentioned,
-            "policy_impact_score": str(e.policy_impact_score) if e.policy_impact_score is not None else None,
+            "policy_impact_score": str_or_none(e.policy_impact_score),
         })
 
-    return {"count": len(events), "events": events}
+    return ORJSONResponse({"count": len(events), "events": events})
 
 
 @router.get("/api/xai/personnel")
@@ -211,19 +266,19 @@ def get_xai_personnel(days: int = 90, db: Session = Depends(get_db)):
     for r in rows:
         statements.append({
             "id": r.id,
-            "timestamp": r.timestamp.isoformat(),
+            "timestamp": r.timestamp,
             "person_name": r.person_name,
             "role": r.role,
             "statement_type": r.statement_type,
             "source_title": r.source_title,
             "source_url": r.source_url,
-            "sentiment_score": str(r.sentiment_score) if r.sentiment_score is not None else None,
-            "influence_weight": str(r.influence_weight) if r.influence_weight is not None else None,
+            "sentiment_score": str_or_none(r.sentiment_score),
+            "influence_weight": str_or_none(r.influence_weight),
             "xrp_mentioned": r.xrp_mentioned,
             "key_quote": r.key_quote,
         })
 
-    return {"count": len(statements), "statements": statements}
+    return ORJSONResponse({"count": len(statements), "statements": statements})
 
 
 @router.post("/api/xai/recompute")
@@ -272,4 +327,5 @@ def recompute_xai(db: Session = Depends(get_db)):
         db.rollback()
         results["composite"] = {"error": str(exc), "traceback": tb.format_exc()}
 
+    invalidate_latest_cache()
     return results
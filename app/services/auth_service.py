@@ -1,20 +1,32 @@
 """Authentication service — password hashing and JWT management."""
 
+import hashlib
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from sqlalchemy import select
+from sqlalchemy import Row, func, select, update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app.config import settings
+from app.database import SessionLocal, run_in_session
 from app.models.user import User
+from app.utils import TTLCache
 
 logger = logging.getLogger(__name__)
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Verified tokens, keyed by sha256(token) so raw tokens are never held in
+# memory: digest -> username. An entry lives for at most TOKEN_CACHE_TTL
+# seconds and never past the token's own exp.
+TOKEN_CACHE_TTL = 30.0
+TOKEN_CACHE_MAXSIZE = 10_000
+_token_cache = TTLCache(TOKEN_CACHE_TTL, maxsize=TOKEN_CACHE_MAXSIZE)
+
 
 def hash_password(password: str) -> str:
     """Hash a plaintext password using bcrypt."""
@@ -39,27 +51,79 @@ def create_access_token(username: str) -> str:
 
 def decode_access_token(token: str) -> str | None:
     """Decode a JWT token and return the username, or None if invalid/expired."""
+    payload = _decode_payload(token)
+    if payload is None:
+        return None
+    username: str | None = payload.get("sub")
+    return username
+
+
+def decode_access_token_cached(token: str) -> str | None:
+    """``decode_access_token`` with a short-lived cache of verified tokens.
+
+    Used by the auth middleware, which sees the same cookie on every
+    request from a browser session. Invalid tokens are not cached.
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()
+    username = _token_cache.get(key)
+    if username is not None:
+        return username
+
+    payload = _decode_payload(token)
+    if payload is None:
+        return None
+    username = payload.get("sub")
+    if username is None:
+        return None
+
+    ttl = min(TOKEN_CACHE_TTL, payload["exp"] - time.time()) if "exp" in payload else TOKEN_CACHE_TTL
+    _token_cache.set(key, username, ttl=ttl)
+    return username
+
+
+def _decode_payload(token: str) -> dict | None:
+    """Verify a JWT and return its claims, or None if invalid/expired."""
     try:
-        payload = jwt.decode(
+        return jwt.decode(
             token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]
         )
-        username: str | None = payload.get("sub")
-        return username
     except JWTError:
         return None
 
 
-def authenticate_user(db: Session, username: str, password: str) -> User | None:
-    """Validate credentials and return the User, or None."""
-    user = db.execute(
-        select(User).where(User.username == username.lower())
-    ).scalar_one_or_none()
+def authenticate_user(db: Session, username: str, password: str) -> Row | None:
+    """Validate credentials and return the user's (id, username), or None.
+
+    The row is read and the transaction ended before the bcrypt check, so
+    the pooled connection isn't held for the ~250 ms the hash takes.
+    """
+    row = db.execute(
+        select(User.id, User.username, User.hashed_password)
+        .where(User.username == username.lower())
+    ).one_or_none()
+    db.rollback()
 
-    if user is None:
+    if row is None:
         return None
-    if not verify_password(password, user.hashed_password):
+    if not verify_password(password, row.hashed_password):
         return None
-    return user
+    return row
+
+
+def record_login(user_id: int) -> None:
+    """Stamp ``users.last_login`` in its own session.
+
+    Runs as a background task after the login response is sent, so a
+    failure here is logged rather than surfaced to the client.
+    """
+    try:
+        run_in_session(SessionLocal, _set_last_login, user_id)
+    except SQLAlchemyError:
+        logger.warning("Failed to record last_login for user %s", user_id, exc_info=True)
+
+
+def _set_last_login(db: Session, user_id: int) -> None:
+    db.execute(update(User).where(User.id == user_id).values(last_login=func.now()))
 
 
 def ensure_admin_user(db: Session) -> None:
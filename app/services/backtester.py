@@ -14,7 +14,8 @@ from collections import Counter
 from datetime import date, datetime, timedelta, timezone
 from itertools import product
 
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy import Select, select
 from sqlalchemy.orm import Session
 
 from app.models.celestial_state import CelestialState
@@ -27,6 +28,25 @@ from app.services.confluence_engine import ConfluenceEngine
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per server-side cursor round-trip when streaming score series.
+REPLAY_YIELD_PER = 10_000
+
+
+def _daily_values(db: Session, stmt: Select) -> dict[date, float]:
+    """Stream ``(timestamp_or_date, value)`` rows into a date -> float map.
+
+    Selects plain columns rather than ORM entities and fetches with
+    ``yield_per``, so no model instances are built and only one batch of
+    rows is held in memory at a time. Falsy values are skipped; for
+    duplicate dates the last row in ``stmt``'s order wins.
+    """
+    result = db.execute(stmt.execution_options(yield_per=REPLAY_YIELD_PER))
+    return {
+        (key.date() if isinstance(key, datetime) else key): float(value)
+        for key, value in result
+        if value
+    }
+
 
 class CycleBacktester:
     """Statistical validation of the 47-day crash cycle hypothesis."""
@@ -204,14 +224,22 @@ class CycleBacktester:
         mercury_retro_count = 0
         total_with_data = 0
 
+        # One query for every event date instead of one per event
+        timestamps = {
+            datetime(d.year, d.month, d.day, tzinfo=timezone.utc)
+            for d in (event["date"] for event in events)
+        }
+        rows = db.execute(
+            select(
+                CelestialState.timestamp,
+                CelestialState.lunar_phase_name,
+                CelestialState.mercury_retrograde,
+            ).where(CelestialState.timestamp.in_(timestamps))
+        ).all()
+        states = {r.timestamp.date(): r for r in rows}
+
         for event in events:
-            ts = datetime(
-                event["date"].year, event["date"].month, event["date"].day,
-                tzinfo=timezone.utc,
-            )
-            state = db.execute(
-                select(CelestialState).where(CelestialState.timestamp == ts)
-            ).scalar_one_or_none()
+            state = states.get(event["date"])
 
             if state:
                 total_with_data += 1
@@ -250,10 +278,18 @@ class CycleBacktester:
         master_count = 0
         total_with_data = 0
 
+        dates = {event["date"] for event in events}
+        rows = db.execute(
+            select(
+                NumerologyDaily.date,
+                NumerologyDaily.universal_day_number,
+                NumerologyDaily.is_master_number,
+            ).where(NumerologyDaily.date.in_(dates))
+        ).all()
+        by_date = {r.date: r for r in rows}
+
         for event in events:
-            num = db.execute(
-                select(NumerologyDaily).where(NumerologyDaily.date == event["date"])
-            ).scalar_one_or_none()
+            num = by_date.get(event["date"])
 
             if num:
                 total_with_data += 1
@@ -337,48 +373,49 @@ class SignalBacktester:
         end_date = end or date.today() - timedelta(days=7)  # Need 7d forward data
 
         # Get all daily close prices
-        prices = db.execute(
-            select(PriceData)
+        price_map = _daily_values(
+            db,
+            select(PriceData.timestamp, PriceData.close)
             .where(
                 PriceData.symbol == symbol,
                 PriceData.timeframe == timeframe,
                 PriceData.timestamp >= datetime(start_date.year, start_date.month, start_date.day, tzinfo=timezone.utc),
             )
-            .order_by(PriceData.timestamp.asc())
-        ).scalars().all()
-
-        price_map = {p.timestamp.date(): float(p.close) for p in prices if p.close}
+            .order_by(PriceData.timestamp.asc()),
+        )
 
         # Get all TA scores
-        ta_rows = db.execute(
-            select(TAIndicators)
+        ta_map = _daily_values(
+            db,
+            select(TAIndicators.timestamp, TAIndicators.ta_score)
             .where(
                 TAIndicators.symbol == symbol,
                 TAIndicators.timeframe == timeframe,
             )
-            .order_by(TAIndicators.timestamp.asc())
-        ).scalars().all()
-        ta_map = {r.timestamp.date(): float(r.ta_score) for r in ta_rows if r.ta_score}
+            .order_by(TAIndicators.timestamp.asc()),
+        )
 
         # Get all celestial scores
-        cel_rows = db.execute(
-            select(CelestialState).order_by(CelestialState.timestamp.asc())
-        ).scalars().all()
-        cel_map = {r.timestamp.date(): float(r.celestial_score) for r in cel_rows if r.celestial_score}
+        cel_map = _daily_values(
+            db,
+            select(CelestialState.timestamp, CelestialState.celestial_score)
+            .order_by(CelestialState.timestamp.asc()),
+        )
 
         # Get all numerology scores
-        num_rows = db.execute(
-            select(NumerologyDaily).order_by(NumerologyDaily.date.asc())
-        ).scalars().all()
-        num_map = {r.date: float(r.numerology_score) for r in num_rows if r.numerology_score}
+        num_map = _daily_values(
+            db,
+            select(NumerologyDaily.date, NumerologyDaily.numerology_score)
+            .order_by(NumerologyDaily.date.asc()),
+        )
 
         # Get all sentiment scores
-        sent_rows = db.execute(
-            select(SentimentData)
+        sent_map = _daily_values(
+            db,
+            select(SentimentData.timestamp, SentimentData.sentiment_score)
             .where(SentimentData.symbol == symbol)
-            .order_by(SentimentData.timestamp.asc())
-        ).scalars().all()
-        sent_map = {r.timestamp.date(): float(r.sentiment_score) for r in sent_rows if r.sentiment_score}
+            .order_by(SentimentData.timestamp.asc()),
+        )
 
         weights = self.engine.get_active_weights(db)
         results = []
@@ -534,37 +571,17 @@ class SignalBacktester:
 
         # For efficiency, only test a subset if too many layers
         if n_layers <= 4:
-            weight_options = [s for s in steps]
-            for combo in product(weight_options, repeat=n_layers):
-                if abs(sum(combo) - 1.0) > 0.01:
-                    continue
-
-                weights = {
-                    layer: w
-                    for layer, w in zip(layer_list, combo)
-                }
-                # Add zero weight for missing layers
-                for key in ["ta", "onchain", "celestial", "numerology", "sentiment", "political"]:
-                    weights.setdefault(key, 0.0)
-
-                # Re-compute composite with these weights
-                results = []
-                for r in replay_data:
-                    scores = {}
-                    for layer in ["ta", "onchain", "celestial", "numerology", "sentiment", "political"]:
-                        scores[f"{layer}_score"] = r["scores"].get(f"{layer}_score")
-                    composite = self._quick_composite(scores, weights)
-                    results.append({
-                        **r,
-                        "composite_score": composite,
-                    })
-
-                accuracy = self.compute_accuracy(results)
-                combos_tested += 1
-
-                if accuracy["hit_rate_7d"] > best_hit_rate and accuracy["total_signals"] >= 5:
-                    best_hit_rate = accuracy["hit_rate_7d"]
-                    best_weights = {k: v for k, v in weights.items() if v > 0}
+            combos = [
+                combo for combo in product(steps, repeat=n_layers)
+                if abs(sum(combo) - 1.0) <= 0.01
+            ]
+            hit_rates, signal_counts = self._grid_accuracy(replay_data, layer_list, combos)
+            combos_tested = len(combos)
+
+            for combo, hit_rate, total_signals in zip(combos, hit_rates, signal_counts):
+                if hit_rate > best_hit_rate and total_signals >= 5:
+                    best_hit_rate = hit_rate
+                    best_weights = dict(zip(layer_list, combo))
         else:
             # With many layers, just test a few reasonable combos
             best_weights = {l: round(1.0 / n_layers, 2) for l in layer_list}
@@ -585,6 +602,55 @@ class SignalBacktester:
             "best_hit_rate_7d": round(best_hit_rate, 4),
         }
 
+    @staticmethod
+    def _grid_accuracy(
+        replay_data: list[dict], layer_list: list[str], combos: list[tuple]
+    ) -> tuple[list[float], list[int]]:
+        """Score every weight combination against the replay in one pass.
+
+        Vectorised equivalent of running _quick_composite + compute_accuracy
+        per combination: the (days x layers) score matrix is built once and
+        each combination's composites come out of one matrix product.
+
+        Returns:
+            (hit_rate_7d, total_signals) per combination, in ``combos`` order.
+        """
+        scores = np.array(
+            [[r["scores"].get(f"{l}_score", np.nan) for l in layer_list] for r in replay_data],
+            dtype=float,
+        ).reshape(len(replay_data), len(layer_list))
+        change_1d = np.array(
+            [r.get("price_change_1d_pct", np.nan) for r in replay_data], dtype=float
+        )
+        change_7d = np.array(
+            [r.get("price_change_7d_pct", np.nan) for r in replay_data], dtype=float
+        )
+        weights = np.array(combos, dtype=float).T  # layers x combos
+
+        present = ~np.isnan(scores)
+        weighted = np.where(present, scores, 0.0) @ weights
+        total_weight = present.astype(float) @ weights
+        with np.errstate(divide="ignore", invalid="ignore"):
+            composite = np.where(total_weight > 0, weighted / total_weight, 0.0)
+        composite = np.round(np.clip(composite, -1.0, 1.0), 4)  # days x combos
+
+        has_1d = ~np.isnan(change_1d)[:, None]
+        has_7d = ~np.isnan(change_7d)[:, None]
+        bullish = (composite > 0.3) & has_1d
+        bearish = (composite < -0.3) & has_1d
+        up_7d = np.nan_to_num(change_7d, nan=0.0)[:, None] > 0
+        down_7d = np.nan_to_num(change_7d, nan=0.0)[:, None] < 0
+
+        total_signals = (bullish | bearish).sum(axis=0)
+        hits_7d = ((bullish & up_7d) | (bearish & down_7d)).sum(axis=0)
+        total_7d = ((bullish | bearish) & has_7d).sum(axis=0)
+
+        hit_rates = [
+            round(int(h) / int(t), 4) if t > 0 else 0
+            for h, t in zip(hits_7d, total_7d)
+        ]
+        return hit_rates, [int(n) for n in total_signals]
+
     def _quick_composite(self, scores: dict, weights: dict) -> float:
         """Quick composite computation without DB access."""
         score_to_weight = {
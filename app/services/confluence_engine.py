@@ -29,6 +29,7 @@ from app.models.xai import XaiComposite
 from app.signals.celestial import CelestialEngine
 from app.signals.numerology import compute_daily_numerology
 from app.services.sentiment_fetch import fetch_and_store_current
+from app.utils import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +53,18 @@ STRENGTH_THRESHOLDS = [
 ]
 # Anything below -0.6 is "strong_sell"
 
+# The active weight profile is read by every confluence computation but only
+# changes through POST /api/confluence/weights, which clears this cache.
+# The TTL bounds staleness if another process (or a manual SQL edit) swaps
+# the profile.
+WEIGHTS_CACHE_TTL = 30.0
+_weights_cache = TTLCache(WEIGHTS_CACHE_TTL)
+
+
+def invalidate_weights_cache() -> None:
+    """Drop the cached active weight profile."""
+    _weights_cache.clear()
+
 
 class ConfluenceEngine:
     """Weighted composite scorer combining all signal layers."""
@@ -59,8 +72,16 @@ class ConfluenceEngine:
     def get_active_weights(self, db: Session) -> dict:
         """Load the active weight profile from signal_weights table.
 
-        Falls back to DEFAULT_WEIGHTS if no active profile exists.
+        Falls back to DEFAULT_WEIGHTS if no active profile exists. The
+        result is cached for WEIGHTS_CACHE_TTL seconds; callers get a copy.
         """
+        weights = _weights_cache.get("active")
+        if weights is None:
+            weights = self._load_active_weights(db)
+            _weights_cache.set("active", weights)
+        return dict(weights)
+
+    def _load_active_weights(self, db: Session) -> dict:
         row = db.execute(
             select(SignalWeights).where(SignalWeights.is_active.is_(True))
         ).scalar_one_or_none()
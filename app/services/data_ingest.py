@@ -7,7 +7,6 @@ and upserts into the price_data table.
 import logging
 import time
 from datetime import datetime, timezone
-from decimal import Decimal
 
 import ccxt
 from sqlalchemy import insert
@@ -28,6 +27,23 @@ BACKFILL_START = datetime(2020, 1, 1, tzinfo=timezone.utc)
 PAGE_SIZE = 1000
 PAGE_SLEEP = 1.0  # seconds between pagination requests
 
+_OHLCV = ("open", "high", "low", "close", "volume")
+
+
+def _candle_upsert():
+    stmt = pg_insert(PriceData.__table__)
+    return stmt.on_conflict_do_update(
+        index_elements=["timestamp", "symbol", "exchange", "timeframe"],
+        set_={col: stmt.excluded[col] for col in _OHLCV},
+    )
+
+
+# Built once and executed with a list of parameter dicts: SQLAlchemy's
+# insertmanyvalues batches the rows into multi-row VALUES pages, and the
+# one compiled form is reused for every page size, instead of compiling a
+# fresh N-row .values(rows) statement per call.
+_CANDLE_UPSERT = _candle_upsert()
+
 
 def fetch_ohlcv(
     symbol: str,
@@ -79,26 +95,15 @@ def upsert_candles(
                 "symbol": symbol,
                 "exchange": exchange,
                 "timeframe": timeframe,
-                "open": Decimal(str(c[1])),
-                "high": Decimal(str(c[2])),
-                "low": Decimal(str(c[3])),
-                "close": Decimal(str(c[4])),
-                "volume": Decimal(str(c[5])),
+                "open": float(c[1]),
+                "high": float(c[2]),
+                "low": float(c[3]),
+                "close": float(c[4]),
+                "volume": float(c[5]),
             }
         )
 
-    stmt = pg_insert(PriceData).values(rows)
-    stmt = stmt.on_conflict_do_update(
-        index_elements=["timestamp", "symbol", "exchange", "timeframe"],
-        set_={
-            "open": stmt.excluded.open,
-            "high": stmt.excluded.high,
-            "low": stmt.excluded.low,
-            "close": stmt.excluded.close,
-            "volume": stmt.excluded.volume,
-        },
-    )
-    db.execute(stmt)
+    db.execute(_CANDLE_UPSERT, rows)
     db.commit()
     return len(rows)
 
@@ -8,7 +8,9 @@ cached in-memory for 30 minutes to manage API costs.
 import json
 import logging
 import time
+from collections.abc import Iterator
 from datetime import date, datetime, timezone
+from functools import lru_cache
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -34,6 +36,21 @@ logger = logging.getLogger(__name__)
 _cache: dict[str, tuple[float, dict]] = {}
 CACHE_TTL_SECONDS = 30 * 60  # 30 minutes
 
+CHAT_NOT_CONFIGURED = "Configure ANTHROPIC_API_KEY to enable chat."
+CHAT_FAILED = "Sorry, I couldn't process that request. Please try again."
+
+
+@lru_cache(maxsize=1)
+def _anthropic_client():
+    """Process-wide Anthropic client.
+
+    The client owns an httpx connection pool, so sharing it lets interpret
+    and chat calls reuse a warm TLS connection instead of opening one each.
+    """
+    import anthropic
+
+    return anthropic.Anthropic(api_key=settings.anthropic_api_key)
+
 SYSTEM_PROMPT = """\
 You are CryptoOracle's AI analyst. Given the signal layer data below, \
 produce a concise market interpretation. Be specific to the numbers shown — \
@@ -342,9 +359,7 @@ class InterpretationEngine:
         self, symbol: str, timeframe: str, context: dict
     ) -> dict:
         """Call Claude Haiku and parse the JSON response."""
-        import anthropic
-
-        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+        client = _anthropic_client()
 
         user_message = (
             f"Signal data for {symbol} ({timeframe}):\n\n"
@@ -408,11 +423,54 @@ class InterpretationEngine:
 
         Returns the assistant's plain-text reply.
         """
-        import anthropic
+        if not settings.anthropic_api_key:
+            return CHAT_NOT_CONFIGURED
+
+        request = self._chat_request(db, symbol, timeframe, messages)
+
+        try:
+            response = _anthropic_client().messages.create(**request)
+            return response.content[0].text
+        except Exception:
+            logger.exception("Chat API call failed for %s", symbol)
+            return CHAT_FAILED
+
+    def stream_chat(
+        self,
+        db: Session,
+        symbol: str,
+        timeframe: str,
+        messages: list[dict],
+    ) -> Iterator[str]:
+        """Like :meth:`chat`, but yield the reply as Claude generates it.
 
+        Signal context is read from *db* before this returns, so the
+        returned iterator never touches the session and can outlive it.
+        """
         if not settings.anthropic_api_key:
-            return "Configure ANTHROPIC_API_KEY to enable chat."
+            return iter((CHAT_NOT_CONFIGURED,))
+
+        request = self._chat_request(db, symbol, timeframe, messages)
+        return self._stream_reply(symbol, request)
+
+    @staticmethod
+    def _stream_reply(symbol: str, request: dict) -> Iterator[str]:
+        """Yield text deltas from a streamed messages API call."""
+        try:
+            with _anthropic_client().messages.stream(**request) as stream:
+                yield from stream.text_stream
+        except Exception:
+            logger.exception("Chat API stream failed for %s", symbol)
+            yield CHAT_FAILED
 
+    def _chat_request(
+        self,
+        db: Session,
+        symbol: str,
+        timeframe: str,
+        messages: list[dict],
+    ) -> dict:
+        """Build the messages API arguments for a chat turn."""
         context = self._gather_context(db, symbol, timeframe)
 
         # Grab latest cached interpretation summary if available
@@ -431,19 +489,12 @@ class InterpretationEngine:
         if cached_summary:
             system += f"\n\nCurrent AI interpretation:\n{cached_summary}"
 
-        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
-
-        try:
-            response = client.messages.create(
-                model="claude-sonnet-4-6",
-                max_tokens=2048,
-                system=system,
-                messages=messages,
-            )
-            return response.content[0].text
-        except Exception:
-            logger.exception("Chat API call failed for %s", symbol)
-            return "Sorry, I couldn't process that request. Please try again."
+        return {
+            "model": "claude-sonnet-4-6",
+            "max_tokens": 2048,
+            "system": system,
+            "messages": messages,
+        }
 
 
 def _f(val) -> float | None:
@@ -4,17 +4,18 @@ Orchestrates all Phase 2 seeding and backfill operations.
 """
 
 import logging
-from datetime import date, timedelta
+from datetime import date
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
+from app.database import run_in_session
 from app.models.gematria_values import GematriaValues
 from app.models.custom_cycles import CustomCycles
 from app.services import cycle_tracker
 from app.services.numerology_compute import GematriaCalculator, reduce_to_digit, _is_prime
 from app.signals.celestial import CelestialEngine
-from app.signals.numerology import compute_daily_numerology
+from app.signals.numerology import compute_numerology_range
 
 logger = logging.getLogger(__name__)
 
@@ -108,23 +109,9 @@ def backfill_celestial(
     """
     start = start or BACKFILL_START
     end = end or date.today()
-    engine = CelestialEngine()
-    count = 0
-    current = start
 
     logger.info("Backfilling celestial data from %s to %s", start, end)
-
-    while current <= end:
-        try:
-            engine.compute_daily_state(current, db)
-            count += 1
-            if count % 100 == 0:
-                logger.info("  Celestial backfill progress: %d days", count)
-        except Exception:
-            logger.exception("Error computing celestial for %s", current)
-
-        current += timedelta(days=1)
-
+    count = CelestialEngine().compute_range(start, end, db)
     logger.info("Celestial backfill complete: %d days", count)
     return count
 
@@ -140,22 +127,9 @@ def backfill_numerology(
     """
     start = start or BACKFILL_START
     end = end or date.today()
-    count = 0
-    current = start
 
     logger.info("Backfilling numerology data from %s to %s", start, end)
-
-    while current <= end:
-        try:
-            compute_daily_numerology(current, db)
-            count += 1
-            if count % 100 == 0:
-                logger.info("  Numerology backfill progress: %d days", count)
-        except Exception:
-            logger.exception("Error computing numerology for %s", current)
-
-        current += timedelta(days=1)
-
+    count = compute_numerology_range(start, end, db)
     logger.info("Numerology backfill complete: %d days", count)
     return count
 
@@ -194,22 +168,24 @@ def cross_reference_events(db: Session) -> int:
     return updated
 
 
-def run_phase2_bootstrap(db: Session) -> dict:
+def run_phase2_bootstrap(session_factory: sessionmaker) -> dict:
     """Full Phase 2 bootstrap: seed terms → seed cycle → backfill celestial → backfill numerology → cross-reference.
 
+    Each step runs in its own short-lived session from ``session_factory``.
+
     Returns summary dict.
     """
     logger.info("=== PHASE 2 BOOTSTRAP START ===")
 
-    gematria_count = seed_gematria_terms(db)
+    gematria_count = run_in_session(session_factory, seed_gematria_terms)
     logger.info("Seeded %d gematria terms", gematria_count)
 
-    cycle_created = seed_47_day_cycle(db)
+    cycle_created = run_in_session(session_factory, seed_47_day_cycle)
     logger.info("47-day cycle: %s", "created" if cycle_created else "already exists")
 
-    celestial_days = backfill_celestial(db)
-    numerology_days = backfill_numerology(db)
-    events_updated = cross_reference_events(db)
+    celestial_days = run_in_session(session_factory, backfill_celestial)
+    numerology_days = run_in_session(session_factory, backfill_numerology)
+    events_updated = run_in_session(session_factory, cross_reference_events)
 
     logger.info("=== PHASE 2 BOOTSTRAP COMPLETE ===")
     return {
@@ -13,12 +13,17 @@ from decimal import Decimal
 
 from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
+from app.database import run_in_session
 from app.models.signal_weights import SignalWeights
 from app.models.ta_indicators import TAIndicators
 from app.services.backtester import CycleBacktester
-from app.services.confluence_engine import ConfluenceEngine, DEFAULT_WEIGHTS
+from app.services.confluence_engine import (
+    ConfluenceEngine,
+    DEFAULT_WEIGHTS,
+    invalidate_weights_cache,
+)
 from app.services.sentiment_fetch import (
     compute_sentiment_score,
     fetch_fear_greed_history,
@@ -59,6 +64,7 @@ def seed_default_weights(db: Session) -> bool:
     )
     db.add(profile)
     db.commit()
+    invalidate_weights_cache()
     logger.info("Default weight profile created")
     return True
 
@@ -169,25 +175,27 @@ def run_initial_backtest(db: Session) -> dict:
     return report
 
 
-def run_phase3_bootstrap(db: Session) -> dict:
+def run_phase3_bootstrap(session_factory: sessionmaker) -> dict:
     """Orchestrate all Phase 3 bootstrap operations.
 
+    Each step runs in its own short-lived session from ``session_factory``.
+
     Returns:
         Summary dict with counts and backtest highlights.
     """
     logger.info("=== Phase 3 Bootstrap Starting ===")
 
     # 1. Seed default weights
-    weights_created = seed_default_weights(db)
+    weights_created = run_in_session(session_factory, seed_default_weights)
 
     # 2. Backfill sentiment
-    sentiment_count = backfill_sentiment(db)
+    sentiment_count = run_in_session(session_factory, backfill_sentiment)
 
     # 3. Backfill confluence scores
-    confluence_count = backfill_confluence(db)
+    confluence_count = run_in_session(session_factory, backfill_confluence)
 
     # 4. Run initial backtest
-    backtest_report = run_initial_backtest(db)
+    backtest_report = run_in_session(session_factory, run_initial_backtest)
 
     summary = {
         "weights_created": weights_created,
@@ -5,7 +5,9 @@ Orchestrates Phase 4 (Political Events Layer) initialization.
 
 import logging
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.database import run_in_session
 
 logger = logging.getLogger(__name__)
 
@@ -60,10 +62,10 @@ def compute_initial_signal(db: Session) -> bool:
         return False
 
 
-def run_phase4_bootstrap(db: Session) -> dict:
+def run_phase4_bootstrap(session_factory: sessionmaker) -> dict:
     """Orchestrate full Phase 4 bootstrap.
 
-    Steps:
+    Steps (each in its own short-lived session from ``session_factory``):
     1. Seed calendar events with gematria enrichment
     2. Fetch initial news from all available sources
     3. Compute first political signal
@@ -72,9 +74,9 @@ def run_phase4_bootstrap(db: Session) -> dict:
     """
     logger.info("Phase 4 bootstrap starting...")
 
-    calendar_count = seed_calendar_events(db)
-    news_count = initial_news_fetch(db)
-    signal_computed = compute_initial_signal(db)
+    calendar_count = run_in_session(session_factory, seed_calendar_events)
+    news_count = run_in_session(session_factory, initial_news_fetch)
+    signal_computed = run_in_session(session_factory, compute_initial_signal)
 
     summary = {
         "calendar_events_seeded": calendar_count,
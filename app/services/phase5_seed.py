@@ -14,9 +14,11 @@ import logging
 from decimal import Decimal
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
+from app.database import run_in_session
 from app.models.signal_weights import SignalWeights
+from app.services.confluence_engine import invalidate_weights_cache
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +89,7 @@ def update_weight_profile(db: Session) -> dict:
             existing.political_weight = Decimal("0.13")
             existing.macro_weight = Decimal("0.20")
             db.commit()
+            invalidate_weights_cache()
             logger.info("Updated existing weight profile with Layer 7 defaults")
             return {"weights": "updated"}
         logger.info("Weight profile already includes macro — skipping")
@@ -106,6 +109,7 @@ def update_weight_profile(db: Session) -> dict:
     )
     db.add(profile)
     db.commit()
+    invalidate_weights_cache()
     logger.info("Created new 7-layer weight profile")
     return {"weights": "created"}
 
@@ -136,18 +140,21 @@ def compute_initial_signal(db: Session) -> dict:
         return {"macro_signal": "error"}
 
 
-def run_phase5_bootstrap(db: Session) -> dict:
-    """Run full Phase 5 bootstrap in order."""
+def run_phase5_bootstrap(session_factory: sessionmaker) -> dict:
+    """Run full Phase 5 bootstrap in order, one short-lived session per step."""
     logger.info("=== Phase 5 Bootstrap: Macro Liquidity (Layer 7) ===")
     results = {}
 
-    results.update(backfill_fred(db))
-    results.update(backfill_forex(db))
-    results.update(backfill_cftc(db))
-    results.update(backfill_eia(db))
-    results.update(update_weight_profile(db))
-    results.update(seed_macro_calendar(db))
-    results.update(compute_initial_signal(db))
+    for step in (
+        backfill_fred,
+        backfill_forex,
+        backfill_cftc,
+        backfill_eia,
+        update_weight_profile,
+        seed_macro_calendar,
+        compute_initial_signal,
+    ):
+        results.update(run_in_session(session_factory, step))
 
     logger.info("=== Phase 5 Bootstrap Complete ===")
     return results
@@ -8,8 +8,9 @@ import logging
 from datetime import date, datetime
 
 from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
+from app.database import run_in_session
 from app.models.xai import XaiEventCalendar, XaiPartnership, XaiTrackedEntity
 
 logger = logging.getLogger(__name__)
@@ -212,40 +213,42 @@ def seed_event_calendar(db: Session) -> int:
     return count
 
 
-def run_phase6_bootstrap(db: Session) -> dict:
-    """Full Phase 6 bootstrap: seed data + initial XAI computation."""
+def run_phase6_bootstrap(session_factory: sessionmaker) -> dict:
+    """Full Phase 6 bootstrap: seed data + initial XAI computation.
+
+    Each step runs in its own short-lived session from ``session_factory``,
+    so a failed fetch is rolled back with its session.
+    """
     results = {}
 
     # 1. Seed partnerships
-    results["partnerships_seeded"] = seed_partnerships(db)
+    results["partnerships_seeded"] = run_in_session(session_factory, seed_partnerships)
 
     # 2. Seed tracked entities
-    results["entities_seeded"] = seed_tracked_entities(db)
+    results["entities_seeded"] = run_in_session(session_factory, seed_tracked_entities)
 
     # 3. Seed event calendar
-    results["calendar_events_seeded"] = seed_event_calendar(db)
+    results["calendar_events_seeded"] = run_in_session(session_factory, seed_event_calendar)
 
     # 4. Fetch initial XRPL data
     try:
         from app.services.xrpl_fetch import fetch_and_store
-        xrpl_result = fetch_and_store(db)
+        xrpl_result = run_in_session(session_factory, fetch_and_store)
         results["xrpl_fetch"] = xrpl_result
     except Exception as exc:
         import traceback
         logger.exception("XRPL initial fetch failed (non-fatal)")
-        db.rollback()  # ensure clean session for composite
         results["xrpl_fetch"] = {"error": str(exc), "traceback": traceback.format_exc()}
 
     # 5. Compute initial XAI composite (works with partnerships alone)
     try:
         from app.services.xai_signal_service import compute_xai_composite
-        xai_result = compute_xai_composite(db)
+        xai_result = run_in_session(session_factory, compute_xai_composite)
         results["xai_score"] = xai_result["xai_score"]
         results["adoption_phase"] = xai_result["adoption_phase"]
     except Exception as exc:
         import traceback
         logger.exception("Initial XAI computation failed (non-fatal)")
-        db.rollback()
         results["xai_score"] = {"error": str(exc), "traceback": traceback.format_exc()}
 
     logger.info("Phase 6 bootstrap complete: %s", results)
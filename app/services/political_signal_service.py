@@ -100,17 +100,17 @@ def compute_political_signal(db: Session) -> dict:
         "upcoming_high_impact_7d": calendar_result.get("upcoming_high_impact_7d"),
         "news_volume_1h": len(news_1h),
         "news_volume_24h": len(news_24h),
-        "avg_news_sentiment_1h": Decimal(str(round(
+        "avg_news_sentiment_1h": round(
             sum(sentiments_1h) / len(sentiments_1h), 4
-        ))) if sentiments_1h else None,
-        "avg_news_sentiment_24h": Decimal(str(round(
+        ) if sentiments_1h else None,
+        "avg_news_sentiment_24h": round(
             sum(sentiments_24h) / len(sentiments_24h), 4
-        ))) if sentiments_24h else None,
-        "max_urgency_1h": Decimal(str(round(max(urgencies_1h), 4))) if urgencies_1h else None,
+        ) if sentiments_24h else None,
+        "max_urgency_1h": round(max(urgencies_1h), 4) if urgencies_1h else None,
         "dominant_narrative": dominant["narrative"] if dominant else None,
-        "narrative_strength": Decimal(str(dominant["strength"])) if dominant else None,
+        "narrative_strength": float(dominant["strength"]) if dominant else None,
         "narrative_direction": dominant["direction"] if dominant else None,
-        "political_score": Decimal(str(composite)),
+        "political_score": float(composite),
     }
 
 
@@ -4,16 +4,20 @@ Hourly: Fetches latest candles, recomputes TA indicators, political signal, conf
 Every 30 minutes: Fetches political news from all available sources.
 Every 4 hours: Fetches sentiment (Fear & Greed) and on-chain metrics.
 Daily: Computes celestial state and numerology for the current date.
+Once at startup: Seeds the admin user (off the startup path).
 """
 
 import logging
+import time
 from datetime import date, datetime, timezone
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
 
 from app.database import SessionLocal
 from app.models.watched_symbols import WatchedSymbols
+from app.services.auth_service import ensure_admin_user
 from app.services.data_ingest import DEFAULT_TIMEFRAMES, fetch_latest
 from app.signals.celestial import CelestialEngine
 from app.signals.numerology import compute_daily_numerology
@@ -23,6 +27,9 @@ logger = logging.getLogger(__name__)
 
 _scheduler: BackgroundScheduler | None = None
 
+ADMIN_SEED_ATTEMPTS = 3
+ADMIN_SEED_BACKOFF = 2.0  # seconds, doubled after each failed attempt
+
 
 def run_hourly_update() -> None:
     """Fetch latest candles, recompute TA, then compute confluence + alerts.
@@ -317,6 +324,29 @@ def run_xai_personnel_update() -> None:
         db.close()
 
 
+def run_admin_seed() -> None:
+    """Seed the admin user from env vars, retrying while the DB comes up.
+
+    Runs once on the scheduler thread right after startup, so a slow or
+    restarting database delays the seed instead of worker readiness.
+    """
+    delay = ADMIN_SEED_BACKOFF
+    for attempt in range(1, ADMIN_SEED_ATTEMPTS + 1):
+        db = SessionLocal()
+        try:
+            ensure_admin_user(db)
+            return
+        except OperationalError:
+            if attempt == ADMIN_SEED_ATTEMPTS:
+                logger.exception("Admin seed failed after %d attempts", attempt)
+                return
+            logger.warning("Admin seed: database unavailable, retrying in %.0fs", delay)
+        finally:
+            db.close()
+        time.sleep(delay)
+        delay *= 2
+
+
 def start_scheduler() -> None:
     """Start the background scheduler with all jobs."""
     global _scheduler
@@ -328,6 +358,15 @@ def start_scheduler() -> None:
 
     now = datetime.now(timezone.utc)
 
+    # Once, immediately: seed the admin user if no users exist
+    _scheduler.add_job(
+        run_admin_seed,
+        id="admin_seed",
+        name="Startup admin user seed",
+        next_run_time=now,
+        misfire_grace_time=60,
+    )
+
     # Hourly: fetch candles + recompute TA + confluence + alerts
     _scheduler.add_job(
         run_hourly_update,
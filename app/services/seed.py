@@ -9,8 +9,9 @@ from decimal import Decimal
 
 import pandas as pd
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
+from app.database import run_in_session
 from app.models.historical_events import HistoricalEvents
 from app.models.watched_symbols import WatchedSymbols
 from app.services.data_ingest import DEFAULT_SYMBOLS, DEFAULT_TIMEFRAMES, backfill
@@ -190,31 +191,34 @@ def detect_crashes_and_pumps(db: Session, symbol: str) -> int:
     return len(events)
 
 
-def run_bootstrap(db: Session) -> dict:
+def run_bootstrap(session_factory: sessionmaker) -> dict:
     """Full bootstrap procedure: seed → backfill → compute TA → detect events.
 
+    Each step (and each symbol's event detection) runs in its own
+    short-lived session from ``session_factory``.
+
     Returns:
         Summary dict with counts.
     """
     logger.info("=== BOOTSTRAP START ===")
 
     # 1. Seed watched symbols
-    seeded = seed_watched_symbols(db)
+    seeded = run_in_session(session_factory, seed_watched_symbols)
     logger.info("Seeded symbols: %s", seeded or "(all already present)")
 
     # 2. Backfill historical data
-    backfill_results = backfill_all(db)
+    backfill_results = run_in_session(session_factory, backfill_all)
     total_candles = sum(backfill_results.values())
     logger.info("Backfill complete: %d total candles", total_candles)
 
     # 3. Compute TA indicators
-    ta_count = compute_ta_all(db)
+    ta_count = run_in_session(session_factory, compute_ta_all)
     logger.info("TA computed for %d symbol/timeframe pairs", ta_count)
 
     # 4. Detect crashes and pumps
     total_events = 0
     for symbol in DEFAULT_SYMBOLS:
-        count = detect_crashes_and_pumps(db, symbol)
+        count = run_in_session(session_factory, detect_crashes_and_pumps, symbol)
         total_events += count
 
     logger.info("=== BOOTSTRAP COMPLETE ===")
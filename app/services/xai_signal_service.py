@@ -313,14 +313,13 @@ def compute_xai_composite(db: Session) -> dict:
     }
 
     # Store
-    policy_dec = Decimal(str(policy_score)) if policy_score is not None else None
     row = {
         "timestamp": now,
-        "policy_pipeline_score": policy_dec,
-        "partnership_deployment_score": Decimal(str(partnership_score)),
-        "onchain_utility_score": Decimal(str(onchain_score)),
-        "personnel_intelligence_score": Decimal(str(personnel_score)) if personnel_score is not None else None,
-        "xai_score": Decimal(str(xai_score)),
+        "policy_pipeline_score": float(policy_score) if policy_score is not None else None,
+        "partnership_deployment_score": float(partnership_score),
+        "onchain_utility_score": float(onchain_score),
+        "personnel_intelligence_score": float(personnel_score) if personnel_score is not None else None,
+        "xai_score": float(xai_score),
         "utility_to_speculation_ratio": Decimal(str(ratio)),
         "rlusd_market_cap": Decimal(str(rlusd_cap)),
         "active_partnership_count": total_partners,
@@ -5,7 +5,7 @@ aspects, eclipses, and ingresses. Outputs celestial_score in range -1.0 to +1.0.
 """
 
 import logging
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 
 from sqlalchemy.dialects.postgresql import insert as pg_insert
@@ -42,9 +42,56 @@ class CelestialEngine:
         """Compute celestial_score from celestial state."""
         return compute_celestial_score(state)
 
+    def compute_range(
+        self, start: date, end: date, db: Session, batch_size: int = 500,
+    ) -> int:
+        """Compute and upsert celestial state for every day in [start, end].
+
+        Rows are written batch_size at a time in one multi-row upsert and
+        commit each, instead of one round-trip + commit per day. A batch
+        that fails to write is rolled back and skipped; earlier batches
+        stay committed and later ones still run.
+
+        Returns number of days written.
+        """
+        rows: list[dict] = []
+        count = 0
+        current = start
+        while current <= end:
+            try:
+                rows.append(self._state_row(compute_celestial_state(current)))
+            except Exception:
+                logger.exception("Error computing celestial for %s", current)
+            if len(rows) >= batch_size:
+                count += self._write_batch(db, rows)
+                rows = []
+                logger.info("  Celestial backfill progress: %d days", count)
+            current += timedelta(days=1)
+        if rows:
+            count += self._write_batch(db, rows)
+        return count
+
+    def _write_batch(self, db: Session, rows: list[dict]) -> int:
+        """Upsert one batch, rolling back on failure. Returns rows written."""
+        try:
+            self._upsert_rows(db, rows)
+        except Exception:
+            db.rollback()
+            logger.exception(
+                "Error writing celestial batch %s..%s",
+                rows[0]["timestamp"], rows[-1]["timestamp"],
+            )
+            return 0
+        return len(rows)
+
     def _upsert_state(self, db: Session, state: dict) -> None:
         """Upsert celestial state into the celestial_state table."""
-        row = {
+        self._upsert_rows(db, [self._state_row(state)])
+
+    @staticmethod
+    def _state_row(state: dict) -> dict:
+        """Map a computed celestial state to a celestial_state row."""
+        return {
             "timestamp": state["timestamp"],
             "lunar_phase_angle": Decimal(str(state["lunar_phase_angle"])),
             "lunar_phase_name": state["lunar_phase_name"],
@@ -68,14 +115,16 @@ class CelestialEngine:
             "saturn_longitude": Decimal(str(state["saturn_longitude"])),
             "active_aspects": state["active_aspects"],
             "ingresses": state["ingresses"],
-            "celestial_score": Decimal(str(state["celestial_score"])),
+            "celestial_score": float(state["celestial_score"]),
         }
 
-        update_cols = {k: v for k, v in row.items() if k != "timestamp"}
-        stmt = pg_insert(CelestialState).values([row])
+    @staticmethod
+    def _upsert_rows(db: Session, rows: list[dict]) -> None:
+        """Upsert celestial_state rows in a single statement."""
+        stmt = pg_insert(CelestialState).values(rows)
         stmt = stmt.on_conflict_do_update(
             index_elements=["timestamp"],
-            set_=update_cols,
+            set_={k: stmt.excluded[k] for k in rows[0] if k != "timestamp"},
         )
         db.execute(stmt)
         db.commit()
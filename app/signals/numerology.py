@@ -5,7 +5,7 @@ and gematria analysis. Outputs numerology_score in range -1.0 to +1.0.
 """
 
 import logging
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 
 from sqlalchemy.dialects.postgresql import insert as pg_insert
@@ -75,6 +75,67 @@ def compute_daily_numerology(d: date, db: Session) -> dict:
 
     Returns the computed numerology dict.
     """
+    result = _compute_numerology(d, db)
+
+    # Upsert to DB
+    _upsert_numerology(db, result)
+
+    logger.info(
+        "Numerology computed for %s — UDN=%d, master=%s, score=%.4f",
+        d.isoformat(), result["universal_day_number"],
+        result["is_master_number"], result["numerology_score"],
+    )
+    return result
+
+
+def compute_numerology_range(
+    start: date, end: date, db: Session, batch_size: int = 500,
+) -> int:
+    """Compute and upsert numerology for every day in [start, end].
+
+    Rows are written batch_size at a time in one multi-row upsert and
+    commit each, instead of one round-trip + commit per day. A batch that
+    fails to write is rolled back and skipped; earlier batches stay
+    committed and later ones still run.
+
+    Returns number of days written.
+    """
+    rows: list[dict] = []
+    count = 0
+    current = start
+    while current <= end:
+        try:
+            rows.append(_numerology_row(_compute_numerology(current, db)))
+        except Exception:
+            # The cycle lookup queries the db; clear an aborted transaction
+            # so the next batch can still be written.
+            db.rollback()
+            logger.exception("Error computing numerology for %s", current)
+        if len(rows) >= batch_size:
+            count += _write_batch(db, rows)
+            rows = []
+            logger.info("  Numerology backfill progress: %d days", count)
+        current += timedelta(days=1)
+    if rows:
+        count += _write_batch(db, rows)
+    return count
+
+
+def _write_batch(db: Session, rows: list[dict]) -> int:
+    """Upsert one batch, rolling back on failure. Returns rows written."""
+    try:
+        _upsert_rows(db, rows)
+    except Exception:
+        db.rollback()
+        logger.exception(
+            "Error writing numerology batch %s..%s", rows[0]["date"], rows[-1]["date"],
+        )
+        return 0
+    return len(rows)
+
+
+def _compute_numerology(d: date, db: Session) -> dict:
+    """Compute the numerology dict for a date without writing it."""
     udn = universal_day_number(d)
     is_master = is_master_number_date(d)
     master_val = get_master_number_value(d)
@@ -99,19 +160,17 @@ def compute_daily_numerology(d: date, db: Session) -> dict:
         "numerology_score": score,
     }
 
-    # Upsert to DB
-    _upsert_numerology(db, result)
-
-    logger.info(
-        "Numerology computed for %s — UDN=%d, master=%s, score=%.4f",
-        d.isoformat(), udn, is_master, score,
-    )
     return result
 
 
 def _upsert_numerology(db: Session, data: dict) -> None:
     """Upsert numerology data into numerology_daily table."""
-    row = {
+    _upsert_rows(db, [_numerology_row(data)])
+
+
+def _numerology_row(data: dict) -> dict:
+    """Map a computed numerology dict to a numerology_daily row."""
+    return {
         "date": data["date"],
         "date_digit_sum": data["date_digit_sum"],
         "is_master_number": data["is_master_number"],
@@ -122,11 +181,13 @@ def _upsert_numerology(db: Session, data: dict) -> None:
         "numerology_score": Decimal(str(data["numerology_score"])),
     }
 
-    update_cols = {k: v for k, v in row.items() if k != "date"}
-    stmt = pg_insert(NumerologyDaily).values([row])
+
+def _upsert_rows(db: Session, rows: list[dict]) -> None:
+    """Upsert numerology_daily rows in a single statement."""
+    stmt = pg_insert(NumerologyDaily).values(rows)
     stmt = stmt.on_conflict_do_update(
         index_elements=["date"],
-        set_=update_cols,
+        set_={k: stmt.excluded[k] for k in rows[0] if k != "date"},
     )
     db.execute(stmt)
     db.commit()
@@ -7,7 +7,6 @@ Outputs ta_score in range -1.0 to +1.0.
 
 import logging
 from datetime import datetime, timezone
-from decimal import Decimal
 
 import pandas as pd
 from sqlalchemy import select
@@ -115,7 +114,7 @@ class TechnicalAnalyzer:
         ]
         for col in db_columns:
             val = indicators.get(col)
-            row[col] = Decimal(str(val)) if val is not None else None
+            row[col] = float(val) if val is not None else None
 
         stmt = pg_insert(TAIndicators).values([row])
         stmt = stmt.on_conflict_do_update(
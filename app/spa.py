@@ -0,0 +1,71 @@
+"""ASGI apps that serve the built Vite frontend (frontend/dist)."""
+
+import hashlib
+import os
+from pathlib import Path
+
+from starlette.requests import Request
+from starlette.responses import FileResponse, PlainTextResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Receive, Scope, Send
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """StaticFiles for Vite's content-hashed ``assets/`` output.
+
+    A changed asset always gets a new filename, so browsers and any proxy
+    in front may cache each one for a year and never revalidate.
+    """
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
+class SPAFiles:
+    """Serve files from a Vite build, falling back to index.html.
+
+    Mounted at ``/`` after every API router, so it only sees requests no
+    route matched. As a bare ASGI app it skips FastAPI's path-parameter
+    parsing, dependency solving and response serialisation.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        # Build output is fixed for the process lifetime, so index every file
+        # once: a dict lookup per request instead of a stat(), and no way to
+        # reach paths outside the build.
+        self.files: dict[str, Path] = {
+            p.relative_to(directory).as_posix(): p
+            for p in directory.rglob("*")
+            if p.is_file()
+        }
+        # index.html only changes with a new build (i.e. a redeploy), so read
+        # it once and let browsers revalidate against its ETag.
+        self.index_html = (directory / "index.html").read_bytes()
+        self.index_etag = f'"{hashlib.md5(self.index_html).hexdigest()}"'
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["method"] not in ("GET", "HEAD"):
+            response: Response = PlainTextResponse("Method Not Allowed", status_code=405)
+        else:
+            response = self._response(Request(scope))
+        await response(scope, receive, send)
+
+    def _response(self, request: Request) -> Response:
+        # Try to serve a static file first (e.g. favicon.ico)
+        file_path = self.files.get(request.url.path.lstrip("/"))
+        if file_path is not None:
+            return FileResponse(str(file_path))
+        # Fall back to index.html for client-side routing
+        headers = {"ETag": self.index_etag, "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == self.index_etag:
+            return Response(status_code=304, headers=headers)
+        return Response(self.index_html, media_type="text/html", headers=headers)
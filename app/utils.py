@@ -1,6 +1,15 @@
 """Shared utility functions used across routers and services."""
 
+import threading
+import time
+from collections.abc import Hashable
+from functools import lru_cache
+from typing import Any
 
+
+# Pure and called on every symbol route; the working set is a handful of
+# pairs, and maxsize bounds whatever arbitrary path segments clients send.
+@lru_cache(maxsize=1024)
 def normalize_symbol(symbol: str) -> str:
     """Normalize a trading pair symbol to CCXT format (e.g. BTC/USDT).
 
@@ -21,3 +30,59 @@ def normalize_symbol(symbol: str) -> str:
             # Bare symbol (e.g. "BTC") → default to /USDT pair
             s = s + "/USDT"
     return s
+
+
+def str_or_none(value) -> str | None:
+    """Render a numeric column value as a string, keeping NULL as None.
+
+    Only None maps to None: a truthiness test would also drop Decimal("0").
+    """
+    return None if value is None else str(value)
+
+
+class TTLCache:
+    """Thread-safe in-process cache whose entries expire after ``ttl`` seconds.
+
+    Entries hold (value, monotonic deadline). When ``maxsize`` is set, a
+    full cache evicts its oldest insertion. Values are returned as stored,
+    so callers that hand out mutable values should copy them.
+    """
+
+    def __init__(self, ttl: float, maxsize: int | None = None) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict[Hashable, tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the live value for ``key``, or None if missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is None:
+                return None
+            if hit[1] > now:
+                return hit[0]
+            del self._entries[key]
+            return None
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store ``value`` for ``ttl`` seconds (default: the cache's TTL)."""
+        deadline = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if (
+                self.maxsize is not None
+                and key not in self._entries
+                and len(self._entries) >= self.maxsize
+            ):
+                # Dicts keep insertion order, so the first key is the oldest.
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (value, deadline)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
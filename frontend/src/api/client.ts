@@ -18,3 +18,53 @@ api.interceptors.response.use(
 );
 
 export default api;
+
+/**
+ * POST JSON to a Server-Sent Events endpoint and call `onData` with each
+ * `data:` payload as it arrives. axios buffers the whole body in the
+ * browser, so this uses fetch. Resolves once the server sends
+ * `event: done` or closes the stream.
+ */
+export async function postEventStream(
+  url: string,
+  body: unknown,
+  onData: (data: string) => void,
+): Promise<void> {
+  const response = await fetch(`${api.defaults.baseURL ?? ''}${url}`, {
+    method: 'POST',
+    credentials: 'include',
+    headers: { 'Content-Type': 'application/json', Accept: 'text/event-stream' },
+    body: JSON.stringify(body),
+  });
+  if (response.status === 401 && window.location.pathname !== '/login') {
+    window.location.href = '/login';
+  }
+  if (!response.ok || !response.body) {
+    throw new Error(`Request failed with status ${response.status}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) return;
+    buffer += decoder.decode(value, { stream: true });
+    let end: number;
+    while ((end = buffer.indexOf('\n\n')) !== -1) {
+      const block = buffer.slice(0, end);
+      buffer = buffer.slice(end + 2);
+      let event = 'message';
+      let data = '';
+      for (const line of block.split('\n')) {
+        if (line.startsWith('event: ')) event = line.slice(7);
+        else if (line.startsWith('data: ')) data = line.slice(6);
+      }
+      if (event === 'done') {
+        await reader.cancel();
+        return;
+      }
+      onData(data);
+    }
+  }
+}
@@ -80,7 +80,8 @@ export default function ChatPanel() {
           </div>
         ))}
 
-        {isLoading && (
+        {/* Hidden once the streamed reply starts appearing */}
+        {isLoading && messages[messages.length - 1]?.role !== 'assistant' && (
           <div style={{ display: 'flex', justifyContent: 'flex-start' }}>
             <div
               style={{
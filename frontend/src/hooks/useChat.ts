@@ -1,7 +1,7 @@
 import { useCallback, useEffect, useState } from 'react';
 import { useMutation } from '@tanstack/react-query';
-import api from '../api/client';
-import type { ChatMessage, ChatResponse } from '../types/api';
+import { postEventStream } from '../api/client';
+import type { ChatMessage } from '../types/api';
 import { useSymbol } from './useSymbol';
 
 export function useChat() {
@@ -13,7 +13,7 @@ export function useChat() {
     setMessages([]);
   }, [symbol, timeframe]);
 
-  const mutation = useMutation<ChatResponse, Error, string>({
+  const mutation = useMutation<string, Error, string>({
     mutationFn: async (userMessage: string) => {
       const userMsg: ChatMessage = { role: 'user', content: userMessage };
       const allMessages = [...messages, userMsg];
@@ -21,18 +21,25 @@ export function useChat() {
       // Optimistically add user message
       setMessages(allMessages);
 
-      const { data } = await api.post<ChatResponse>(
-        `/api/interpretation/${symbol}/chat`,
+      // Stream the assistant response into a message that grows per delta
+      let reply = '';
+      let started = false;
+      await postEventStream(
+        `/api/interpretation/${symbol}/chat/stream`,
         { messages: allMessages, timeframe },
+        (data) => {
+          reply += (JSON.parse(data) as { text: string }).text;
+          const assistantMsg: ChatMessage = { role: 'assistant', content: reply };
+          // Read the flag now: React may run the updater after it flips
+          const replaceLast = started;
+          started = true;
+          setMessages((prev) =>
+            replaceLast ? [...prev.slice(0, -1), assistantMsg] : [...prev, assistantMsg],
+          );
+        },
       );
 
-      // Add assistant response
-      setMessages((prev) => [
-        ...prev,
-        { role: 'assistant', content: data.response },
-      ]);
-
-      return data;
+      return reply;
     },
   });
 
@@ -1,3 +1,11 @@
 #!/bin/sh
 alembic upgrade head
-exec uvicorn app.main:app --host 0.0.0.0 --port "${PORT:-8000}"
+# uvloop + httptools ship with uvicorn[standard]; name them so a missing
+# wheel fails loudly instead of silently falling back to asyncio + h11.
+# One worker: the APScheduler jobs, bootstrap job status and JWT cache all
+# live in-process, so extra workers would duplicate the scheduled jobs.
+exec uvicorn app.main:app --host 0.0.0.0 --port "${PORT:-8000}" \
+    --loop uvloop --http httptools \
+    --backlog "${UVICORN_BACKLOG:-2048}" \
+    --limit-concurrency "${UVICORN_LIMIT_CONCURRENCY:-1000}" \
+    --timeout-keep-alive "${UVICORN_KEEPALIVE:-5}"
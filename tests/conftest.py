@@ -15,6 +15,20 @@ from app.database import get_db
 from app.main import app
 
 
+@pytest.fixture(autouse=True)
+def _reset_response_caches():
+    """Clear the in-process TTL caches so no test sees another's payload."""
+    from app.routers import health, macro, political, xai
+    from app.services.confluence_engine import invalidate_weights_cache
+
+    health.invalidate_probe_cache()
+    macro.invalidate_signal_cache()
+    political.invalidate_signal_cache()
+    xai.invalidate_latest_cache()
+    invalidate_weights_cache()
+    yield
+
+
 @pytest.fixture()
 def mock_db():
     """Create a mock database session."""
@@ -242,9 +256,9 @@ def make_confluence_row(**overrides):
     return row
 
 
-def make_alert_row(**overrides):
-    row = MagicMock()
-    defaults = {
+def make_alert_mapping(**overrides):
+    """An alerts row as the alerts router reads it: a plain mapping, score as text."""
+    row = {
         "id": 1,
         "created_at": datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc),
         "triggered_at": datetime(2026, 1, 15, 12, 5, tzinfo=timezone.utc),
@@ -253,15 +267,13 @@ def make_alert_row(**overrides):
         "severity": "warning",
         "title": "High confluence bullish: BTC/USDT (+0.6234)",
         "description": "Composite score +0.6234 crossed +0.5 threshold.",
-        "composite_score": Decimal("0.6234"),
-        "aligned_layers": {"direction": "bullish", "layers": ["ta", "celestial"]},
         "trigger_data": {"composite_score": 0.6234},
+        "composite_score": "0.6234",
+        "aligned_layers": {"direction": "bullish", "layers": ["ta", "celestial"]},
         "status": "active",
         "acknowledged_at": None,
     }
-    defaults.update(overrides)
-    for k, v in defaults.items():
-        setattr(row, k, v)
+    row.update(overrides)
     return row
 
 
@@ -375,6 +387,20 @@ def setup_scalars_all(mock_db, rows):
     mock_db.execute.return_value = result
 
 
+def setup_rows_all(mock_db, rows):
+    """Configure mock_db.execute(...).all() to return `rows` (column selects)."""
+    result = MagicMock()
+    result.all.return_value = rows
+    mock_db.execute.return_value = result
+
+
+def setup_mappings_all(mock_db, rows):
+    """Configure mock_db.execute(...).mappings().all() to return `rows`."""
+    result = MagicMock()
+    result.mappings.return_value.all.return_value = rows
+    mock_db.execute.return_value = result
+
+
 def setup_scalar_one_or_none(mock_db, row):
     """Configure mock_db.execute(...).scalar_one_or_none() to return `row`."""
     result = MagicMock()
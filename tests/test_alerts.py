@@ -1,12 +1,15 @@
 """Tests for the alerts management endpoints."""
 
-from tests.conftest import make_alert_row, setup_scalar_one_or_none, setup_scalars_all
+from tests.conftest import (
+    make_alert_mapping,
+    setup_mappings_all,
+)
 
 
 def test_list_alerts(client, mock_db):
     """GET /api/alerts returns list of alerts."""
-    rows = [make_alert_row(), make_alert_row(id=2, alert_type="alignment")]
-    setup_scalars_all(mock_db, rows)
+    rows = [make_alert_mapping(), make_alert_mapping(id=2, alert_type="alignment")]
+    setup_mappings_all(mock_db, rows)
 
     resp = client.get("/api/alerts")
     assert resp.status_code == 200
@@ -17,11 +20,13 @@ def test_list_alerts(client, mock_db):
     assert alert["symbol"] == "BTC/USDT"
     assert alert["status"] == "active"
     assert alert["severity"] == "warning"
+    assert alert["composite_score"] == "0.6234"
+    assert alert["created_at"] == "2026-01-15T12:00:00+00:00"
 
 
 def test_list_alerts_empty(client, mock_db):
     """Returns empty list when no alerts."""
-    setup_scalars_all(mock_db, [])
+    setup_mappings_all(mock_db, [])
 
     resp = client.get("/api/alerts")
     assert resp.status_code == 200
@@ -30,19 +35,21 @@ def test_list_alerts_empty(client, mock_db):
 
 def test_get_alert_by_id(client, mock_db):
     """GET /api/alerts/{id} returns single alert."""
-    row = make_alert_row(id=42)
-    setup_scalar_one_or_none(mock_db, row)
+    result = mock_db.execute.return_value
+    result.mappings.return_value.one_or_none.return_value = make_alert_mapping(id=42)
 
     resp = client.get("/api/alerts/42")
     assert resp.status_code == 200
     data = resp.json()
     assert data["id"] == 42
     assert data["alert_type"] == "confluence"
+    assert data["composite_score"] == "0.6234"
+    assert data["triggered_at"] == "2026-01-15T12:05:00+00:00"
 
 
 def test_get_alert_not_found(client, mock_db):
     """GET /api/alerts/{id} returns error for missing alert."""
-    setup_scalar_one_or_none(mock_db, None)
+    mock_db.execute.return_value.mappings.return_value.one_or_none.return_value = None
 
     resp = client.get("/api/alerts/999")
     assert resp.status_code == 200
@@ -50,23 +57,26 @@ def test_get_alert_not_found(client, mock_db):
 
 
 def test_acknowledge_alert(client, mock_db):
-    """POST /api/alerts/{id}/acknowledge updates status."""
-    row = make_alert_row(id=5)
-    setup_scalar_one_or_none(mock_db, row)
+    """POST /api/alerts/{id}/acknowledge updates status in one UPDATE."""
+    mock_db.execute.return_value.rowcount = 1
 
     resp = client.post("/api/alerts/5/acknowledge")
     assert resp.status_code == 200
     data = resp.json()
     assert data["status"] == "acknowledged"
     assert data["alert_id"] == 5
-    assert row.status == "acknowledged"
-    assert row.acknowledged_at is not None
+    stmt = mock_db.execute.call_args.args[0]
+    assert stmt.is_update
+    params = stmt.compile().params
+    assert params["status"] == "acknowledged"
+    assert params["acknowledged_at"] is not None
+    mock_db.execute.assert_called_once()
     mock_db.commit.assert_called_once()
 
 
 def test_acknowledge_alert_not_found(client, mock_db):
     """POST /api/alerts/{id}/acknowledge returns error for missing alert."""
-    setup_scalar_one_or_none(mock_db, None)
+    mock_db.execute.return_value.rowcount = 0
 
     resp = client.post("/api/alerts/999/acknowledge")
     assert resp.status_code == 200
@@ -74,22 +84,23 @@ def test_acknowledge_alert_not_found(client, mock_db):
 
 
 def test_dismiss_alert(client, mock_db):
-    """POST /api/alerts/{id}/dismiss updates status."""
-    row = make_alert_row(id=7)
-    setup_scalar_one_or_none(mock_db, row)
+    """POST /api/alerts/{id}/dismiss updates status in one UPDATE."""
+    mock_db.execute.return_value.rowcount = 1
 
     resp = client.post("/api/alerts/7/dismiss")
     assert resp.status_code == 200
     data = resp.json()
     assert data["status"] == "dismissed"
     assert data["alert_id"] == 7
-    assert row.status == "dismissed"
+    stmt = mock_db.execute.call_args.args[0]
+    assert stmt.is_update
+    assert stmt.compile().params["status"] == "dismissed"
     mock_db.commit.assert_called_once()
 
 
 def test_dismiss_alert_not_found(client, mock_db):
     """POST /api/alerts/{id}/dismiss returns error for missing alert."""
-    setup_scalar_one_or_none(mock_db, None)
+    mock_db.execute.return_value.rowcount = 0
 
     resp = client.post("/api/alerts/999/dismiss")
     assert resp.status_code == 200
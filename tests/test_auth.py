@@ -2,24 +2,26 @@
 
 from unittest.mock import MagicMock, patch
 
-from tests.conftest import setup_scalar_one_or_none
-
 
 def test_login_success(anon_client, mock_db):
     """POST /api/auth/login with valid credentials returns 200 and sets cookie."""
     from app.services.auth_service import hash_password
 
     user = MagicMock()
+    user.id = 1
     user.username = "admin"
     user.hashed_password = hash_password("secret123")
-    user.last_login = None
-    setup_scalar_one_or_none(mock_db, user)
+    mock_db.execute.return_value.one_or_none.return_value = user
 
-    resp = anon_client.post(
-        "/api/auth/login",
-        json={"username": "admin", "password": "secret123"},
-    )
+    with patch("app.routers.auth.record_login") as mock_record:
+        resp = anon_client.post(
+            "/api/auth/login",
+            json={"username": "admin", "password": "secret123"},
+        )
     assert resp.status_code == 200
+    mock_db.rollback.assert_called_once()  # connection released before bcrypt
+    mock_record.assert_called_once_with(1)
+    mock_db.commit.assert_not_called()
     data = resp.json()
     assert data["status"] == "authenticated"
     assert data["username"] == "admin"
@@ -28,7 +30,7 @@ def test_login_success(anon_client, mock_db):
 
 def test_login_invalid_credentials(anon_client, mock_db):
     """POST /api/auth/login with bad credentials returns 401."""
-    setup_scalar_one_or_none(mock_db, None)
+    mock_db.execute.return_value.one_or_none.return_value = None
 
     resp = anon_client.post(
         "/api/auth/login",
@@ -93,3 +95,103 @@ def test_expired_token_returns_401(anon_client):
     resp = anon_client.get("/api/price/BTC-USDT")
     assert resp.status_code == 401
     assert resp.json()["detail"] == "Invalid or expired token"
+
+
+def test_cached_decode_verifies_once():
+    """decode_access_token_cached only verifies a token on a cache miss."""
+    from app.services import auth_service
+
+    auth_service._token_cache.clear()
+    token = auth_service.create_access_token("admin")
+    with patch.object(
+        auth_service, "_decode_payload", wraps=auth_service._decode_payload
+    ) as decode:
+        assert auth_service.decode_access_token_cached(token) == "admin"
+        assert auth_service.decode_access_token_cached(token) == "admin"
+    assert decode.call_count == 1
+    assert token not in str(auth_service._token_cache)
+    auth_service._token_cache.clear()
+
+
+def test_cached_decode_never_outlives_token_exp():
+    """A cache entry expires no later than the token's own exp claim."""
+    import time
+    from datetime import datetime, timedelta, timezone
+
+    from jose import jwt
+
+    from app.config import settings
+    from app.services import auth_service
+
+    auth_service._token_cache.clear()
+    token = jwt.encode(
+        {"sub": "admin", "exp": datetime.now(timezone.utc) + timedelta(seconds=5)},
+        settings.jwt_secret_key,
+        algorithm=settings.jwt_algorithm,
+    )
+    assert auth_service.decode_access_token_cached(token) == "admin"
+    assert len(auth_service._token_cache) == 1
+    with patch("app.utils.time.monotonic", return_value=time.monotonic() + 5):
+        with patch.object(auth_service, "_decode_payload", return_value=None) as decode:
+            assert auth_service.decode_access_token_cached(token) is None
+    decode.assert_called_once()
+    auth_service._token_cache.clear()
+
+
+def test_cached_decode_does_not_cache_invalid_tokens():
+    """Invalid tokens return None and leave the cache empty."""
+    from app.services import auth_service
+
+    auth_service._token_cache.clear()
+    assert auth_service.decode_access_token_cached("not-a-jwt") is None
+    assert len(auth_service._token_cache) == 0
+
+
+def test_classify_path():
+    """Auth middleware path classes: public, SPA/static, protected API."""
+    from app.main import PATH_PROTECTED, PATH_PUBLIC, PATH_STATIC, _classify_path
+
+    assert _classify_path("/health") == PATH_STATIC
+    assert _classify_path("/api/auth/login") == PATH_STATIC
+    assert _classify_path("/api/auth/me") == PATH_PUBLIC
+    assert _classify_path("/api/price/BTC-USDT") == PATH_PROTECTED
+    assert _classify_path("/assets/index.js") == PATH_STATIC
+    assert _classify_path("/dashboard") == PATH_STATIC
+
+
+def test_static_path_skips_token_decode(client):
+    """SPA/static requests never verify the auth cookie."""
+    with patch("app.main.decode_access_token_cached") as decode:
+        client.get("/some/spa/route")
+    decode.assert_not_called()
+
+
+def test_public_path_skips_token_decode(client):
+    """Public endpoints that never read the user skip the cookie decode."""
+    with patch("app.main.decode_access_token_cached") as decode:
+        client.get("/health")
+    decode.assert_not_called()
+
+
+def test_access_token_read_from_raw_headers():
+    """The middleware pulls the cookie from the ASGI scope without a Request."""
+    from app.main import _access_token
+
+    scope = {"headers": [(b"accept", b"*/*"), (b"cookie", b"theme=dark; access_token=abc.def")]}
+    assert _access_token(scope) == "abc.def"
+    assert _access_token({"headers": []}) is None
+
+
+def test_record_login_swallows_db_errors():
+    """A failed last_login write is logged, not raised from the background task."""
+    from sqlalchemy.exc import OperationalError
+
+    from app.services import auth_service
+
+    with patch.object(
+        auth_service, "run_in_session", side_effect=OperationalError("UPDATE", {}, None)
+    ) as mock_run:
+        auth_service.record_login(7)
+    mock_run.assert_called_once_with(
+        auth_service.SessionLocal, auth_service._set_last_login, 7
+    )
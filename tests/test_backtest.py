@@ -81,3 +81,92 @@ def test_run_weight_optimizer(client, mock_db):
     data = resp.json()
     assert data["status"] == "complete"
     assert data["best_7day_hit_rate"] == 0.78
+
+
+def test_daily_values_streams_columns():
+    """_daily_values maps rows to date -> float, streaming with yield_per."""
+    from datetime import date, datetime, timezone
+    from decimal import Decimal
+    from unittest.mock import MagicMock
+
+    from sqlalchemy import select
+
+    from app.models.celestial_state import CelestialState
+    from app.services.backtester import REPLAY_YIELD_PER, _daily_values
+
+    db = MagicMock()
+    db.execute.return_value = [
+        (datetime(2024, 1, 1, tzinfo=timezone.utc), Decimal("0.5")),
+        (datetime(2024, 1, 2, tzinfo=timezone.utc), None),
+        (date(2024, 1, 3), 0.25),
+    ]
+    stmt = select(CelestialState.timestamp, CelestialState.celestial_score)
+
+    result = _daily_values(db, stmt)
+
+    assert result == {date(2024, 1, 1): 0.5, date(2024, 1, 3): 0.25}
+    executed = db.execute.call_args.args[0]
+    assert executed.get_execution_options()["yield_per"] == REPLAY_YIELD_PER
+
+
+def test_cross_reference_celestial_single_query():
+    """Celestial cross-reference issues one query for all crash events."""
+    from datetime import date, datetime, timezone
+    from types import SimpleNamespace
+    from unittest.mock import MagicMock
+
+    from app.services.backtester import CycleBacktester
+
+    db = MagicMock()
+    db.execute.return_value.all.return_value = [
+        SimpleNamespace(
+            timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            lunar_phase_name="Full Moon",
+            mercury_retrograde=True,
+        ),
+    ]
+    events = [{"date": date(2024, 1, 1)}, {"date": date(2024, 1, 1)}, {"date": date(2024, 2, 1)}]
+
+    report = CycleBacktester().cross_reference_celestial(db, events)
+
+    assert db.execute.call_count == 1
+    assert report["events_with_celestial_data"] == 2
+    assert report["lunar_phase_distribution"] == {"Full Moon": 2}
+
+
+def test_grid_accuracy_matches_per_combo_scoring():
+    """The vectorised grid scores every combo as _quick_composite + compute_accuracy would."""
+    import random
+    from itertools import product
+
+    from app.services.backtester import SignalBacktester
+
+    rng = random.Random(47)
+    layers = ["celestial", "numerology", "sentiment", "ta"]
+    replay = []
+    for i in range(200):
+        scores = {
+            f"{l}_score": round(rng.uniform(-1, 1), 4)
+            for l in layers if l == "ta" or rng.random() > 0.3
+        }
+        replay.append({
+            "date": f"d{i}",
+            "scores": scores,
+            "price_change_1d_pct": None if i % 17 == 0 else rng.uniform(-5, 5),
+            "price_change_7d_pct": None if i % 11 == 0 else rng.uniform(-10, 10),
+        })
+    steps = [round(x * 0.1, 1) for x in range(1, 10)]
+    combos = [c for c in product(steps, repeat=4) if abs(sum(c) - 1.0) <= 0.01]
+    assert len(combos) == 84
+
+    bt = SignalBacktester.__new__(SignalBacktester)
+    hit_rates, signal_counts = bt._grid_accuracy(replay, layers, combos)
+
+    for combo, hit_rate, total in zip(combos, hit_rates, signal_counts):
+        weights = dict(zip(layers, combo))
+        accuracy = bt.compute_accuracy([
+            {**r, "composite_score": bt._quick_composite(r["scores"], weights)}
+            for r in replay
+        ])
+        assert hit_rate == accuracy["hit_rate_7d"]
+        assert total == accuracy["total_signals"]
@@ -0,0 +1,121 @@
+"""Tests for the background bootstrap endpoints."""
+
+from unittest.mock import MagicMock, patch
+
+import app.main as main
+
+
+def test_bootstrap_runs_in_background(client):
+    """POST /api/bootstrap returns immediately and the job records its result."""
+    main._bootstrap_jobs.clear()
+    with patch("app.services.seed.run_bootstrap", return_value={"candles": 10}) as run:
+        resp = client.post("/api/bootstrap")
+
+    assert resp.status_code == 202
+    assert resp.json() == {"status": "accepted", "job": "phase1"}
+    run.assert_called_once_with(main.BulkSessionLocal)
+
+    status = client.get("/api/bootstrap/status").json()
+    assert status["phase1"]["status"] == "complete"
+    assert status["phase1"]["candles"] == 10
+
+
+def test_bootstrap_job_records_error(client):
+    """A failing bootstrap is reported via /api/bootstrap/status."""
+    main._bootstrap_jobs.clear()
+    with patch("app.services.phase2_seed.run_phase2_bootstrap", side_effect=RuntimeError("boom")):
+        resp = client.post("/api/bootstrap/phase2")
+
+    assert resp.json()["status"] == "accepted"
+    status = client.get("/api/bootstrap/status").json()
+    assert status["phase2"]["status"] == "error"
+    assert status["phase2"]["error"] == "boom"
+
+
+def test_bootstrap_not_requeued_while_running(client):
+    """A second trigger while a job is running does not queue another run."""
+    main._bootstrap_jobs.clear()
+    main._bootstrap_jobs["phase1"] = {"status": "running"}
+    with patch("app.services.seed.run_bootstrap") as run:
+        resp = client.post("/api/bootstrap")
+
+    assert resp.status_code == 409
+    assert resp.json() == {"status": "running", "job": "phase1"}
+    run.assert_not_called()
+    main._bootstrap_jobs.clear()
+
+
+def test_bootstrap_not_requeued_while_queued(client):
+    """A second trigger before the first task starts is rejected."""
+    main._bootstrap_jobs.clear()
+    with patch.object(main, "_run_bootstrap_job") as run_job:
+        first = client.post("/api/bootstrap")
+        second = client.post("/api/bootstrap")
+
+    assert first.status_code == 202
+    assert second.status_code == 409
+    assert second.json() == {"status": "queued", "job": "phase1"}
+    run_job.assert_called_once()
+    main._bootstrap_jobs.clear()
+
+
+def test_later_phases_run_in_background(client):
+    """Phases 3-6 are queued the same way as phases 1-2."""
+    main._bootstrap_jobs.clear()
+    with patch("app.services.phase5_seed.run_phase5_bootstrap", return_value={"fred": 3}):
+        resp = client.post("/api/bootstrap/phase5")
+
+    assert resp.status_code == 202
+    assert resp.json() == {"status": "accepted", "job": "phase5"}
+    assert main._bootstrap_jobs["phase5"]["status"] == "complete"
+    main._bootstrap_jobs.clear()
+
+
+def test_run_in_session_commits_and_closes():
+    """Each bootstrap step gets a fresh session that is committed and closed."""
+    from app.database import run_in_session
+
+    session = MagicMock()
+    factory = MagicMock()
+    factory.return_value.__enter__.return_value = session
+    step = MagicMock(return_value=7)
+
+    assert run_in_session(factory, step, "BTC/USDT") == 7
+
+    step.assert_called_once_with(session, "BTC/USDT")
+    session.commit.assert_called_once()
+    factory.return_value.__exit__.assert_called_once()
+
+
+def test_phase5_runs_each_step_in_own_session():
+    """Phase 5 opens one session per step instead of one for the whole run."""
+    from app.services import phase5_seed
+
+    factory = MagicMock()
+    steps = [
+        "backfill_fred", "backfill_forex", "backfill_cftc", "backfill_eia",
+        "update_weight_profile", "seed_macro_calendar", "compute_initial_signal",
+    ]
+    patches = [patch.object(phase5_seed, name, return_value={name: 1}) for name in steps]
+    for p in patches:
+        p.start()
+    try:
+        result = phase5_seed.run_phase5_bootstrap(factory)
+    finally:
+        for p in patches:
+            p.stop()
+
+    assert factory.call_count == len(steps)
+    assert set(result) == set(steps)
+
+
+def test_unknown_bootstrap_phase_rejected(client):
+    """Only the registered phases are accepted by the parameterized route."""
+    resp = client.post("/api/bootstrap/phase9")
+    assert resp.status_code == 422
+
+
+def test_bootstrap_runners_resolve():
+    """Every registry entry points at an importable runner."""
+    for phase in main.BOOTSTRAP_RUNNERS:
+        assert callable(main._load_runner(phase))
@@ -2,13 +2,13 @@
 
 from unittest.mock import patch
 
-from tests.conftest import make_celestial_row, setup_scalar_one_or_none, setup_scalars_all
+from tests.conftest import make_celestial_row, setup_rows_all
 
 
 def test_get_current_celestial_cached(client, mock_db):
     """GET /api/celestial/current returns cached state from DB."""
     row = make_celestial_row()
-    setup_scalar_one_or_none(mock_db, row)
+    mock_db.get.return_value = row
 
     resp = client.get("/api/celestial/current")
     assert resp.status_code == 200
@@ -21,7 +21,7 @@ def test_get_current_celestial_cached(client, mock_db):
 
 def test_get_current_celestial_computes_on_miss(client, mock_db):
     """When no cached state, computes on-the-fly via CelestialEngine."""
-    setup_scalar_one_or_none(mock_db, None)
+    mock_db.get.return_value = None
 
     with patch("app.routers.celestial.CelestialEngine") as MockEngine:
         engine_instance = MockEngine.return_value
@@ -39,7 +39,7 @@ def test_get_current_celestial_computes_on_miss(client, mock_db):
 def test_get_celestial_by_date(client, mock_db):
     """GET /api/celestial/{date} returns state for specific date."""
     row = make_celestial_row()
-    setup_scalar_one_or_none(mock_db, row)
+    mock_db.get.return_value = row
 
     resp = client.get("/api/celestial/2026-01-15")
     assert resp.status_code == 200
@@ -50,7 +50,7 @@ def test_get_celestial_by_date(client, mock_db):
 def test_get_celestial_history(client, mock_db):
     """GET /api/celestial/history returns list of states."""
     rows = [make_celestial_row(), make_celestial_row()]
-    setup_scalars_all(mock_db, rows)
+    setup_rows_all(mock_db, rows)
 
     resp = client.get("/api/celestial/history?limit=10")
     assert resp.status_code == 200
@@ -61,8 +61,79 @@ def test_get_celestial_history(client, mock_db):
 
 def test_get_celestial_history_empty(client, mock_db):
     """Returns empty list when no history data exists."""
-    setup_scalars_all(mock_db, [])
+    setup_rows_all(mock_db, [])
 
     resp = client.get("/api/celestial/history")
     assert resp.status_code == 200
     assert resp.json()["count"] == 0
+
+
+def test_get_celestial_history_fields(client, mock_db):
+    """?fields= narrows both the SELECT and the payload."""
+    setup_rows_all(mock_db, [make_celestial_row()])
+
+    resp = client.get("/api/celestial/history?fields=celestial_score,mercury_retrograde")
+    assert resp.status_code == 200
+    assert set(resp.json()["data"][0]) == {
+        "timestamp", "mercury_retrograde", "celestial_score",
+    }
+    stmt = mock_db.execute.call_args[0][0]
+    assert [c.name for c in stmt.selected_columns] == [
+        "timestamp", "mercury_retrograde", "celestial_score",
+    ]
+
+
+def test_get_celestial_history_keeps_zero_decimals(client, mock_db):
+    """A zero Numeric is rendered as "0", not dropped to null."""
+    from decimal import Decimal
+
+    setup_rows_all(mock_db, [make_celestial_row(lunar_illumination=Decimal("0"))])
+
+    resp = client.get("/api/celestial/history?fields=lunar_illumination")
+    assert resp.json()["data"][0]["lunar_illumination"] == "0"
+
+
+def test_get_celestial_history_unknown_field(client, mock_db):
+    """Unknown projection fields are rejected."""
+    resp = client.get("/api/celestial/history?fields=celestial_score,bogus")
+    assert resp.status_code == 400
+    mock_db.execute.assert_not_called()
+
+
+def test_compute_range_batches_upserts(mock_db):
+    """compute_range writes one multi-row upsert + commit per batch."""
+    from datetime import date
+
+    from app.signals.celestial import CelestialEngine
+
+    count = CelestialEngine().compute_range(
+        date(2024, 1, 1), date(2024, 1, 5), mock_db, batch_size=2,
+    )
+    assert count == 5
+    assert mock_db.execute.call_count == 3
+    assert mock_db.commit.call_count == 3
+
+
+def test_compute_range_skips_failed_batch(mock_db):
+    """A batch that fails to upsert is rolled back; later batches still run."""
+    from datetime import date
+
+    from app.signals.celestial import CelestialEngine
+
+    mock_db.execute.side_effect = [None, RuntimeError("boom"), None]
+    count = CelestialEngine().compute_range(
+        date(2024, 1, 1), date(2024, 1, 5), mock_db, batch_size=2,
+    )
+    assert count == 3
+    assert mock_db.execute.call_count == 3
+    mock_db.rollback.assert_called_once()
+
+
+def test_state_row_score_is_float():
+    """celestial_score is a REAL column, so the row carries a float."""
+    from datetime import date
+
+    from app.signals.celestial import CelestialEngine, compute_celestial_state
+
+    row = CelestialEngine._state_row(compute_celestial_state(date(2024, 1, 1)))
+    assert type(row["celestial_score"]) is float
@@ -5,6 +5,8 @@ from unittest.mock import patch, MagicMock
 from tests.conftest import (
     make_confluence_row,
     make_signal_weights_row,
+    setup_rows_all,
+    setup_scalar_one_or_none,
     setup_scalars_all,
 )
 
@@ -43,7 +45,7 @@ def test_get_confluence(client, mock_db):
 def test_get_confluence_history(client, mock_db):
     """GET /api/confluence/{symbol}/history returns historical scores."""
     rows = [make_confluence_row(), make_confluence_row()]
-    setup_scalars_all(mock_db, rows)
+    setup_rows_all(mock_db, rows)
 
     resp = client.get("/api/confluence/BTCUSDT/history?timeframe=1d&limit=50")
     assert resp.status_code == 200
@@ -55,13 +57,25 @@ def test_get_confluence_history(client, mock_db):
 
 def test_get_confluence_history_empty(client, mock_db):
     """Returns empty list when no history."""
-    setup_scalars_all(mock_db, [])
+    setup_rows_all(mock_db, [])
 
     resp = client.get("/api/confluence/BTCUSDT/history")
     assert resp.status_code == 200
     assert resp.json()["count"] == 0
 
 
+def test_get_confluence_history_gzipped(client, mock_db):
+    """Large history payloads are gzip-encoded for clients that accept it."""
+    setup_rows_all(mock_db, [make_confluence_row() for _ in range(50)])
+
+    resp = client.get(
+        "/api/confluence/BTCUSDT/history", headers={"Accept-Encoding": "gzip"},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.json()["count"] == 50
+
+
 def test_get_weights(client, mock_db):
     """GET /api/confluence/weights returns active weight profile."""
     with patch("app.routers.confluence.ConfluenceEngine") as MockEngine:
@@ -119,3 +133,60 @@ def test_update_weights_invalid_sum(client, mock_db):
     assert "sum to 1.0" in data["error"]
 
     mock_db.commit.assert_not_called()
+
+
+def test_active_weights_cached_until_invalidated():
+    """get_active_weights hits the DB once per TTL; a weight update clears it."""
+    import time
+
+    from app.services import confluence_engine
+    from app.services.confluence_engine import ConfluenceEngine, invalidate_weights_cache
+
+    invalidate_weights_cache()
+    db = MagicMock()
+    db.execute.return_value.scalar_one_or_none.return_value = make_signal_weights_row()
+    engine = ConfluenceEngine()
+
+    first = engine.get_active_weights(db)
+    first["ta"] = 0.99  # callers get a copy; mutating it can't poison the cache
+    assert engine.get_active_weights(db)["ta"] == 0.25
+    assert db.execute.call_count == 1
+
+    invalidate_weights_cache()
+    engine.get_active_weights(db)
+    assert db.execute.call_count == 2
+
+    expired = time.monotonic() + confluence_engine.WEIGHTS_CACHE_TTL + 1
+    with patch("app.utils.time.monotonic", return_value=expired):
+        engine.get_active_weights(db)
+    assert db.execute.call_count == 3
+    invalidate_weights_cache()
+
+
+def test_seeded_weight_profiles_invalidate_cache(mock_db):
+    """Bootstrap steps that write a weight profile clear the cached weights."""
+    from app.services import phase3_seed, phase5_seed
+
+    setup_scalar_one_or_none(mock_db, None)
+    for seed, fn in ((phase3_seed, phase3_seed.seed_default_weights),
+                     (phase5_seed, phase5_seed.update_weight_profile)):
+        with patch.object(seed, "invalidate_weights_cache") as invalidate:
+            fn(mock_db)
+        invalidate.assert_called_once()
+
+
+def test_update_weights_deactivates_in_one_update(client, mock_db):
+    """Existing profiles are deactivated with a single UPDATE, not row by row."""
+    resp = client.post("/api/confluence/weights", json={
+        "ta": 0.20, "onchain": 0.15, "celestial": 0.12, "numerology": 0.08,
+        "sentiment": 0.12, "political": 0.13, "macro": 0.20,
+    })
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "updated"
+
+    stmt = mock_db.execute.call_args_list[0].args[0]
+    sql = str(stmt)
+    assert sql.startswith("UPDATE signal_weights SET is_active=")
+    assert "WHERE signal_weights.is_active IS true" in sql
+    mock_db.add.assert_called_once()
+    mock_db.commit.assert_called_once()
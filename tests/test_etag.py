@@ -0,0 +1,67 @@
+"""Tests for conditional GETs on the JSON API (ETagMiddleware)."""
+
+from tests.conftest import make_price_row, setup_rows_all
+
+
+def test_api_get_gets_etag_and_revalidates(client, mock_db):
+    """A repeat GET with the returned ETag gets a bodiless 304."""
+    setup_rows_all(mock_db, [make_price_row()])
+
+    first = client.get("/api/prices/BTC-USDT")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    second = client.get("/api/prices/BTC-USDT", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+
+def test_changed_payload_gets_new_etag(client, mock_db):
+    """A stale ETag gets the full new body with a different ETag."""
+    setup_rows_all(mock_db, [make_price_row()])
+    etag = client.get("/api/prices/BTC-USDT").headers["etag"]
+
+    setup_rows_all(mock_db, [make_price_row(), make_price_row()])
+    resp = client.get("/api/prices/BTC-USDT", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["count"] == 2
+    assert resp.headers["etag"] != etag
+
+
+def test_unauthenticated_and_non_get_skip_etag(anon_client, client, mock_db):
+    """401s and non-GET requests are passed through untouched."""
+    resp = anon_client.get("/api/prices/BTC-USDT")
+    assert resp.status_code == 401
+    assert "etag" not in resp.headers
+
+    resp = client.post("/api/auth/logout")
+    assert resp.status_code == 200
+    assert "etag" not in resp.headers
+
+
+def test_if_none_match_list_wildcard_and_weak_compare(client, mock_db):
+    """If-None-Match is a tag list; * and the strong form of the tag match."""
+    setup_rows_all(mock_db, [make_price_row()])
+    etag = client.get("/api/prices/BTC-USDT").headers["etag"]
+
+    for header in (f'"other", {etag}', etag.removeprefix("W/"), "*"):
+        resp = client.get("/api/prices/BTC-USDT", headers={"If-None-Match": header})
+        assert resp.status_code == 304, header
+
+    resp = client.get("/api/prices/BTC-USDT", headers={"If-None-Match": '"other"'})
+    assert resp.status_code == 200
+
+
+def test_large_body_passes_through_untagged(client, mock_db, monkeypatch):
+    """Bodies over ETAG_MAX_BODY are not buffered for an ETag."""
+    import app.main as main
+
+    monkeypatch.setattr(main, "ETAG_MAX_BODY", 10)
+    setup_rows_all(mock_db, [make_price_row()])
+    resp = client.get("/api/prices/BTC-USDT")
+    assert resp.status_code == 200
+    assert resp.json()["count"] == 1
+    assert "etag" not in resp.headers
@@ -28,3 +28,12 @@ def test_health_db_error(client, mock_db):
     data = resp.json()
     assert data["status"] == "degraded"
     assert "error" in data["database"]
+
+
+def test_health_reuses_recent_probe(client, mock_db):
+    """Back-to-back probes within HEALTH_PROBE_TTL run SELECT 1 once."""
+    mock_db.execute.return_value.scalar.return_value = 1
+
+    assert client.get("/health").json()["database"] == "connected"
+    assert client.get("/health").json()["database"] == "connected"
+    assert mock_db.execute.call_count == 1
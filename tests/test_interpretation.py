@@ -0,0 +1,64 @@
+"""Tests for the AI interpretation chat endpoints."""
+
+from unittest.mock import MagicMock, patch
+
+
+def _stream_events(text: str) -> list[tuple[str, str]]:
+    """Split an SSE body into (event, data) pairs."""
+    events = []
+    for block in text.strip().split("\n\n"):
+        event, data = "message", ""
+        for line in block.split("\n"):
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: "):
+                data = line[len("data: "):]
+        events.append((event, data))
+    return events
+
+
+def test_chat_stream_sends_deltas_then_done(client, mock_db):
+    """POST .../chat/stream relays each text delta as an SSE data event."""
+    stream = MagicMock()
+    stream.__enter__.return_value.text_stream = iter(["BTC looks ", "bullish."])
+    anthropic = MagicMock()
+    anthropic.messages.stream.return_value = stream
+
+    with patch("app.services.interpretation_engine.settings") as mock_settings, \
+         patch("app.services.interpretation_engine._anthropic_client", return_value=anthropic), \
+         patch(
+             "app.services.interpretation_engine.InterpretationEngine._gather_context",
+             return_value={},
+         ):
+        mock_settings.anthropic_api_key = "test-key"
+        resp = client.post(
+            "/api/interpretation/BTCUSDT/chat/stream",
+            json={"messages": [{"role": "user", "content": "Outlook?"}]},
+        )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert "content-encoding" not in resp.headers
+    events = _stream_events(resp.text)
+    assert events[:2] == [
+        ("message", '{"text": "BTC looks "}'),
+        ("message", '{"text": "bullish."}'),
+    ]
+    assert events[2][0] == "done"
+    assert anthropic.messages.stream.call_args.kwargs["messages"] == [
+        {"role": "user", "content": "Outlook?"},
+    ]
+
+
+def test_chat_stream_without_api_key(client, mock_db):
+    """Without an API key the stream carries the configuration hint."""
+    with patch("app.services.interpretation_engine.settings") as mock_settings:
+        mock_settings.anthropic_api_key = ""
+        resp = client.post(
+            "/api/interpretation/BTCUSDT/chat/stream",
+            json={"messages": [{"role": "user", "content": "Hi"}]},
+        )
+
+    assert resp.status_code == 200
+    assert "ANTHROPIC_API_KEY" in _stream_events(resp.text)[0][1]
+    mock_db.execute.assert_not_called()
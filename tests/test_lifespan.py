@@ -0,0 +1,69 @@
+"""Tests for the application lifespan composition."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from app.main import app, lifespan
+
+
+def _run_lifespan():
+    async def run():
+        async with lifespan(app):
+            pass
+
+    asyncio.run(run())
+
+
+def test_lifespan_starts_and_stops_scheduler():
+    """Startup starts the scheduler without touching the DB; shutdown stops it."""
+    with patch("app.main.start_scheduler") as start, \
+         patch("app.main.stop_scheduler") as stop:
+        _run_lifespan()
+
+    start.assert_called_once()
+    stop.assert_called_once()
+
+
+def test_lifespan_sizes_threadpool():
+    """Sync endpoints get THREADPOOL_SIZE worker threads while the app runs."""
+    import anyio.to_thread
+
+    from app.config import settings
+
+    async def run():
+        async with lifespan(app):
+            return anyio.to_thread.current_default_thread_limiter().total_tokens
+
+    with patch("app.main.start_scheduler"), patch("app.main.stop_scheduler"):
+        assert asyncio.run(run()) == settings.threadpool_size
+
+
+def test_admin_seed_retries_on_operational_error():
+    """The deferred admin seed retries while the database is unavailable."""
+    from sqlalchemy.exc import OperationalError
+
+    from app.services import scheduler
+
+    err = OperationalError("SELECT 1", {}, Exception("db down"))
+    with patch.object(scheduler, "SessionLocal", return_value=MagicMock()), \
+         patch.object(scheduler, "ensure_admin_user", side_effect=[err, None]) as seed, \
+         patch.object(scheduler.time, "sleep") as sleep:
+        scheduler.run_admin_seed()
+
+    assert seed.call_count == 2
+    sleep.assert_called_once_with(scheduler.ADMIN_SEED_BACKOFF)
+
+
+def test_admin_seed_gives_up_after_max_attempts():
+    """A persistently unreachable database is logged, not raised."""
+    from sqlalchemy.exc import OperationalError
+
+    from app.services import scheduler
+
+    err = OperationalError("SELECT 1", {}, Exception("db down"))
+    with patch.object(scheduler, "SessionLocal", return_value=MagicMock()), \
+         patch.object(scheduler, "ensure_admin_user", side_effect=err) as seed, \
+         patch.object(scheduler.time, "sleep"):
+        scheduler.run_admin_seed()
+
+    assert seed.call_count == scheduler.ADMIN_SEED_ATTEMPTS
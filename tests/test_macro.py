@@ -0,0 +1,51 @@
+"""Tests for the macro liquidity raw-data endpoints."""
+
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from tests.conftest import setup_rows_all
+
+
+def test_get_dollar_data(client, mock_db):
+    """GET /api/macro/dollar returns timestamp + stringified values per row."""
+    setup_rows_all(mock_db, [
+        (datetime(2026, 1, 15), Decimal("103.2500"), None),
+        (datetime(2026, 1, 14), Decimal("102.9000"), Decimal("14.10")),
+    ])
+
+    resp = client.get("/api/macro/dollar?limit=2")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["count"] == 2
+    assert data["data"][0] == {
+        "timestamp": "2026-01-15T00:00:00",
+        "dxy_index": "103.2500",
+        "vix": None,
+    }
+    assert data["data"][1]["vix"] == "14.10"
+
+
+def test_get_macro_signal_cached(client, mock_db):
+    """The latest signal payload is served from cache within its TTL."""
+    row = MagicMock()
+    row.timestamp = datetime(2026, 1, 15)
+    row.macro_score = 0.42
+    row.regime = "risk_on"
+    row.sub_signals = {}
+    mock_db.execute.return_value.first.return_value = row
+
+    first = client.get("/api/macro/signal").json()
+    second = client.get("/api/macro/signal").json()
+    assert first == second
+    assert first["macro_score"] == "0.42"
+    assert mock_db.execute.call_count == 1
+
+
+def test_get_macro_signal_no_data_not_cached(client, mock_db):
+    """'No data yet' is re-checked on every request."""
+    mock_db.execute.return_value.first.return_value = None
+
+    assert client.get("/api/macro/signal").json()["status"] == "no_data"
+    client.get("/api/macro/signal")
+    assert mock_db.execute.call_count == 2
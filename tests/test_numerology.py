@@ -1,7 +1,10 @@
 """Tests for the numerology, gematria, and cycle endpoints."""
 
+from datetime import date
 from unittest.mock import patch, MagicMock
 
+from app.models.numerology_daily import NumerologyDaily
+
 from tests.conftest import (
     make_numerology_row,
     make_gematria_row,
@@ -13,7 +16,7 @@ from tests.conftest import (
 def test_get_current_numerology_cached(client, mock_db):
     """GET /api/numerology/current returns cached row."""
     row = make_numerology_row()
-    setup_scalar_one_or_none(mock_db, row)
+    mock_db.get.return_value = row
 
     resp = client.get("/api/numerology/current")
     assert resp.status_code == 200
@@ -25,10 +28,9 @@ def test_get_current_numerology_cached(client, mock_db):
 
 def test_get_current_numerology_computes_on_miss(client, mock_db):
     """When not cached, computes on-the-fly."""
-    setup_scalar_one_or_none(mock_db, None)
+    mock_db.get.return_value = None
 
     with patch("app.routers.numerology.compute_daily_numerology") as mock_compute:
-        from datetime import date
         mock_compute.return_value = {
             "date": date(2026, 2, 21),
             "universal_day_number": 4,
@@ -44,11 +46,12 @@ def test_get_current_numerology_computes_on_miss(client, mock_db):
 def test_get_numerology_by_date(client, mock_db):
     """GET /api/numerology/{date} returns for specific date."""
     row = make_numerology_row()
-    setup_scalar_one_or_none(mock_db, row)
+    mock_db.get.return_value = row
 
     resp = client.get("/api/numerology/2026-01-15")
     assert resp.status_code == 200
     assert resp.json()["date"] == "2026-01-15"
+    mock_db.get.assert_called_once_with(NumerologyDaily, date(2026, 1, 15))
 
 
 def test_calculate_gematria(client):
@@ -114,3 +117,34 @@ def test_check_cycles_for_date(client, mock_db):
     data = resp.json()
     assert data["date"] == "2026-01-15"
     assert data["aligned_count"] == 1
+
+
+def test_compute_numerology_range_batches_upserts(mock_db):
+    """compute_numerology_range writes one multi-row upsert + commit per batch."""
+    from datetime import date
+
+    from app.signals.numerology import compute_numerology_range
+
+    with patch("app.signals.numerology.cycle_tracker.check_date", return_value=[]):
+        count = compute_numerology_range(
+            date(2024, 1, 1), date(2024, 1, 5), mock_db, batch_size=2,
+        )
+    assert count == 5
+    assert mock_db.execute.call_count == 3
+    assert mock_db.commit.call_count == 3
+
+
+def test_compute_numerology_range_skips_failed_batch(mock_db):
+    """A batch that fails to upsert is rolled back; later batches still run."""
+    from datetime import date
+
+    from app.signals.numerology import compute_numerology_range
+
+    mock_db.execute.side_effect = [None, RuntimeError("boom"), None]
+    with patch("app.signals.numerology.cycle_tracker.check_date", return_value=[]):
+        count = compute_numerology_range(
+            date(2024, 1, 1), date(2024, 1, 5), mock_db, batch_size=2,
+        )
+    assert count == 3
+    assert mock_db.execute.call_count == 3
+    mock_db.rollback.assert_called_once()
@@ -2,7 +2,7 @@
 
 from unittest.mock import patch
 
-from tests.conftest import make_onchain_row, setup_scalar_one_or_none, setup_scalars_all
+from tests.conftest import make_onchain_row, setup_rows_all, setup_scalar_one_or_none
 
 
 def test_get_onchain_status(client):
@@ -67,7 +67,7 @@ def test_get_latest_onchain_none_no_keys(client, mock_db):
 def test_get_onchain_history(client, mock_db):
     """GET /api/onchain/{symbol}/history returns list."""
     rows = [make_onchain_row()]
-    setup_scalars_all(mock_db, rows)
+    setup_rows_all(mock_db, rows)
 
     resp = client.get("/api/onchain/BTCUSDT/history?limit=10")
     assert resp.status_code == 200
@@ -78,7 +78,7 @@ def test_get_onchain_history(client, mock_db):
 
 def test_get_onchain_history_empty(client, mock_db):
     """Returns empty list when no history."""
-    setup_scalars_all(mock_db, [])
+    setup_rows_all(mock_db, [])
 
     resp = client.get("/api/onchain/BTCUSDT/history")
     assert resp.status_code == 200
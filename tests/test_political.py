@@ -6,8 +6,8 @@ from tests.conftest import (
     make_political_calendar_row,
     make_political_news_row,
     make_political_signal_row,
+    setup_rows_all,
     setup_scalar_one_or_none,
-    setup_scalars_all,
 )
 
 
@@ -108,7 +108,7 @@ def test_get_calendar_event_not_found(client, mock_db):
 def test_get_political_news(client, mock_db):
     """GET /api/political/news returns recent articles."""
     rows = [make_political_news_row()]
-    setup_scalars_all(mock_db, rows)
+    setup_rows_all(mock_db, rows)
 
     resp = client.get("/api/political/news?hours=24&limit=50")
     assert resp.status_code == 200
@@ -121,7 +121,7 @@ def test_get_political_news(client, mock_db):
 
 def test_get_political_news_empty(client, mock_db):
     """Returns empty list when no news."""
-    setup_scalars_all(mock_db, [])
+    setup_rows_all(mock_db, [])
 
     resp = client.get("/api/political/news")
     assert resp.status_code == 200
@@ -131,7 +131,7 @@ def test_get_political_news_empty(client, mock_db):
 def test_get_news_history(client, mock_db):
     """GET /api/political/news/history returns history."""
     rows = [make_political_news_row(), make_political_news_row()]
-    setup_scalars_all(mock_db, rows)
+    setup_rows_all(mock_db, rows)
 
     resp = client.get("/api/political/news/history?limit=100")
     assert resp.status_code == 200
@@ -154,6 +154,16 @@ def test_get_political_signal(client, mock_db):
     assert data["signal"]["dominant_narrative"] == "crypto_regulation/sec"
 
 
+def test_get_political_signal_cached(client, mock_db):
+    """The latest signal payload is served from cache within its TTL."""
+    setup_scalar_one_or_none(mock_db, make_political_signal_row())
+
+    first = client.get("/api/political/signal").json()
+    second = client.get("/api/political/signal").json()
+    assert first == second
+    assert mock_db.execute.call_count == 1
+
+
 def test_get_political_signal_none(client, mock_db):
     """Returns null when no signal computed."""
     setup_scalar_one_or_none(mock_db, None)
@@ -168,7 +178,7 @@ def test_get_political_signal_none(client, mock_db):
 def test_get_signal_history(client, mock_db):
     """GET /api/political/signal/history returns history with 'data' key."""
     rows = [make_political_signal_row(), make_political_signal_row()]
-    setup_scalars_all(mock_db, rows)
+    setup_rows_all(mock_db, rows)
 
     resp = client.get("/api/political/signal/history?limit=50")
     assert resp.status_code == 200
@@ -179,7 +189,7 @@ def test_get_signal_history(client, mock_db):
 
 def test_get_signal_history_empty(client, mock_db):
     """Returns empty list when no signal history."""
-    setup_scalars_all(mock_db, [])
+    setup_rows_all(mock_db, [])
 
     resp = client.get("/api/political/signal/history")
     assert resp.status_code == 200
@@ -1,12 +1,12 @@
 """Tests for the price data endpoints."""
 
-from tests.conftest import make_price_row, setup_scalars_all
+from tests.conftest import make_price_row, setup_rows_all
 
 
 def test_get_prices_returns_candles(client, mock_db):
     """GET /api/prices/{symbol} returns formatted candle data."""
     rows = [make_price_row(), make_price_row()]
-    setup_scalars_all(mock_db, rows)
+    setup_rows_all(mock_db, rows)
 
     resp = client.get("/api/prices/BTC-USDT?timeframe=1h&limit=10")
     assert resp.status_code == 200
@@ -24,7 +24,7 @@ def test_get_prices_returns_candles(client, mock_db):
 
 def test_get_prices_symbol_normalization(client, mock_db):
     """Symbol with dashes is normalized to slashes and uppercased."""
-    setup_scalars_all(mock_db, [])
+    setup_rows_all(mock_db, [])
 
     resp = client.get("/api/prices/eth-usdt")
     assert resp.status_code == 200
@@ -33,7 +33,7 @@ def test_get_prices_symbol_normalization(client, mock_db):
 
 def test_get_prices_empty(client, mock_db):
     """Returns empty candles list when no data exists."""
-    setup_scalars_all(mock_db, [])
+    setup_rows_all(mock_db, [])
 
     resp = client.get("/api/prices/BTC-USDT")
     assert resp.status_code == 200
@@ -45,7 +45,7 @@ def test_get_prices_empty(client, mock_db):
 def test_get_price_history(client, mock_db):
     """GET /api/prices/{symbol}/history returns filtered data."""
     rows = [make_price_row()]
-    setup_scalars_all(mock_db, rows)
+    setup_rows_all(mock_db, rows)
 
     resp = client.get("/api/prices/BTC-USDT/history?timeframe=1d")
     assert resp.status_code == 200
@@ -57,7 +57,7 @@ def test_get_price_history(client, mock_db):
 
 def test_get_price_history_with_date_range(client, mock_db):
     """History endpoint accepts start and end query params."""
-    setup_scalars_all(mock_db, [])
+    setup_rows_all(mock_db, [])
 
     resp = client.get(
         "/api/prices/BTC-USDT/history?start=2025-01-01T00:00:00&end=2025-12-31T23:59:59"
@@ -1,6 +1,6 @@
 """Tests for the sentiment data endpoints."""
 
-from tests.conftest import make_sentiment_row, setup_scalar_one_or_none, setup_scalars_all
+from tests.conftest import make_sentiment_row, setup_rows_all, setup_scalar_one_or_none
 
 
 def test_get_latest_sentiment(client, mock_db):
@@ -31,7 +31,7 @@ def test_get_latest_sentiment_none(client, mock_db):
 def test_get_sentiment_history(client, mock_db):
     """GET /api/sentiment/{symbol}/history returns list."""
     rows = [make_sentiment_row(), make_sentiment_row(fear_greed_index=25)]
-    setup_scalars_all(mock_db, rows)
+    setup_rows_all(mock_db, rows)
 
     resp = client.get("/api/sentiment/BTCUSDT/history?limit=50")
     assert resp.status_code == 200
@@ -43,7 +43,7 @@ def test_get_sentiment_history(client, mock_db):
 
 def test_get_sentiment_history_empty(client, mock_db):
     """Returns empty list when no history."""
-    setup_scalars_all(mock_db, [])
+    setup_rows_all(mock_db, [])
 
     resp = client.get("/api/sentiment/BTCUSDT/history")
     assert resp.status_code == 200
@@ -134,3 +134,117 @@ class TestConfluenceComposite:
         result = self.engine.compute_composite(scores, weights)
         # ta, onchain, celestial, numerology are all > 0.2 (bullish)
         assert result["alignment_count"] >= 3
+
+
+class TestTTLCache:
+    """Tests for the shared in-process TTL cache."""
+
+    def test_entries_expire(self):
+        import time
+        from unittest.mock import patch
+
+        from app.utils import TTLCache
+
+        cache = TTLCache(10)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=1)
+        assert cache.get("a") == 1
+        with patch("app.utils.time.monotonic", return_value=time.monotonic() + 5):
+            assert cache.get("a") == 1
+            assert cache.get("b") is None
+        assert len(cache) == 1
+
+    def test_maxsize_evicts_oldest_and_clear(self):
+        from app.utils import TTLCache
+
+        cache = TTLCache(10, maxsize=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+        assert cache.get("a") is None
+        assert cache.get("c") == "c"
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestSettings:
+    """Tests for the cached settings accessor."""
+
+    def test_get_settings_is_cached(self):
+        from app.config import get_settings
+
+        assert get_settings() is get_settings()
+
+    def test_module_settings_is_cached_instance(self):
+        import app.config
+        from app.config import get_settings, settings
+
+        assert settings is get_settings()
+        assert app.config.settings is settings
+
+    def test_rejects_non_hmac_jwt_algorithm(self, monkeypatch):
+        import pytest
+        from pydantic import ValidationError
+
+        from app.config import Settings
+
+        monkeypatch.setenv("JWT_ALGORITHM", "RS256")
+        with pytest.raises(ValidationError):
+            Settings()
+
+    def test_rejects_out_of_range_jwt_expiry(self, monkeypatch):
+        import pytest
+        from pydantic import ValidationError
+
+        from app.config import Settings
+
+        monkeypatch.setenv("JWT_EXPIRY_HOURS", "0")
+        with pytest.raises(ValidationError):
+            Settings()
+
+
+class TestAsyncCommit:
+    """Tests for the bulk-job synchronous_commit / statement_timeout overrides."""
+
+    def test_bulk_sessions_set_local_per_transaction(self):
+        from unittest.mock import MagicMock, call
+
+        from sqlalchemy import event
+
+        from app.database import BulkSessionLocal, _bulk_settings
+
+        assert event.contains(BulkSessionLocal, "after_begin", _bulk_settings)
+
+        conn = MagicMock()
+        _bulk_settings(None, None, conn)
+        assert conn.exec_driver_sql.call_args_list == [
+            call("SET LOCAL synchronous_commit = off"),
+            call("SET LOCAL statement_timeout = 0"),
+        ]
+
+
+class TestCandleUpsert:
+    """Tests for the price_data ingest statement."""
+
+    def test_upsert_candles_executemany(self):
+        from unittest.mock import MagicMock
+
+        from app.services.data_ingest import _CANDLE_UPSERT, upsert_candles
+
+        db = MagicMock()
+        candles = [[1704067200000, 1, 2, 0.5, 1.5, 10], [1704070800000, 1.5, 2, 1, 1.8, 12]]
+
+        assert upsert_candles(db, candles, "BTC/USDT", "kraken", "1h") == 2
+
+        stmt, rows = db.execute.call_args.args
+        assert stmt is _CANDLE_UPSERT
+        assert [r["close"] for r in rows] == [1.5, 1.8]
+        db.commit.assert_called_once()
+
+    def test_candle_upsert_sql(self):
+        from sqlalchemy.dialects import postgresql
+
+        from app.services.data_ingest import _CANDLE_UPSERT
+
+        sql = str(_CANDLE_UPSERT.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (timestamp, symbol, exchange, timeframe) DO UPDATE" in sql
+        assert "close = excluded.close" in sql
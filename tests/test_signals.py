@@ -1,6 +1,6 @@
 """Tests for the TA signals endpoints."""
 
-from tests.conftest import make_ta_row, setup_scalar_one_or_none, setup_scalars_all
+from tests.conftest import make_ta_row, setup_rows_all, setup_scalar_one_or_none
 
 
 def test_get_ta_indicators(client, mock_db):
@@ -31,7 +31,7 @@ def test_get_ta_indicators_none(client, mock_db):
 def test_get_ta_history(client, mock_db):
     """GET /api/signals/ta/{symbol}/history returns list."""
     rows = [make_ta_row(), make_ta_row()]
-    setup_scalars_all(mock_db, rows)
+    setup_rows_all(mock_db, rows)
 
     resp = client.get("/api/signals/ta/BTC-USDT/history?timeframe=1d&limit=50")
     assert resp.status_code == 200
@@ -43,7 +43,7 @@ def test_get_ta_history(client, mock_db):
 
 def test_get_ta_history_empty(client, mock_db):
     """Returns empty list when no history available."""
-    setup_scalars_all(mock_db, [])
+    setup_rows_all(mock_db, [])
 
     resp = client.get("/api/signals/ta/BTC-USDT/history")
     assert resp.status_code == 200
@@ -0,0 +1,71 @@
+"""Tests for the SPA static-file fallback app."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.spa import ImmutableStaticFiles, SPAFiles
+
+
+@pytest.fixture()
+def spa_client(tmp_path):
+    """App with one API route and the SPA mounted at / over a fake build."""
+    (tmp_path / "index.html").write_text("<html>spa</html>")
+    (tmp_path / "favicon.ico").write_bytes(b"icon")
+    (tmp_path / "img").mkdir()
+    (tmp_path / "img" / "logo.svg").write_text("<svg/>")
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "index-abc123.js").write_text("js")
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    def ping():
+        return {"ok": True}
+
+    app.mount("/assets", ImmutableStaticFiles(directory=str(tmp_path / "assets")))
+    app.mount("/", SPAFiles(tmp_path))
+    return TestClient(app)
+
+
+def test_api_routes_take_precedence(spa_client):
+    assert spa_client.get("/api/ping").json() == {"ok": True}
+
+
+def test_serves_real_files(spa_client):
+    resp = spa_client.get("/favicon.ico")
+    assert resp.status_code == 200
+    assert resp.content == b"icon"
+
+
+def test_serves_nested_files(spa_client):
+    assert spa_client.get("/img/logo.svg").text == "<svg/>"
+
+
+def test_does_not_serve_outside_build(spa_client, tmp_path):
+    (tmp_path.parent / "secret.txt").write_text("secret")
+    resp = spa_client.get("/../secret.txt")
+    assert "secret" not in resp.text
+
+
+def test_client_routes_fall_back_to_index(spa_client):
+    resp = spa_client.get("/dashboard/xrp")
+    assert resp.status_code == 200
+    assert resp.text == "<html>spa</html>"
+    assert resp.headers["cache-control"] == "no-cache"
+    assert resp.headers["etag"]
+
+
+def test_index_revalidates_with_etag(spa_client):
+    etag = spa_client.get("/").headers["etag"]
+    resp = spa_client.get("/anything", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+
+
+def test_rejects_non_get(spa_client):
+    assert spa_client.post("/dashboard").status_code == 405
+
+
+def test_assets_are_cached_as_immutable(spa_client):
+    resp = spa_client.get("/assets/index-abc123.js")
+    assert resp.status_code == 200
+    assert resp.headers["cache-control"] == "public, max-age=31536000, immutable"
@@ -0,0 +1,54 @@
+"""Tests for the XAI endpoints."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from tests.conftest import setup_scalar_one_or_none
+
+
+def _composite_row():
+    row = MagicMock()
+    row.timestamp = datetime(2026, 1, 15, tzinfo=timezone.utc)
+    row.xai_score = Decimal("0.4200")
+    row.active_partnership_count = 12
+    row.partnerships_in_production = 4
+    row.adoption_phase = "early_adoption"
+    row.weights = {"policy": 0.3}
+    return row
+
+
+def test_get_xai_score_cached(client, mock_db):
+    """The latest composite is served from cache within its TTL."""
+    setup_scalar_one_or_none(mock_db, _composite_row())
+
+    first = client.get("/api/xai/score").json()
+    second = client.get("/api/xai/score").json()
+    assert first == second
+    assert first["xai_score"] == "0.4200"
+    assert mock_db.execute.call_count == 1
+
+
+def test_get_xai_score_no_data_not_cached(client, mock_db):
+    """'No data yet' is re-checked on every request."""
+    setup_scalar_one_or_none(mock_db, None)
+
+    assert client.get("/api/xai/score").json() == {"status": "no_data"}
+    client.get("/api/xai/score")
+    assert mock_db.execute.call_count == 2
+
+
+def test_recompute_clears_latest_cache(client, mock_db):
+    """A manual recompute drops the cached latest-row payloads."""
+    setup_scalar_one_or_none(mock_db, _composite_row())
+    client.get("/api/xai/score")
+
+    with patch("app.services.xrpl_fetch.fetch_and_store", return_value={}), \
+         patch("app.services.xai_policy_fetch.fetch_and_classify", return_value={}), \
+         patch("app.services.xai_personnel_fetch.fetch_and_classify", return_value={}), \
+         patch("app.services.xai_signal_service.compute_xai_composite", side_effect=RuntimeError):
+        client.post("/api/xai/recompute")
+
+    calls = mock_db.execute.call_count
+    client.get("/api/xai/score")
+    assert mock_db.execute.call_count == calls + 1